@@ -1,63 +1,205 @@
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.typing import ConfigType
+"""Netflame pellet stove integration.
+
+Only constants are imported with the package. The HTTP clients, the
+coordinator and Home Assistant helpers are imported when the first entry
+is set up, so loading the integration stays cheap.
+"""
+from __future__ import annotations
 
-from .const import DOMAIN, BASE_URL
-from .api import NetflameApi
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 import logging
-from datetime import timedelta
+import time
+from typing import TYPE_CHECKING
 
-_LOGGER = logging.getLogger(__name__)
+from .const import (
+    DOMAIN,
+    BASE_URL,
+    CONF_ALARM_INTERVAL,
+    CONF_COMMAND_WINDOW,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEBUG_CAPTURE,
+    CONF_FAST_INTERVAL,
+    CONF_NORMAL_INTERVAL,
+    CONF_POOL_SIZE,
+    CONF_READ_TIMEOUT,
+    CONF_RETRIES,
+    CONF_SLOW_INTERVAL,
+    CONF_UPDATE_MODE,
+    DEFAULT_ALARM_INTERVAL,
+    DEFAULT_COMMAND_WINDOW,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DEBUG_CAPTURE,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_NORMAL_INTERVAL,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_SLOW_INTERVAL,
+    DEFAULT_UPDATE_MODE,
+    STORAGE_VERSION,
+    UPDATE_MODE_CHANGES,
+)
+
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigEntry
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.storage import Store
+    from homeassistant.helpers.typing import ConfigType
+
+    from .hub import NetflameHub
 
-SCAN_INTERVAL = timedelta(seconds=60)
+_LOGGER = logging.getLogger(__name__)
 
 async def async_setup(hass: HomeAssistant, config: ConfigType):
+    from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+
+    from .services import async_register_services
+    from .views import NetflameIconView
+
     hass.data.setdefault(DOMAIN, {})
+    hass.http.register_view(NetflameIconView())
+    async_register_services(hass)
+
+    async def async_close_hubs(event) -> None:
+        # Hubs own their pooled sessions, which entry unloads alone don't
+        # close when Home Assistant stops
+        for hub in list(hass.data[DOMAIN].get("hubs", {}).values()):
+            await hub.async_close()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, async_close_hubs)
     return True
 
 
+def _get_store(hass: HomeAssistant, entry: ConfigEntry) -> Store:
+    """Return the store holding the last known snapshot of `entry`."""
+    from homeassistant.helpers.storage import Store
+
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry.entry_id}")
+
+
+def _get_hub(hass: HomeAssistant, base_url: str, pool_size: int) -> NetflameHub:
+    """Return the hub for `base_url`, creating it on first use.
+
+    The hub's pooled, keep-alive session is sized by the entry that creates it.
+    """
+    from .hub import NetflameHub
+
+    hubs = hass.data[DOMAIN].setdefault("hubs", {})
+    hub = hubs.get(base_url)
+    if hub is None:
+        hub = hubs[base_url] = NetflameHub(base_url, pool_size=pool_size)
+    return hub
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Set up Netflame from a config entry."""
+    from .api import RetryPolicy
+    from .commands import CommandQueue
+    from .coordinator import NetflameCoordinator
+    from .polling import AdaptivePollPolicy, AlarmSchedule, StatusWatch
+    from .trace import ResponseTrace
+
     hass.data.setdefault(DOMAIN, {})
     username = entry.data["serial"]
     password = entry.data["password"]
     base_url = entry.data.get("url", BASE_URL)
 
-    api = NetflameApi(username, password, base_url=base_url)
+    options = entry.options
+    trace = None
+    if options.get(CONF_DEBUG_CAPTURE, DEFAULT_DEBUG_CAPTURE):
+        trace = ResponseTrace()
 
-    async def _update():
-        # All blocking calls run in executor
-        status = await hass.async_add_executor_job(api.get_status)
-        alarms = await hass.async_add_executor_job(api.get_alarms)
-        # Merge alarms into status dict
-        status["alarms"] = alarms
-        return status
+    hub = _get_hub(hass, base_url, options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE))
+    api = hub.create_api(
+        username,
+        password,
+        trace=trace,
+        connect_timeout=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+        read_timeout=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+        retry=RetryPolicy(retries=options.get(CONF_RETRIES, DEFAULT_RETRIES)),
+    )
 
-    coordinator = DataUpdateCoordinator(
+    policy = AdaptivePollPolicy(
+        fast=options.get(CONF_FAST_INTERVAL, DEFAULT_FAST_INTERVAL),
+        normal=options.get(CONF_NORMAL_INTERVAL, DEFAULT_NORMAL_INTERVAL),
+        slow=options.get(CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL),
+    )
+    alarm_interval = options.get(CONF_ALARM_INTERVAL, DEFAULT_ALARM_INTERVAL)
+    watch = None
+    if options.get(CONF_UPDATE_MODE, DEFAULT_UPDATE_MODE) == UPDATE_MODE_CHANGES:
+        watch = StatusWatch(interval=policy.fast, alarms_every=alarm_interval)
+    commands = CommandQueue(
+        window=options.get(CONF_COMMAND_WINDOW, DEFAULT_COMMAND_WINDOW),
+    )
+    coordinator = NetflameCoordinator(
         hass,
-        _LOGGER,
+        hub,
+        api,
         name=f"netflame_{entry.entry_id}",
-        update_method=_update,
-        update_interval=SCAN_INTERVAL,
+        policy=policy,
+        commands=commands,
+        store=_get_store(hass, entry),
+        watch=watch,
+        alarms=AlarmSchedule(every=alarm_interval),
     )
 
-    # Refresh once on setup (this will run API calls in executor)
-    await coordinator.async_config_entry_first_refresh()
+    hub.register(username, coordinator)
+
+    # Start from the last known snapshot when there is one; otherwise
+    # entities need a live refresh before they can be created
+    started = time.monotonic()
+    cached = await coordinator.async_load_cached()
+    if not cached:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            await _async_release_hub(hass, hub, username)
+            raise
 
     hass.data[DOMAIN][entry.entry_id] = {
         "api": api,
         "coordinator": coordinator,
+        "hub": hub,
     }
 
     # Forward setups for platforms
     await hass.config_entries.async_forward_entry_setups(entry, ["climate", "sensor"])
 
+    if cached:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"netflame {username} first refresh"
+        )
+    _LOGGER.debug(
+        "Netflame %s set up in %.3f s from %s",
+        username,
+        time.monotonic() - started,
+        "the cached snapshot" if cached else "a live refresh",
+    )
+
+    # Reload to apply changed options
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry):
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def _async_release_hub(hass: HomeAssistant, hub: NetflameHub, serial: str):
+    """Unsubscribe `serial` and drop the hub once no stove uses it."""
+    if hub.unregister(serial):
+        hass.data[DOMAIN]["hubs"].pop(hub.base_url, None)
+        await hub.async_close()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry):
     unload_ok = await hass.config_entries.async_unload_platforms(entry, ["climate", "sensor"])
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await _async_release_hub(hass, data["hub"], entry.data["serial"])
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry):
+    """Delete the cached snapshot of a removed stove."""
+    await _get_store(hass, entry).async_remove()
@@ -1,109 +1,640 @@
-import requests
+from __future__ import annotations
+
+import aiohttp
+import asyncio
+import base64
+import hashlib
+import random
 import logging
+import re
+import sys
+import time
+from typing import TYPE_CHECKING, Any
 
 from .const import (
     BASE_URL,
+    BATCH_FIELD,
+    BATCH_HEADER,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
     OP_ONOFF,
     OP_STATUS,
     OP_POWER,
     OP_ALARMS,
+    OP_BATCH,
+    RETRY_BACKOFF,
+    RETRY_BACKOFF_MAX,
 )
+from .breaker import CircuitBreaker, NetflameCircuitOpenError
+from .metrics import RequestMetrics
+from .parser import StatusRecord, alarms_problem, parse_alarms, parse_status, status_problem
+from .trace import ResponseTrace
+
+if TYPE_CHECKING:
+    import requests
 
 _LOGGER = logging.getLogger(__name__)
 
+# aiohttp >= 3.10 reports connect timeouts separately from read timeouts
+_AIOHTTP_CONNECT_ERRORS = (aiohttp.ClientConnectorError,) + (
+    (aiohttp.ConnectionTimeoutError,) if hasattr(aiohttp, "ConnectionTimeoutError") else ()
+)
+
+
+class RetryPolicy:
+    """Exponential backoff with jitter.
+
+    Reads (status, alarms) are idempotent and retried on timeouts,
+    connection errors and HTTP 5xx. Commands (on/off, power) are only
+    retried when the connection could not be established, i.e. when the
+    request never reached the server.
+    """
+
+    def __init__(
+        self,
+        retries: int = DEFAULT_RETRIES,
+        backoff: float = RETRY_BACKOFF,
+        max_backoff: float = RETRY_BACKOFF_MAX,
+    ):
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+    def delay(self, attempt: int) -> float:
+        """Return the pause before retry number `attempt` (0-based)."""
+        cap = min(self.max_backoff, self.backoff * (2 ** attempt))
+        # Equal jitter: at least half the backoff, spread over the rest
+        return cap / 2 + random.uniform(0, cap / 2)
+
+    @staticmethod
+    def should_retry(err: Exception, idempotent: bool) -> bool:
+        """Return whether `err` may be retried for a request."""
+        # Only NetflameApi imports requests; without it no requests error exists
+        requests = sys.modules.get("requests")
+        if isinstance(err, _AIOHTTP_CONNECT_ERRORS) or (
+            requests is not None and isinstance(err, requests.exceptions.ConnectTimeout)
+        ):
+            return True
+        if not idempotent:
+            return False
+        if isinstance(err, aiohttp.ClientResponseError):
+            return err.status >= 500
+        if isinstance(err, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            return True
+        if requests is None:
+            return False
+        if isinstance(err, requests.exceptions.HTTPError):
+            return err.response is not None and err.response.status_code >= 500
+        return isinstance(err, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+class ConnectionStats:
+    """Counts new and reused connections of an aiohttp session."""
+
+    def __init__(self):
+        self.created = 0
+        self.reused = 0
+
+    def trace_config(self) -> aiohttp.TraceConfig:
+        """Return a trace config feeding these counters."""
+        config = aiohttp.TraceConfig()
+        config.on_connection_create_end.append(self._on_create)
+        config.on_connection_reuseconn.append(self._on_reuse)
+        return config
+
+    async def _on_create(self, session, ctx, params):
+        self.created += 1
+
+    async def _on_reuse(self, session, ctx, params):
+        self.reused += 1
+
+
+class BatchSupport:
+    """Whether a server accepts batched operations.
+
+    `supported` is None until a batch probe found out. The hub hands one
+    instance to every client of a base URL, so the server is probed once
+    for all its stoves.
+    """
+
+    __slots__ = ("supported",)
+
+    def __init__(self, supported: bool | None = None):
+        self.supported = supported
+
+
+def status_fingerprint(body: str) -> str:
+    """Return a short digest identifying a status response body."""
+    return hashlib.blake2s(body.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def _record_failure(breaker: CircuitBreaker, err: Exception) -> None:
+    # Only transient errors count against the endpoint; anything else
+    # (e.g. a 401) means the server answered. The breaker logs outages, so
+    # a failed request is only logged in full at debug level.
+    if RetryPolicy.should_retry(err, idempotent=True):
+        breaker.record_failure()
+    else:
+        breaker.record_success()
+    _LOGGER.debug("Netflame POST error: %s", err, exc_info=True)
+
+
+# Operations that only read state: a batch made of them is retried like a read
+_READ_OPERATIONS = frozenset({OP_STATUS, OP_ALARMS})
+_BATCH_SECTION = re.compile(r"^\[(\w+)\]\n", re.MULTILINE)
+
+
+def _batch_payload(operations: list[dict]) -> dict:
+    """Merge the payloads of `operations` into one batched request."""
+    codes = [op["idOperacion"] for op in operations]
+    if len(set(codes)) != len(codes):
+        raise ValueError("Operations in a batch must be distinct")
+    payload = {BATCH_FIELD: ",".join(codes)}
+    for op in operations:
+        payload.update((key, value) for key, value in op.items() if key != "idOperacion")
+    return payload
+
+
+def split_batch(text: str, codes: list[str]) -> dict[str, str]:
+    """Split a batched response into the body of each operation in `codes`."""
+    parts = _BATCH_SECTION.split(text)
+    sections = dict(zip(parts[1::2], parts[2::2]))
+    missing = [code for code in codes if code not in sections]
+    if missing:
+        raise ValueError(f"Batch response lacks operations {', '.join(missing)}")
+    return {code: sections[code] for code in codes}
+
+
+def _parse_status(trace: ResponseTrace | None, raw: str) -> StatusRecord:
+    record = parse_status(raw)
+    if trace is not None:
+        problem = status_problem(raw)
+        if problem is not None:
+            trace.record_parse_failure(OP_STATUS, raw, problem)
+    return record
+
+
+def _parse_alarms(trace: ResponseTrace | None, raw: str) -> str | None:
+    alarms = parse_alarms(raw)
+    if trace is not None and alarms is None:
+        trace.record_parse_failure(OP_ALARMS, raw, alarms_problem(raw))
+    return alarms
+
+
+def _power_payload(level: int) -> dict:
+    if level < 1 or level > 9:
+        raise ValueError("Power level must be 1..9")
+    return {
+        "idOperacion": OP_POWER,
+        "potencia": str(level)
+    }
+
+
 class NetflameApi:
-    def __init__(self, username: str, password: str, session: requests.Session = None, base_url: str = None):
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: requests.Session = None,
+        base_url: str = None,
+        trace: ResponseTrace = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retry: RetryPolicy = None,
+        breaker: CircuitBreaker = None,
+        metrics: RequestMetrics = None,
+        batch_support: BatchSupport = None,
+    ):
+        # Imported here so the integration, which only uses AsyncNetflameApi,
+        # never loads requests
+        import requests
+        from requests.adapters import HTTPAdapter
+
         self.username = username
         self.password = password
-        self.session = session or requests.Session()
+        if session is None:
+            session = requests.Session()
+            # Pooled keep-alive connections; retries are handled in _post
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+        self.session = session
         # Keep verify False by default because many Netflame endpoints have old certs;
         # administrators should change to True and provide certs if possible.
         self.session.verify = False
         # Allow per-instance base URL (configurable from integration)
         self.base_url = base_url or BASE_URL
+        # Raw responses are only kept when debug capture is enabled
+        self.trace = trace
+        self.timeout = (connect_timeout, read_timeout)
+        self.retry = retry or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker(self.base_url)
+        self.metrics = metrics or RequestMetrics()
+        self.requests = 0
+        self.retries = 0
+        self.batch_support = batch_support or BatchSupport()
 
-    def _post(self, data: dict) -> str:
-        try:
-            r = self.session.post(
-                self.base_url,
-                auth=(self.username, self.password),
-                data=data,
-                timeout=10
-            )
-            r.raise_for_status()
-            return r.text
-        except Exception as e:
-            _LOGGER.exception("Netflame POST error: %s", e)
-            raise
+    @property
+    def batching(self) -> bool | None:
+        """Return whether the server accepts batched operations, None until known."""
+        return self.batch_support.supported
+
+    @batching.setter
+    def batching(self, value: bool | None) -> None:
+        self.batch_support.supported = value
+
+    def _post(self, data: dict, idempotent: bool = True, timeout: tuple | None = None) -> str:
+        text, _ = self._request(data, idempotent, timeout)
+        return text
+
+    def _request(
+        self, data: dict, idempotent: bool = True, timeout: tuple | None = None, probe: bool = False
+    ) -> tuple[str, Any]:
+        """POST `data`; return the body and the response headers.
+
+        A `probe` is not retried and its failure doesn't count against the
+        circuit breaker: the server may just not understand it.
+        """
+        self.breaker.before_request()
+        operation = data.get("idOperacion", OP_BATCH)
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                self.requests += 1
+                r = self.session.post(
+                    self.base_url,
+                    auth=(self.username, self.password),
+                    data=data,
+                    timeout=timeout or self.timeout
+                )
+                r.raise_for_status()
+                text = r.text
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                self.metrics.observe_error(operation, elapsed, e)
+                if self.trace is not None:
+                    self.trace.record(operation, None, data, elapsed, error=e, attempt=attempt)
+                if probe:
+                    raise
+                if attempt < self.retry.retries and self.retry.should_retry(e, idempotent):
+                    delay = self.retry.delay(attempt)
+                    attempt += 1
+                    self.retries += 1
+                    _LOGGER.debug("Netflame POST error: %s, retry %s in %.1f s", e, attempt, delay)
+                    time.sleep(delay)
+                    continue
+                _record_failure(self.breaker, e)
+                raise
+            elapsed = time.perf_counter() - start
+            self.metrics.observe(operation, elapsed, len(text))
+            self.breaker.record_success()
+            if self.trace is not None:
+                self.trace.record(operation, text, data, elapsed, r.status_code, attempt=attempt)
+            return text, r.headers
+
+    def _remaining(self, end: float) -> tuple[float, float]:
+        import requests
+
+        remaining = end - time.monotonic()
+        if remaining <= 0:
+            raise requests.exceptions.Timeout("Netflame batch deadline exceeded")
+        return min(self.timeout[0], remaining), min(self.timeout[1], remaining)
+
+    def batch(
+        self, operations: list[dict], deadline: float | None = None, return_exceptions: bool = False
+    ) -> dict[str, Any]:
+        """Run `operations` (request payloads) and return their bodies by code.
+
+        Servers that accept batches get a single POST. Against the others
+        (found out on the first batch, whose probe failing for any reason
+        means no support, and remembered in `batch_support`) the operations
+        are sent back to back over the session's kept-alive connection. Either
+        way every request must finish within `deadline` seconds of the call,
+        by default the connect plus read timeout of a single request. With
+        `return_exceptions`, an operation that failed maps to its exception
+        instead of failing the operations after it.
+        """
+        payload = _batch_payload(operations)
+        codes = [op["idOperacion"] for op in operations]
+        end = time.monotonic() + (deadline if deadline is not None else sum(self.timeout))
+        if self.batching is not False and len(operations) > 1:
+            idempotent = all(code in _READ_OPERATIONS for code in codes)
+            if self.batching:
+                text, headers = self._request(payload, idempotent, self._remaining(end))
+            else:
+                timeout = self._remaining(end)
+                try:
+                    text, headers = self._request(payload, idempotent, timeout, probe=True)
+                except NetflameCircuitOpenError:
+                    raise
+                except Exception as err:
+                    # Whatever the reason, a server rejecting the probe is
+                    # treated as one without batch support
+                    _LOGGER.debug("Batch probe to %s failed: %s", self.base_url, err)
+                    headers = {}
+            if headers.get(BATCH_HEADER):
+                self.batching = True
+                return split_batch(text, codes)
+            self.batching = False
+            _LOGGER.debug("%s does not accept batches, sending operations one by one", self.base_url)
+
+        results = {}
+        for op, code in zip(operations, codes):
+            try:
+                results[code] = self._post(op, code in _READ_OPERATIONS, self._remaining(end))
+            except Exception as err:
+                if not return_exceptions:
+                    raise
+                results[code] = err
+        return results
+
+    @property
+    def stats(self) -> dict:
+        """Return request, retry and connection reuse counters."""
+        reused = 0
+        # The same adapter is mounted for http:// and https://
+        adapters = {id(a): a for a in getattr(self.session, "adapters", {}).values()}
+        for adapter in adapters.values():
+            pools = getattr(getattr(adapter, "poolmanager", None), "pools", None)
+            if pools is None:
+                continue
+            for key in pools.keys():
+                pool = pools[key]
+                reused += pool.num_requests - pool.num_connections
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "connections_reused": reused,
+        }
 
     # Turn on/off
     def turn_on(self):
-        return self._post({"idOperacion": OP_ONOFF, "on_off": "1"})
+        return self._post({"idOperacion": OP_ONOFF, "on_off": "1"}, idempotent=False)
 
     def turn_off(self):
-        return self._post({"idOperacion": OP_ONOFF, "on_off": "0"})
+        return self._post({"idOperacion": OP_ONOFF, "on_off": "0"}, idempotent=False)
 
     # Read status (state, temperature, power)
-    def get_status(self) -> dict:
-        raw = self._post({"idOperacion": OP_STATUS})
+    def get_status(self) -> StatusRecord:
+        return _parse_status(self.trace, self._post({"idOperacion": OP_STATUS}))
 
-        status = None
-        temperature = None
-        power = None
+    # Set power level
+    def set_power(self, level: int):
+        return self._post(_power_payload(level), idempotent=False)
 
-        for line in raw.split("\n"):
-            if line.startswith("estado="):
-                try:
-                    status = int(line.replace("estado=", "").strip())
-                except Exception:
-                    status = None
-            if line.startswith("temperatura="):
-                try:
-                    temperature = float(line.replace("temperatura=", "").strip())
-                except Exception:
-                    temperature = None
-            if line.startswith("consigna_potencia=") or line.startswith("consigna_pot="):
-                try:
-                    power = int(line.split("=")[1].strip())
-                except Exception:
-                    power = None
+    # Get alarms
+    def get_alarms(self):
+        return _parse_alarms(self.trace, self._post({"idOperacion": OP_ALARMS}))
+
+
+class AsyncNetflameApi:
+    """Asyncio counterpart of `NetflameApi` built on an aiohttp session.
+
+    The session is owned by the caller (the hub's session in the
+    integration) so connections are pooled and kept alive across requests
+    instead of being re-established on every poll.
+    """
 
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        session: aiohttp.ClientSession,
+        base_url: str = None,
+        trace: ResponseTrace = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retry: RetryPolicy = None,
+        breaker: CircuitBreaker = None,
+        metrics: RequestMetrics = None,
+        batch_support: BatchSupport = None,
+    ):
+        self.username = username
+        self.password = password
+        self.session = session
+        self.base_url = base_url or BASE_URL
+        # Pre-encoded basic auth header, computed once per client
+        credentials = f"{username}:{password}".encode("latin-1")
+        self._headers = {"Authorization": "Basic " + base64.b64encode(credentials).decode("ascii")}
+        self._timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=connect_timeout, sock_read=read_timeout
+        )
+        self.trace = trace
+        self.retry = retry or RetryPolicy()
+        # Shared by all clients of the hub so one outage opens it for all
+        self.breaker = breaker or CircuitBreaker(self.base_url)
+        self.metrics = metrics or RequestMetrics()
+        self.requests = 0
+        self.retries = 0
+        self._deadline = connect_timeout + read_timeout
+        self.batch_support = batch_support or BatchSupport()
+
+    @property
+    def batching(self) -> bool | None:
+        """Return whether the server accepts batched operations, None until known."""
+        return self.batch_support.supported
+
+    @batching.setter
+    def batching(self, value: bool | None) -> None:
+        self.batch_support.supported = value
+
+    async def _post(self, data: dict, idempotent: bool = True) -> str:
+        text, _ = await self._request(data, idempotent)
+        return text
+
+    async def _request(
+        self,
+        data: dict,
+        idempotent: bool = True,
+        if_none_match: str | None = None,
+        probe: bool = False,
+    ) -> tuple[str | None, Any]:
+        """POST `data`; return the body (None on 304 Not Modified) and the headers.
+
+        A `probe` is not retried and its failure doesn't count against the
+        circuit breaker: the server may just not understand it.
+        """
+        self.breaker.before_request()
+        operation = data.get("idOperacion", OP_BATCH)
+        headers = self._headers
+        if if_none_match is not None:
+            headers = {**headers, "If-None-Match": if_none_match}
+        attempt = 0
+        while True:
+            start = time.perf_counter()
+            try:
+                self.requests += 1
+                async with self.session.post(
+                    self.base_url,
+                    headers=headers,
+                    data=data,
+                    timeout=self._timeout,
+                    # Same rationale as NetflameApi.session.verify
+                    ssl=False,
+                ) as r:
+                    r.raise_for_status()
+                    status = r.status
+                    response_headers = r.headers
+                    text = None if status == 304 else await r.text()
+            except Exception as e:
+                elapsed = time.perf_counter() - start
+                self.metrics.observe_error(operation, elapsed, e)
+                if self.trace is not None:
+                    self.trace.record(operation, None, data, elapsed, error=e, attempt=attempt)
+                if probe:
+                    raise
+                if attempt < self.retry.retries and self.retry.should_retry(e, idempotent):
+                    delay = self.retry.delay(attempt)
+                    attempt += 1
+                    self.retries += 1
+                    _LOGGER.debug("Netflame POST error: %s, retry %s in %.1f s", e, attempt, delay)
+                    await asyncio.sleep(delay)
+                    continue
+                _record_failure(self.breaker, e)
+                raise
+            elapsed = time.perf_counter() - start
+            self.metrics.observe(operation, elapsed, len(text or ""))
+            self.breaker.record_success()
+            if self.trace is not None:
+                self.trace.record(operation, text, data, elapsed, status, attempt=attempt)
+            return text, response_headers
+
+    @property
+    def stats(self) -> dict:
+        """Return request and retry counters."""
         return {
-            "raw": raw,
-            "status": status,
-            "temperature": temperature,
-            "power": power
+            "requests": self.requests,
+            "retries": self.retries,
         }
 
+    # Turn on/off
+    async def turn_on(self):
+        return await self._post({"idOperacion": OP_ONOFF, "on_off": "1"}, idempotent=False)
+
+    async def turn_off(self):
+        return await self._post({"idOperacion": OP_ONOFF, "on_off": "0"}, idempotent=False)
+
+    # Read status (state, temperature, power)
+    async def get_status(self) -> StatusRecord:
+        return _parse_status(self.trace, await self._post({"idOperacion": OP_STATUS}))
+
+    async def get_status_if_changed(
+        self, fingerprint: str | None = None
+    ) -> tuple[str, StatusRecord | None]:
+        """Read the status unless it still matches `fingerprint`.
+
+        `fingerprint` is sent as If-None-Match: servers supporting it answer
+        304 without a body. For the others the body is hashed and compared
+        here, which still skips parsing it. Returns the current fingerprint
+        (the server's ETag when it sends one) and the parsed status, or None
+        when the status is unchanged.
+        """
+        text, headers = await self._request({"idOperacion": OP_STATUS}, if_none_match=fingerprint)
+        if text is None:
+            return fingerprint, None
+        current = headers.get("ETag") or status_fingerprint(text)
+        if current == fingerprint:
+            return current, None
+        return current, _parse_status(self.trace, text)
+
     # Set power level
-    def set_power(self, level: int):
-        if level < 1 or level > 9:
-            raise ValueError("Power level must be 1..9")
-        return self._post({
-            "idOperacion": OP_POWER,
-            "potencia": str(level)
-        })
+    async def set_power(self, level: int):
+        return await self._post(_power_payload(level), idempotent=False)
 
     # Get alarms
-    def get_alarms(self):
-        raw = self._post({"idOperacion": OP_ALARMS})
+    async def get_alarms(self):
+        return _parse_alarms(self.trace, await self._post({"idOperacion": OP_ALARMS}))
 
-        # Split by lines
-        lines = [l.strip() for l in raw.split("\n") if l.strip()]
+    async def batch(
+        self, operations: list[dict], deadline: float | None = None, return_exceptions: bool = False
+    ) -> dict[str, Any]:
+        """Run `operations` (request payloads) and return their bodies by code.
 
-        # Reproduce eliminarErrores() from the original JavaScript
-        fixed_data = [l for l in lines if "error" not in l.lower()]
+        Servers that accept batches get a single POST. Against the others
+        (found out on the first batch, whose probe failing for any reason
+        means no support, and remembered in `batch_support`) the operations
+        are sent back to back over the session's kept-alive connection. Either
+        way the whole batch must finish within `deadline` seconds, by
+        default the connect plus read timeout of a single request. With
+        `return_exceptions`, an operation that failed maps to its exception
+        instead of failing the operations after it.
+        """
+        payload = _batch_payload(operations)
+        return await asyncio.wait_for(
+            self._batch(operations, payload, return_exceptions),
+            deadline if deadline is not None else self._deadline,
+        )
 
-        # We need at least two clean lines
-        if len(fixed_data) < 2:
-            return None
+    async def _batch(self, operations: list[dict], payload: dict, return_exceptions: bool) -> dict[str, Any]:
+        codes = [op["idOperacion"] for op in operations]
+        if self.batching is not False and len(operations) > 1:
+            idempotent = all(code in _READ_OPERATIONS for code in codes)
+            if self.batching:
+                text, headers = await self._request(payload, idempotent)
+            else:
+                try:
+                    text, headers = await self._request(payload, idempotent, probe=True)
+                except NetflameCircuitOpenError:
+                    raise
+                except Exception as err:
+                    # Whatever the reason, a server rejecting the probe is
+                    # treated as one without batch support
+                    _LOGGER.debug("Batch probe to %s failed: %s", self.base_url, err)
+                    headers = {}
+            if headers.get(BATCH_HEADER):
+                self.batching = True
+                return split_batch(text, codes)
+            self.batching = False
+            _LOGGER.debug("%s does not accept batches, sending operations one by one", self.base_url)
 
-        # datos_correctos[1] must be "0"
-        if fixed_data[1] != "0":
-            return None
+        results = {}
+        for op, code in zip(operations, codes):
+            try:
+                results[code] = await self._post(op, idempotent=code in _READ_OPERATIONS)
+            except Exception as err:
+                if not return_exceptions:
+                    raise
+                results[code] = err
+        return results
 
-        # Get value after "=" in the first correct line
-        if "=" in fixed_data[0]:
-            return fixed_data[0].split("=", 1)[1].strip()
+    async def get_snapshot(self, previous_alarms=None, include_alarms: bool = True) -> StatusRecord:
+        """Fetch status and alarms in one round trip and merge them.
 
-        return fixed_data[0].strip()
+        Both are read in one batch once a `batch` call found that the
+        server accepts batches, and concurrently otherwise: polls never
+        probe for batch support themselves. A failed status read fails the whole
+        snapshot. A failed alarms read is logged and `previous_alarms` is
+        carried forward so the status result is not lost. With
+        `include_alarms` False only the status is read and
+        `previous_alarms` is carried forward as is.
+        """
+        if not include_alarms:
+            status = await self.get_status()
+            status.alarms = previous_alarms
+            return status
+        if not self.batching:
+            status, alarms = await asyncio.gather(
+                self.get_status(), self.get_alarms(), return_exceptions=True
+            )
+        else:
+            results = await self.batch(
+                [{"idOperacion": OP_STATUS}, {"idOperacion": OP_ALARMS}], return_exceptions=True
+            )
+            status, alarms = results[OP_STATUS], results[OP_ALARMS]
+            if isinstance(status, str):
+                status = _parse_status(self.trace, status)
+            if isinstance(alarms, str):
+                alarms = _parse_alarms(self.trace, alarms)
+        if isinstance(status, BaseException):
+            raise status
+        if isinstance(alarms, BaseException):
+            if not isinstance(alarms, Exception):
+                raise alarms
+            _LOGGER.warning("Netflame alarms read failed, keeping last value: %s", alarms)
+            alarms = previous_alarms
+        status.alarms = alarms
+        return status
@@ -0,0 +1,138 @@
+"""Circuit breaker for the Netflame cloud endpoint."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Callable
+
+from .const import BREAKER_COOLDOWN, BREAKER_COOLDOWN_MAX, BREAKER_FAILURE_THRESHOLD
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+STATES = (STATE_CLOSED, STATE_OPEN, STATE_HALF_OPEN)
+
+
+class NetflameCircuitOpenError(Exception):
+    """Raised instead of sending a request while the breaker is open."""
+
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"{name} is unreachable, requests paused")
+        # Seconds until the breaker lets a probe through (0 while probing)
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker around the requests to one URL.
+
+    Closed: requests go through; `failure_threshold` consecutive failures
+    open the breaker. Open: requests fail fast with
+    `NetflameCircuitOpenError` until the cooldown elapses. Half-open: a
+    single probe request is let through; success closes the breaker, failure
+    opens it again with a doubled cooldown (capped at `max_cooldown`).
+
+    Transitions are logged once each, so an outage produces a handful of log
+    lines instead of one stack trace per request, and reported to
+    `on_change` with the new state, outside the lock.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = BREAKER_FAILURE_THRESHOLD,
+        cooldown: float = BREAKER_COOLDOWN,
+        max_cooldown: float = BREAKER_COOLDOWN_MAX,
+        clock: Callable[[], float] = time.monotonic,
+        on_change: Callable[[str], None] | None = None,
+    ):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self._clock = clock
+        self.on_change = on_change
+        self._lock = threading.Lock()
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.cooldown = cooldown
+        self._opened_at = 0.0
+        self.rejected = 0
+        self.trips = 0
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 unless open)."""
+        if self.state != STATE_OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.cooldown - self._clock())
+
+    def before_request(self) -> None:
+        """Admit a request or raise `NetflameCircuitOpenError`."""
+        with self._lock:
+            if self.state == STATE_CLOSED:
+                return
+            # A probe that never reported back (e.g. cancelled) is replaced
+            # once a full cooldown has passed since it started
+            if self._clock() < self._opened_at + self.cooldown:
+                # Open and cooling down, or a probe is already in flight
+                self.rejected += 1
+                raise NetflameCircuitOpenError(self.name, self.retry_in)
+            previous = self.state
+            self.state = STATE_HALF_OPEN
+            self._opened_at = self._clock()
+            _LOGGER.debug("%s: probing after %.0f s", self.name, self.cooldown)
+        self._notify(previous)
+
+    def record_success(self) -> None:
+        """Close the breaker after a successful request."""
+        with self._lock:
+            previous = self.state
+            if previous != STATE_CLOSED:
+                _LOGGER.info("%s: reachable again, resuming requests", self.name)
+            self.state = STATE_CLOSED
+            self.failures = 0
+            self.cooldown = self.base_cooldown
+        self._notify(previous)
+
+    def record_failure(self) -> None:
+        """Count a failed request, opening the breaker when needed."""
+        with self._lock:
+            previous = self.state
+            self.failures += 1
+            if self.state == STATE_HALF_OPEN:
+                self.cooldown = min(self.cooldown * 2, self.max_cooldown)
+                self._open()
+                _LOGGER.debug("%s: probe failed, next one in %.0f s", self.name, self.cooldown)
+            elif self.state == STATE_CLOSED and self.failures >= self.failure_threshold:
+                self._open()
+                _LOGGER.warning(
+                    "%s: %s consecutive failures, pausing requests for %.0f s",
+                    self.name,
+                    self.failures,
+                    self.cooldown,
+                )
+        self._notify(previous)
+
+    def _notify(self, previous: str) -> None:
+        if self.on_change is not None and self.state != previous:
+            self.on_change(self.state)
+
+    def _open(self) -> None:
+        self.state = STATE_OPEN
+        self._opened_at = self._clock()
+        self.trips += 1
+
+    @property
+    def stats(self) -> dict:
+        """Return the state and counters for diagnostics."""
+        return {
+            "state": self.state,
+            "failures": self.failures,
+            "cooldown": self.cooldown,
+            "retry_in": round(self.retry_in, 1),
+            "trips": self.trips,
+            "rejected": self.rejected,
+        }
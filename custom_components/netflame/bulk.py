@@ -0,0 +1,79 @@
+"""Send one command to many stoves with bounded concurrency.
+
+Kept free of Home Assistant imports so the scheduling can be unit tested
+on its own.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from .const import DEFAULT_BULK_CONCURRENCY, DEFAULT_BULK_DEADLINE
+
+_LOGGER = logging.getLogger(__name__)
+
+RESULT_OK = "ok"
+RESULT_ERROR = "error"
+RESULT_TIMEOUT = "timeout"
+RESULT_NOT_FOUND = "not_found"
+
+
+async def run_bulk(
+    commands: dict[str, Callable[[], Awaitable[Any]]],
+    concurrency: int = DEFAULT_BULK_CONCURRENCY,
+    deadline: float = DEFAULT_BULK_DEADLINE,
+) -> dict[str, dict]:
+    """Run every command in `commands` (by serial) and return their results.
+
+    At most `concurrency` commands are in flight at once, and all of them
+    must finish within `deadline` seconds of the call. Each serial maps to
+    {"result", "error", "duration"}, in the order of `commands`:
+
+    - "ok": the command was sent
+    - "error": it failed with the error described in "error"
+    - "timeout": the deadline passed first. A command cancelled in flight
+      may still have reached the stove; one still waiting for a slot was
+      never sent (its duration is None)
+
+    One stove failing never stops the others.
+    """
+    if concurrency < 1:
+        raise ValueError("Bulk commands need a concurrency of at least 1")
+    loop = asyncio.get_running_loop()
+    end = loop.time() + deadline
+    semaphore = asyncio.Semaphore(concurrency)
+    results: dict[str, dict] = {serial: {} for serial in commands}
+
+    async def run(serial: str, send: Callable[[], Awaitable[Any]]) -> None:
+        async with semaphore:
+            start = loop.time()
+            if start >= end:
+                results[serial] = _result(RESULT_TIMEOUT, "not sent before the deadline")
+                return
+            try:
+                await asyncio.wait_for(send(), end - start)
+            except Exception as err:
+                # Client timeouts are TimeoutErrors too: only the deadline
+                # having passed makes it a bulk timeout
+                if isinstance(err, asyncio.TimeoutError) and loop.time() >= end:
+                    results[serial] = _result(RESULT_TIMEOUT, "deadline exceeded", loop.time() - start)
+                else:
+                    _LOGGER.debug("Netflame %s bulk command failed: %s", serial, err)
+                    results[serial] = _result(
+                        RESULT_ERROR, f"{type(err).__name__}: {err}", loop.time() - start
+                    )
+                return
+            results[serial] = _result(RESULT_OK, None, loop.time() - start)
+
+    await asyncio.gather(*(run(serial, send) for serial, send in commands.items()))
+    return results
+
+
+def _result(result: str, error: str | None, duration: float | None = None) -> dict:
+    return {"result": result, "error": error, "duration": duration}
+
+
+def not_found() -> dict:
+    """Return the result of a serial no configured stove matches."""
+    return _result(RESULT_NOT_FOUND, "no configured stove with this serial")
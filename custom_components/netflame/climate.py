@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 from datetime import timedelta
-from .utils import status_svg_data_uri
+from .utils import status_icon_url
 
 from homeassistant.components.climate import ClimateEntity, ClimateEntityFeature
 from homeassistant.components.climate.const import HVACMode
@@ -10,10 +10,9 @@ from homeassistant.const import UnitOfTemperature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
 
-from .const import DOMAIN
+from .const import DOMAIN, HVAC_OFF_STATUSES
+from .entity import NetflameEntity
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,19 +29,19 @@ async def async_setup_entry(
     api = data["api"]
     coordinator = data["coordinator"]
 
-    async_add_entities([NetflameClimate(api, coordinator, entry)], True)
+    async_add_entities([NetflameClimate(api, coordinator, entry)])
 
 
-class NetflameClimate(CoordinatorEntity, ClimateEntity):
+class NetflameClimate(NetflameEntity, ClimateEntity):
     """Netflame Climate Entity."""
 
     _attr_icon = "mdi:fire"
+    _netflame_fields = frozenset({"status", "temperature", "power"})
 
     def __init__(self, api, coordinator, entry):
         """Initialize the climate entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, entry)
         self.api = api
-        self._entry = entry
         serial = entry.data.get("serial")
         self._attr_name = f"Netflame {serial}"
         self._attr_unique_id = f"netflame_{serial}_climate"
@@ -51,43 +50,39 @@ class NetflameClimate(CoordinatorEntity, ClimateEntity):
         self._attr_supported_features = ClimateEntityFeature.PRESET_MODE
         self._attr_preset_modes = [f"Power {i}" for i in range(1, 10)]
 
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        serial = self._entry.data.get("serial")
-        return DeviceInfo(
-            identifiers={(DOMAIN, serial)},
-            name=f"Netflame {serial}",
-            manufacturer="Netflame",
-            model="Pellet Stove",
-            sw_version="1.0",
-        )
-
     @property
     def current_temperature(self):
         """Return the current temperature."""
-        return self.coordinator.data.get("temperature")
+        return self.coordinator.data.temperature
 
     @property
     def hvac_mode(self):
         """Return current HVAC mode."""
-        estado = self.coordinator.data.get("status")
-        if estado in (0, 1, 8, 9, 11, 20, -2, -3, -4, -20):
+        estado = self.coordinator.data.status
+        if estado in HVAC_OFF_STATUSES:
             return HVACMode.OFF
         return HVACMode.HEAT
 
     async def async_set_hvac_mode(self, hvac_mode):
         """Set HVAC mode."""
-        if hvac_mode == HVACMode.HEAT:
-            await self.hass.async_add_executor_job(self.api.turn_on)
-        else:
-            await self.hass.async_add_executor_job(self.api.turn_off)
-        await self.coordinator.async_request_refresh()
+        heat = hvac_mode == HVACMode.HEAT
+        changes = {}
+        if hvac_mode != self.hvac_mode:
+            # Show the state the stove reports right after the command:
+            # 2 (igniting) when turning on, 8 (shutting down) when turning off
+            changes["status"] = 2 if heat else 8
+
+        def confirmed(data):
+            return (data.status not in HVAC_OFF_STATUSES) == heat
+
+        await self.coordinator.async_send_command(
+            "onoff", self.api.turn_on if heat else self.api.turn_off, changes, confirmed
+        )
 
     @property
     def preset_mode(self):
         """Return current preset mode."""
-        power = self.coordinator.data.get("power")
+        power = self.coordinator.data.power
         if power:
             return f"Power {power}"
         return None
@@ -98,33 +93,27 @@ class NetflameClimate(CoordinatorEntity, ClimateEntity):
             nivel = int(preset_mode.replace("Power ", ""))
         except Exception:
             return
-        await self.hass.async_add_executor_job(self.api.set_power, nivel)
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_send_command(
+            "power",
+            lambda: self.api.set_power(nivel),
+            {"power": nivel},
+            lambda data: data.power == nivel,
+        )
 
     @property
     def entity_picture(self) -> str | None:
-        """Return a colored SVG data URI representing the unit status."""
-        status = self.coordinator.data.get("status")
-        return status_svg_data_uri(status, size=64)
-
-    @property
-    def extra_state_attributes(self) -> dict:
-        """Return additional attributes for the climate entity.
+        """Return the URL of a colored icon representing the unit status.
 
-        Expose the generated `entity_picture` explicitly so it is visible in
-        Developer Tools and in places where the frontend doesn't automatically
-        show the `entity_picture` property for climate entities.
+        Home Assistant already stores it in the `entity_picture` attribute,
+        where a short URL keeps recorded states small.
         """
-        pic = self.entity_picture
-        attrs = {}
-        if pic:
-            attrs["entity_picture"] = pic
-        return attrs
+        status = self.coordinator.data.status
+        return status_icon_url(status, size=64)
 
     @property
     def icon(self) -> str:
         """Return an icon based on current state as a fallback."""
-        status = self.coordinator.data.get("status")
+        status = self.coordinator.data.status
         if status in (1, 2, 3, 4, 10, 5, 6, 7):
             return "mdi:fire"
         if status == -4:
@@ -0,0 +1,126 @@
+"""Per-stove command queue.
+
+Coalesces bursts of commands (a dragged slider, a looping automation) so
+only the last command of each kind reaches the cloud endpoint.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable
+
+from .const import DEFAULT_COMMAND_WINDOW
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CommandQueue:
+    """Debounce commands per kind and send only the latest one.
+
+    Each `submit` restarts a `window` second timer. When the timer fires,
+    the latest command of every kind (e.g. "onoff", "power") is sent;
+    earlier commands of the same kind are superseded and never sent.
+    `cancel` discards everything still queued, e.g. when the stove's entry
+    is unloaded.
+    """
+
+    def __init__(self, window: float = DEFAULT_COMMAND_WINDOW):
+        self.window = window
+        self.sent = 0
+        self.collapsed = 0
+        self.dropped = 0
+        self._pending: dict[str, tuple[Callable[[], Awaitable[Any]], asyncio.Future]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def drop(self, kind: str | None = None) -> None:
+        """Record a command skipped because it matches the current state.
+
+        A pending command of the same `kind` is superseded by it, so it
+        isn't sent either: the state it matches is the one last asked for.
+        """
+        self.dropped += 1
+        superseded = self._pending.pop(kind, None) if kind is not None else None
+        if superseded is not None:
+            self.collapsed += 1
+            superseded[1].set_result(False)
+            if not self._pending and self._handle is not None:
+                self._handle.cancel()
+                self._handle = None
+
+    def cancel(self) -> None:
+        """Discard the queued commands and stop those being sent.
+
+        Their `submit` calls return False.
+        """
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, {}
+        for _, future in pending.values():
+            if not future.done():
+                future.set_result(False)
+        for task in self._tasks:
+            task.cancel()
+
+    async def submit(self, kind: str, send: Callable[[], Awaitable[Any]]) -> bool:
+        """Queue `send` for `kind`.
+
+        Returns True once the command has been sent, or False if a newer
+        command of the same kind superseded it or the queue was cancelled. Errors raised by `send`
+        propagate to the caller whose command was sent.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        superseded = self._pending.pop(kind, None)
+        if superseded is not None:
+            self.collapsed += 1
+            superseded[1].set_result(False)
+        self._pending[kind] = (send, future)
+
+        if self._handle is not None:
+            self._handle.cancel()
+        if self.window > 0:
+            self._handle = loop.call_later(self.window, self._flush)
+        else:
+            self._flush()
+
+        return await future
+
+    def _flush(self) -> None:
+        self._handle = None
+        pending, self._pending = self._pending, {}
+        if pending:
+            task = asyncio.get_running_loop().create_task(self._send_all(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _send_all(self, pending: dict) -> None:
+        try:
+            # Kinds are sent in the order they were last submitted
+            for kind, (send, future) in pending.items():
+                try:
+                    await send()
+                except Exception as err:
+                    _LOGGER.debug("Netflame %s command failed: %s", kind, err)
+                    if not future.done():
+                        future.set_exception(err)
+                    continue
+                self.sent += 1
+                if not future.done():
+                    future.set_result(True)
+        finally:
+            # Cancelled: the commands not sent yet never will be
+            for _, future in pending.values():
+                if not future.done():
+                    future.set_result(False)
+
+    @property
+    def stats(self) -> dict:
+        """Return command counters."""
+        return {
+            "sent": self.sent,
+            "collapsed": self.collapsed,
+            "dropped": self.dropped,
+        }
@@ -1,26 +1,60 @@
 import voluptuous as vol
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, BASE_URL
-from .api import NetflameApi
+from .const import (
+    DOMAIN,
+    BASE_URL,
+    CONF_ALARM_INTERVAL,
+    CONF_COMMAND_WINDOW,
+    CONF_CONNECT_TIMEOUT,
+    CONF_DEBUG_CAPTURE,
+    CONF_FAST_INTERVAL,
+    CONF_NORMAL_INTERVAL,
+    CONF_POOL_SIZE,
+    CONF_READ_TIMEOUT,
+    CONF_RETRIES,
+    CONF_SLOW_INTERVAL,
+    CONF_UPDATE_MODE,
+    DEFAULT_ALARM_INTERVAL,
+    DEFAULT_COMMAND_WINDOW,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DEBUG_CAPTURE,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_NORMAL_INTERVAL,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_SLOW_INTERVAL,
+    DEFAULT_UPDATE_MODE,
+    UPDATE_MODES,
+)
 
 class NetflameFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry):
+        return NetflameOptionsFlow(config_entry)
+
     async def async_step_user(self, user_input=None) -> FlowResult:
         errors = {}
 
         if user_input is not None:
-            api = NetflameApi(
+            from .api import AsyncNetflameApi
+
+            api = AsyncNetflameApi(
                 user_input["serial"],
                 user_input["password"],
+                async_get_clientsession(self.hass, verify_ssl=False),
                 base_url=user_input.get("url")
             )
             try:
-                # Validate by calling get_status in executor (blocking)
-                await self.hass.async_add_executor_job(api.get_status)
+                # Validate credentials with a status read
+                await api.get_status()
                 return self.async_create_entry(
                     title=f"Netflame {user_input['serial']}",
                     data=user_input
@@ -48,3 +82,66 @@ class NetflameFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
             description_placeholders=placeholders,
         )
+
+
+class NetflameOptionsFlow(config_entries.OptionsFlow):
+    """Tune polling for an existing stove."""
+
+    def __init__(self, config_entry):
+        self._config_entry = config_entry
+
+    async def async_step_init(self, user_input=None) -> FlowResult:
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self._config_entry.options
+        interval = vol.All(vol.Coerce(int), vol.Range(min=5, max=3600))
+        timeout = vol.All(vol.Coerce(float), vol.Range(min=1, max=60))
+        schema = vol.Schema({
+            vol.Required(
+                CONF_UPDATE_MODE,
+                default=options.get(CONF_UPDATE_MODE, DEFAULT_UPDATE_MODE),
+            ): vol.In(UPDATE_MODES),
+            vol.Required(
+                CONF_FAST_INTERVAL,
+                default=options.get(CONF_FAST_INTERVAL, DEFAULT_FAST_INTERVAL),
+            ): interval,
+            vol.Required(
+                CONF_NORMAL_INTERVAL,
+                default=options.get(CONF_NORMAL_INTERVAL, DEFAULT_NORMAL_INTERVAL),
+            ): interval,
+            vol.Required(
+                CONF_SLOW_INTERVAL,
+                default=options.get(CONF_SLOW_INTERVAL, DEFAULT_SLOW_INTERVAL),
+            ): interval,
+            vol.Required(
+                CONF_ALARM_INTERVAL,
+                default=options.get(CONF_ALARM_INTERVAL, DEFAULT_ALARM_INTERVAL),
+            ): interval,
+            vol.Required(
+                CONF_COMMAND_WINDOW,
+                default=options.get(CONF_COMMAND_WINDOW, DEFAULT_COMMAND_WINDOW),
+            ): vol.All(vol.Coerce(float), vol.Range(min=0, max=10)),
+            vol.Required(
+                CONF_POOL_SIZE,
+                default=options.get(CONF_POOL_SIZE, DEFAULT_POOL_SIZE),
+            ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+            vol.Required(
+                CONF_CONNECT_TIMEOUT,
+                default=options.get(CONF_CONNECT_TIMEOUT, DEFAULT_CONNECT_TIMEOUT),
+            ): timeout,
+            vol.Required(
+                CONF_READ_TIMEOUT,
+                default=options.get(CONF_READ_TIMEOUT, DEFAULT_READ_TIMEOUT),
+            ): timeout,
+            vol.Required(
+                CONF_RETRIES,
+                default=options.get(CONF_RETRIES, DEFAULT_RETRIES),
+            ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+            vol.Required(
+                CONF_DEBUG_CAPTURE,
+                default=options.get(CONF_DEBUG_CAPTURE, DEFAULT_DEBUG_CAPTURE),
+            ): bool,
+        })
+
+        return self.async_show_form(step_id="init", data_schema=schema)
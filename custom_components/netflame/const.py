@@ -6,3 +6,117 @@ OP_ONOFF = "1013"
 OP_STATUS = "1002"
 OP_POWER = "1004"
 OP_ALARMS = "1079"
+
+# Hub scheduling: at most this many stoves refreshing at once per base URL,
+# and refresh starts spaced by at least this many seconds
+HUB_MAX_CONCURRENT = 4
+HUB_REFRESH_SPACING = 0.5
+
+# Adaptive polling options (seconds)
+CONF_FAST_INTERVAL = "fast_interval"
+CONF_NORMAL_INTERVAL = "normal_interval"
+CONF_SLOW_INTERVAL = "slow_interval"
+DEFAULT_FAST_INTERVAL = 10
+DEFAULT_NORMAL_INTERVAL = 60
+DEFAULT_SLOW_INTERVAL = 300
+# How long to keep polling fast after a command is sent
+COMMAND_BOOST_DURATION = 120
+
+# Status codes grouped by how quickly they are expected to change
+TRANSITIONAL_STATUSES = (1, 2, 3, 4, 5, 6, 10)
+STABLE_ON_STATUSES = (7,)
+IDLE_STATUSES = (0, 8, 11)
+
+# Status codes reported while the stove is off or stopping
+HVAC_OFF_STATUSES = (0, 1, 8, 9, 11, 20, -2, -3, -4, -20)
+
+# Error and alert status codes: alarms are read right away when the stove
+# enters or leaves one of them
+ALERT_STATUSES = (-2, -3, -4, -20)
+
+# Alarms are read on their own, slower schedule (seconds); the last value
+# is carried forward in between
+CONF_ALARM_INTERVAL = "alarm_interval"
+DEFAULT_ALARM_INTERVAL = 300
+
+# Update modes: "interval" reads the status on every poll and alarms on
+# their own schedule; "changes" polls a status fingerprint every fast
+# interval and only reads alarms and publishes an update when it changes
+# (alarms are still read at least every alarm interval)
+CONF_UPDATE_MODE = "update_mode"
+UPDATE_MODE_INTERVAL = "interval"
+UPDATE_MODE_CHANGES = "changes"
+UPDATE_MODES = (UPDATE_MODE_INTERVAL, UPDATE_MODE_CHANGES)
+DEFAULT_UPDATE_MODE = UPDATE_MODE_INTERVAL
+
+# Post-command confirmation polling
+CONFIRM_ATTEMPTS = 5
+CONFIRM_INTERVAL = 2.0
+
+# Commands of the same kind sent within this window (seconds) are coalesced
+CONF_COMMAND_WINDOW = "command_window"
+DEFAULT_COMMAND_WINDOW = 0.5
+
+# Keep the last raw responses of each stove for diagnostics
+CONF_DEBUG_CAPTURE = "debug_capture"
+DEFAULT_DEBUG_CAPTURE = False
+TRACE_SIZE = 20
+
+# HTTP client options
+CONF_POOL_SIZE = "pool_size"
+CONF_CONNECT_TIMEOUT = "connect_timeout"
+CONF_READ_TIMEOUT = "read_timeout"
+CONF_RETRIES = "retries"
+DEFAULT_POOL_SIZE = 10
+DEFAULT_CONNECT_TIMEOUT = 5.0
+DEFAULT_READ_TIMEOUT = 10.0
+DEFAULT_RETRIES = 2
+# Exponential backoff between retries: RETRY_BACKOFF * 2**attempt, capped
+RETRY_BACKOFF = 0.5
+RETRY_BACKOFF_MAX = 8.0
+
+# Circuit breaker shared by all stoves on one base URL: opens after
+# BREAKER_FAILURE_THRESHOLD consecutive failed requests, then lets a single
+# probe through after a cooldown that doubles after every failed probe
+BREAKER_FAILURE_THRESHOLD = 3
+BREAKER_COOLDOWN = 30.0
+BREAKER_COOLDOWN_MAX = 600.0
+
+# Batched operations: one POST carrying every operation code in
+# BATCH_FIELD (comma separated) instead of idOperacion. Servers that accept
+# it mark the response with BATCH_HEADER and answer one "[code]" section
+# per operation; requests and metrics of such a POST are labelled OP_BATCH
+BATCH_FIELD = "operaciones"
+BATCH_HEADER = "X-Netflame-Batch"
+OP_BATCH = "batch"
+
+# Readable names of the protocol operations, used as metric labels
+OPERATION_NAMES = {
+    OP_ONOFF: "onoff",
+    OP_STATUS: "status",
+    OP_POWER: "power",
+    OP_ALARMS: "alarms",
+}
+# Upper bounds (seconds) of the request latency histogram buckets; slower
+# requests land in a final overflow bucket
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# Coordinator update keys entities can depend on besides the StatusRecord
+# fields: request metrics, reading history and circuit breaker state
+ENTITY_EXTRA_FIELDS = frozenset({"metrics", "history", "breaker"})
+
+# Readings kept in memory per stove for the rolling statistics: six hours
+# at the default normal polling interval
+HISTORY_SIZE = 360
+
+# Last known snapshot of each stove, persisted so entities start from it
+STORAGE_VERSION = 1
+# Coalesce snapshot writes: at most one write per this many seconds
+STORAGE_SAVE_DELAY = 30
+
+# netflame.bulk_command service: sends one operation to many stoves, at
+# most BULK_CONCURRENCY at a time, giving up after BULK_DEADLINE seconds
+SERVICE_BULK_COMMAND = "bulk_command"
+BULK_OPERATIONS = ("on", "off", "power")
+DEFAULT_BULK_CONCURRENCY = 4
+DEFAULT_BULK_DEADLINE = 60.0
@@ -0,0 +1,310 @@
+"""Data update coordinator for a single Netflame stove."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import AsyncNetflameApi
+from .breaker import NetflameCircuitOpenError
+from .commands import CommandQueue
+from .const import STORAGE_SAVE_DELAY
+from .history import StatusHistory
+from .hub import NetflameHub
+from .entity import ALL_ENTITY_FIELDS
+from .parser import StatusRecord
+from .polling import AdaptivePollPolicy, AlarmSchedule, StatusWatch, confirm_state
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(seconds=60)
+
+
+class NetflameCoordinator(DataUpdateCoordinator[StatusRecord]):
+    """Poll one stove through its hub.
+
+    The update interval is re-evaluated after every refresh by an
+    `AdaptivePollPolicy`, so the stove is polled faster while it changes
+    state and slower while it is idle.
+
+    `changed_fields` holds the record fields that changed in the update
+    being dispatched, so entities can skip writing an unchanged state. It
+    also contains "breaker" when the hub's circuit breaker changed state
+    (the hub pushes every transition as it happens), and "metrics" after
+    every refresh attempt, successful or not, plus "history" after every
+    successful one. Listeners are notified after every refresh attempt,
+    even when Home Assistant would skip it because the data didn't change
+    or the refresh failed again, with only those fields then.
+
+    Every successful refresh is also added to `history`, which keeps
+    rolling statistics over the last readings in memory.
+
+    Alarms are read on the `alarms` schedule, slower than the status, and
+    carried forward in between; a status entering or leaving an error or
+    alert code reads them right away.
+
+    While the breaker is open, refreshes are scheduled for when it lets the
+    next probe through, so polling backs off with the breaker's cooldown.
+
+    With a `watch`, the coordinator runs in the "changes" update mode: it
+    polls only the status fingerprint every `watch.interval` seconds and
+    reads alarms and publishes an update only when the status changed (or
+    when alarms are due).
+
+    With debug capture enabled, the duration and outcome of every refresh
+    is added to the API client's trace.
+
+    With a `store`, every snapshot that differs from the previous one is
+    saved (writes are coalesced), and `async_load_cached` can seed the
+    coordinator from it at startup. Seeded data is flagged `stale` until
+    the first live refresh succeeds.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        hub: NetflameHub,
+        api: AsyncNetflameApi,
+        name: str,
+        policy: AdaptivePollPolicy | None = None,
+        commands: CommandQueue | None = None,
+        store: Store | None = None,
+        watch: StatusWatch | None = None,
+        alarms: AlarmSchedule | None = None,
+        history: StatusHistory | None = None,
+    ):
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=name,
+            update_interval=SCAN_INTERVAL,
+            # StatusRecord compares by value: identical polls notify nobody
+            always_update=False,
+        )
+        self.hub = hub
+        self.api = api
+        self.policy = policy or AdaptivePollPolicy()
+        self.commands = commands or CommandQueue()
+        self._confirm_task: asyncio.Task | None = None
+        self.changed_fields: frozenset = ALL_ENTITY_FIELDS
+        self._notified_success: bool | None = None
+        self._notified_breaker: str | None = None
+        self.store = store
+        self.stale = False
+        self.watch = watch
+        self.alarms = alarms or AlarmSchedule()
+        self.history = history or StatusHistory()
+        self._listeners_notified = False
+
+    @callback
+    def async_set_updated_data(self, data: StatusRecord) -> None:
+        """Publish `data`, recording which fields changed."""
+        self.changed_fields = data.diff(self.data)
+        super().async_set_updated_data(data)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify listeners, flagging every field when availability flips."""
+        success = self.last_update_success
+        if success != self._notified_success:
+            self._notified_success = success
+            self.changed_fields = ALL_ENTITY_FIELDS
+        elif not success:
+            self.changed_fields = frozenset()
+        extra = {"metrics", "history"} if success else {"metrics"}
+        breaker = self.hub.breaker.state
+        if breaker != self._notified_breaker:
+            self._notified_breaker = breaker
+            extra.add("breaker")
+        self.changed_fields = self.changed_fields | extra
+        self._listeners_notified = True
+        super().async_update_listeners()
+
+    async def _async_refresh(self, *args, **kwargs) -> None:
+        self._listeners_notified = False
+        await super()._async_refresh(*args, **kwargs)
+        if not self._listeners_notified:
+            # Unchanged data or a repeated failure: the request metrics and
+            # history still moved on
+            self.changed_fields = frozenset()
+            self.async_update_listeners()
+
+    @callback
+    def async_breaker_changed(self) -> None:
+        """Publish a transition of the hub's circuit breaker right away.
+
+        Called by the hub. Home Assistant doesn't notify listeners after a
+        failed refresh that follows another failed one, which is exactly
+        when the breaker opens and probes.
+        """
+        # Mid-refresh, this doesn't stand for the refresh's own notification
+        notified = self._listeners_notified
+        self.changed_fields = frozenset()
+        self.async_update_listeners()
+        self._listeners_notified = notified
+
+    async def async_load_cached(self) -> bool:
+        """Seed `data` from the stored snapshot; return whether there was one."""
+        cached = await self.store.async_load() if self.store is not None else None
+        if not cached:
+            return False
+        self.data = StatusRecord.from_dict(cached["record"])
+        self.stale = True
+        # The first live refresh must reach the listeners even when it
+        # matches the cached values, so they drop the stale marker
+        self.always_update = True
+        return True
+
+    def note_command(self) -> None:
+        """Switch to fast polling for a command sent to the stove.
+
+        Takes effect on the next publish, which reschedules the refresh
+        timer with the current `update_interval`.
+        """
+        self.policy.boost(time.monotonic())
+        self.update_interval = timedelta(seconds=self.policy.fast)
+
+    async def async_send_command(
+        self,
+        kind: str,
+        send: Callable[[], Awaitable[Any]],
+        changes: dict,
+        confirmed: Callable[[StatusRecord], bool],
+    ) -> None:
+        """Queue a command and apply its expected effect optimistically.
+
+        Commands whose `changes` already match the coordinator data are
+        dropped, superseding a queued command of the same `kind`; commands
+        without `changes` are always sent. Otherwise `changes` is merged into the data right away so
+        entities reflect the command without waiting for a refresh, and the
+        command goes through the command queue, which only sends the latest
+        command of each `kind` within its window. Once sent, a bounded
+        confirmation loop reads the status until `confirmed` accepts it and
+        publishes whatever the stove last reported, which rolls the
+        optimistic values back if the command didn't take effect. Polling
+        switches to the fast interval as soon as the command is queued.
+        """
+        if changes and all(getattr(self.data, key) == value for key, value in changes.items()):
+            self.commands.drop(kind)
+            return
+
+        self._cancel_confirmation()
+        self.note_command()
+        self.async_set_updated_data(self.data.replace(**changes))
+        try:
+            sent = await self.commands.submit(kind, send)
+        except Exception:
+            await self.async_request_refresh()
+            raise
+        if not sent:
+            return
+        self._confirm_task = self.hass.async_create_task(self._async_confirm(confirmed))
+
+    async def _async_confirm(self, confirmed: Callable[[StatusRecord], bool]) -> None:
+        ok, status = await confirm_state(self.api.get_status, confirmed)
+        if not ok:
+            _LOGGER.debug("%s: command not confirmed by the stove", self.name)
+        if status is not None:
+            status.alarms = self.data.alarms
+            self.async_set_updated_data(status)
+        else:
+            await self.async_request_refresh()
+
+    def _cancel_confirmation(self) -> None:
+        if self._confirm_task is not None and not self._confirm_task.done():
+            self._confirm_task.cancel()
+        self._confirm_task = None
+
+    async def async_shutdown(self) -> None:
+        """Cancel queued commands and a pending confirmation on unload."""
+        self.commands.cancel()
+        self._cancel_confirmation()
+        await super().async_shutdown()
+
+    def _back_off(self, retry_in: float) -> None:
+        # Never poll faster than the policy's fast interval while waiting
+        self.update_interval = timedelta(seconds=max(retry_in, self.policy.fast))
+
+    async def _async_read_alarms(self, previous_alarms: str | None) -> str | None:
+        try:
+            return await self.api.get_alarms()
+        except Exception as err:
+            _LOGGER.warning("Netflame alarms read failed, keeping last value: %s", err)
+            return previous_alarms
+
+    async def _async_watch(self, previous_alarms: str | None) -> StatusRecord:
+        fingerprint, status = await self.api.get_status_if_changed(self.watch.fingerprint)
+        read_alarms = self.watch.observe(fingerprint, status is not None, time.monotonic())
+        if status is None:
+            if not read_alarms:
+                return self.data
+            status = self.data.replace()
+        status.alarms = previous_alarms
+        if read_alarms:
+            status.alarms = await self._async_read_alarms(previous_alarms)
+        return status
+
+    async def _async_poll(self, previous_alarms: str | None) -> StatusRecord:
+        # When alarms are due they are read concurrently with the status;
+        # otherwise only the status is read, and alarms follow only when
+        # it moved into or out of an error code
+        now = time.monotonic()
+        read_alarms = self.alarms.due(now)
+        data = await self.api.get_snapshot(previous_alarms=previous_alarms, include_alarms=read_alarms)
+        if not read_alarms and self.alarms.escalate(data.status):
+            data.alarms = await self._async_read_alarms(previous_alarms)
+            read_alarms = True
+        self.alarms.observe(data.status, read_alarms, now)
+        return data
+
+    async def _async_update_data(self):
+        trace = self.api.trace
+        if trace is None:
+            return await self._async_fetch()
+        started = time.perf_counter()
+        try:
+            data = await self._async_fetch()
+        except Exception as err:
+            trace.record_refresh(time.perf_counter() - started, err)
+            raise
+        trace.record_refresh(time.perf_counter() - started)
+        return data
+
+    async def _async_fetch(self) -> StatusRecord:
+        # A failed alarms read keeps the previous alarms value instead of
+        # failing the refresh
+        previous_alarms = self.data.alarms if self.data is not None else None
+        try:
+            async with self.hub.refresh_slot():
+                if self.watch is not None:
+                    data = await self._async_watch(previous_alarms)
+                else:
+                    data = await self._async_poll(previous_alarms)
+        except NetflameCircuitOpenError as err:
+            self._back_off(err.retry_in)
+            raise UpdateFailed(str(err)) from None
+        except Exception:
+            if self.hub.breaker.retry_in:
+                self._back_off(self.hub.breaker.retry_in)
+            raise
+
+        if self.watch is not None:
+            interval = self.watch.interval
+        else:
+            interval = self.policy.next_interval(data.status, time.monotonic())
+        self.update_interval = timedelta(seconds=interval)
+        self.history.append(time.monotonic(), data)
+        self.changed_fields = data.diff(self.data)
+        if self.stale:
+            self.stale = False
+            self.always_update = False
+            self.changed_fields = ALL_ENTITY_FIELDS
+        if self.changed_fields and self.store is not None:
+            self.store.async_delay_save(lambda: {"record": data.as_dict()}, STORAGE_SAVE_DELAY)
+        return data
@@ -0,0 +1,60 @@
+"""Diagnostics support for Netflame."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+# The serial is the basic auth username
+TO_REDACT = {"password", "serial"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = data["coordinator"]
+    api = data["api"]
+    record = coordinator.data
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "state": record.as_dict() if record is not None else None,
+        "stale": coordinator.stale,
+        "polling": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "last_update_success": coordinator.last_update_success,
+            **coordinator.policy.stats,
+            **(coordinator.watch.stats if coordinator.watch is not None else coordinator.alarms.stats),
+        },
+        "commands": coordinator.commands.stats,
+        "history": coordinator.history.stats(),
+        "connection": {
+            "breaker": coordinator.hub.breaker.stats,
+            "retry": {
+                "retries": api.retry.retries,
+                "backoff": api.retry.backoff,
+                "max_backoff": api.retry.max_backoff,
+            },
+            "batching": api.batching,
+            # Connections of the pool shared by every stove on this URL
+            "pool": {
+                "size": coordinator.hub.pool_size,
+                "created": coordinator.hub.connections.created,
+                "reused": coordinator.hub.connections.reused,
+            },
+            **api.stats,
+        },
+        "requests": api.metrics.snapshot(),
+        # Request/response pairs, parse failures and refresh durations, only
+        # captured with the debug capture option
+        "trace": api.trace.as_dict() if api.trace is not None else None,
+    }
@@ -0,0 +1,55 @@
+"""Base entity for Netflame."""
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, ENTITY_EXTRA_FIELDS
+from .parser import ALL_FIELDS
+
+# Every key an entity may list in `_netflame_fields`
+ALL_ENTITY_FIELDS = ALL_FIELDS | ENTITY_EXTRA_FIELDS
+
+
+class NetflameEntity(CoordinatorEntity):
+    """Coordinator entity that only writes its state when its data changed.
+
+    Subclasses list the `StatusRecord` fields they render in
+    `_netflame_fields`; coordinator updates that leave all of them
+    untouched don't produce a state write.
+
+    While the coordinator still holds the cached snapshot from the last run,
+    entities carry a `stale` attribute.
+    """
+
+    _netflame_fields: frozenset = frozenset()
+
+    def __init__(self, coordinator, entry):
+        super().__init__(coordinator)
+        self._entry = entry
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        serial = self._entry.data.get("serial")
+        return DeviceInfo(
+            identifiers={(DOMAIN, serial)},
+            name=f"Netflame {serial}",
+            manufacturer="Netflame",
+            model="Pellet Stove",
+            sw_version="1.0",
+        )
+
+    @property
+    def extra_state_attributes(self) -> dict | None:
+        """Flag values restored from the last known snapshot."""
+        if self.coordinator.stale:
+            return {"stale": True}
+        return None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        if self.coordinator.changed_fields.isdisjoint(self._netflame_fields):
+            return
+        super()._handle_coordinator_update()
@@ -0,0 +1,187 @@
+"""Bounded in-memory history of a stove's readings.
+
+Kept free of Home Assistant imports so the statistics can be unit tested
+on their own.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from collections import deque
+
+from .const import HISTORY_SIZE
+from .parser import StatusRecord
+
+# Status codes are kept when they fit 32 bits; a missing or out of range
+# code is stored as _NO_STATUS, which no kept code can equal
+_STATUS_MAX = 2**31 - 1
+_NO_STATUS = -(2**63)
+
+
+class RollingSeries:
+    """Count, sum, min and max of the values in a sliding window.
+
+    Values enter with `add` and leave with `evict` in the same order, each
+    tagged with its sequence number. NaN marks a missing reading and is
+    left out of every statistic. The extremes are kept in monotonic deques,
+    so both operations are amortized O(1) and the deques never hold more
+    entries than the window.
+    """
+
+    __slots__ = ("count", "sum", "_min", "_max")
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self._min: deque[tuple[int, float]] = deque()
+        self._max: deque[tuple[int, float]] = deque()
+
+    def add(self, seq: int, value: float) -> None:
+        """Add reading number `seq`."""
+        if math.isnan(value):
+            return
+        self.count += 1
+        self.sum += value
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((seq, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((seq, value))
+
+    def evict(self, seq: int, value: float) -> None:
+        """Remove reading number `seq`, the oldest one in the window."""
+        if math.isnan(value):
+            return
+        self.count -= 1
+        self.sum -= value
+        if self._min and self._min[0][0] == seq:
+            self._min.popleft()
+        if self._max and self._max[0][0] == seq:
+            self._max.popleft()
+
+    @property
+    def min(self) -> float | None:
+        return self._min[0][1] if self._min else None
+
+    @property
+    def max(self) -> float | None:
+        return self._max[0][1] if self._max else None
+
+    @property
+    def mean(self) -> float | None:
+        return self.sum / self.count if self.count else None
+
+
+class StatusHistory:
+    """Ring buffer of the last `size` readings of one stove.
+
+    Timestamps, temperature, power and status codes are stored in
+    preallocated arrays, so memory stays fixed however long it runs. The
+    statistics over the buffered readings are updated as readings come in
+    and fall out, in amortized O(1):
+
+    - min, max and mean of temperature and power
+    - temperature rate of change between the oldest and newest reading
+    - seconds spent in each status code, counting each reading's status
+      until the next reading
+    """
+
+    def __init__(self, size: int = HISTORY_SIZE):
+        if size < 2:
+            raise ValueError("History needs room for at least two readings")
+        self.size = size
+        self._times = array("d", [0.0]) * size
+        self._temperature = array("d", [math.nan]) * size
+        self._power = array("d", [math.nan]) * size
+        self._status = array("q", [_NO_STATUS]) * size
+        self._start = 0
+        self._count = 0
+        self._seq = 0
+        self.temperature = RollingSeries()
+        self.power = RollingSeries()
+        self._state_time: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, timestamp: float, record: StatusRecord) -> None:
+        """Add the reading `record` taken at `timestamp` (seconds)."""
+        size = self.size
+        if self._count:
+            last = (self._start + self._count - 1) % size
+            status = self._status[last]
+            self._state_time[status] = self._state_time.get(status, 0.0) + timestamp - self._times[last]
+        if self._count == size:
+            self._evict()
+
+        i = (self._start + self._count) % size
+        temperature = math.nan if record.temperature is None else float(record.temperature)
+        power = math.nan if record.power is None else float(record.power)
+        self._times[i] = timestamp
+        self._temperature[i] = temperature
+        self._power[i] = power
+        status = record.status
+        self._status[i] = _NO_STATUS if status is None or abs(status) > _STATUS_MAX else status
+        self.temperature.add(self._seq, temperature)
+        self.power.add(self._seq, power)
+        self._seq += 1
+        self._count += 1
+
+    def _evict(self) -> None:
+        i = self._start
+        seq = self._seq - self._count
+        self.temperature.evict(seq, self._temperature[i])
+        self.power.evict(seq, self._power[i])
+        # The oldest reading's status lasted until the next reading
+        following = (i + 1) % self.size
+        status = self._status[i]
+        remaining = self._state_time[status] - (self._times[following] - self._times[i])
+        if remaining > 1e-9:
+            self._state_time[status] = remaining
+        else:
+            del self._state_time[status]
+        self._start = following
+        self._count -= 1
+
+    @property
+    def span(self) -> float:
+        """Return the seconds between the oldest and newest reading."""
+        if self._count < 2:
+            return 0.0
+        newest = (self._start + self._count - 1) % self.size
+        return self._times[newest] - self._times[self._start]
+
+    @property
+    def temperature_rate(self) -> float | None:
+        """Return the temperature change per hour over the buffered readings."""
+        span = self.span
+        if not span:
+            return None
+        newest = (self._start + self._count - 1) % self.size
+        rate = (self._temperature[newest] - self._temperature[self._start]) * 3600 / span
+        return None if math.isnan(rate) else rate
+
+    @property
+    def time_in_state(self) -> dict[int, float]:
+        """Return the seconds spent in each known status code."""
+        return {
+            status: seconds
+            for status, seconds in self._state_time.items()
+            if status != _NO_STATUS
+        }
+
+    def stats(self) -> dict:
+        """Return every statistic over the buffered readings."""
+        return {
+            "samples": self._count,
+            "span": self.span,
+            "temperature_min": self.temperature.min,
+            "temperature_max": self.temperature.max,
+            "temperature_mean": self.temperature.mean,
+            "temperature_rate": self.temperature_rate,
+            "power_min": self.power.min,
+            "power_max": self.power.max,
+            "power_mean": self.power.mean,
+            "time_in_state": self.time_in_state,
+        }
@@ -0,0 +1,128 @@
+"""Shared per-base-URL hub for Netflame stoves.
+
+All config entries pointing at the same `base_url` share one hub. The hub
+hands out API clients bound to a single pooled aiohttp session and spaces
+coordinator refreshes so many stoves don't hit the endpoint in bursts.
+"""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+
+import aiohttp
+
+from .api import AsyncNetflameApi, BatchSupport, ConnectionStats, RetryPolicy
+from .breaker import CircuitBreaker
+from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_POOL_SIZE,
+    DEFAULT_READ_TIMEOUT,
+    HUB_MAX_CONCURRENT,
+    HUB_REFRESH_SPACING,
+)
+from .trace import ResponseTrace
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class NetflameHub:
+    """Connection pool and refresh scheduler shared by stoves on one base URL.
+
+    Without an explicit `session` the hub creates and owns one, keeping at
+    most `pool_size` connections alive and counting connection reuse. All
+    clients share the hub's circuit breaker, so an outage of the endpoint
+    pauses every stove instead of each one discovering it separately. They
+    also share what is known about the server's batch support.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        session: aiohttp.ClientSession | None = None,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_concurrent: int = HUB_MAX_CONCURRENT,
+        spacing: float = HUB_REFRESH_SPACING,
+    ):
+        self.base_url = base_url
+        self.connections = ConnectionStats()
+        self.breaker = CircuitBreaker(base_url, on_change=self._breaker_changed)
+        self.batch_support = BatchSupport()
+        self.pool_size = pool_size
+        self._owns_session = session is None
+        self._session = session
+        self.spacing = spacing
+        self.coordinators = {}
+        self._semaphore = asyncio.Semaphore(max_concurrent)
+        self._next_start = 0.0
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Return the shared session, creating the hub's own on first use."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size, ssl=False),
+                trace_configs=[self.connections.trace_config()],
+            )
+        return self._session
+
+    def create_api(
+        self,
+        serial: str,
+        password: str,
+        trace: ResponseTrace | None = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retry: RetryPolicy | None = None,
+    ) -> AsyncNetflameApi:
+        """Return an API client for `serial` using the hub's session."""
+        return AsyncNetflameApi(
+            serial,
+            password,
+            self.session,
+            base_url=self.base_url,
+            trace=trace,
+            connect_timeout=connect_timeout,
+            read_timeout=read_timeout,
+            retry=retry,
+            breaker=self.breaker,
+            batch_support=self.batch_support,
+        )
+
+    async def async_close(self) -> None:
+        """Close the session if the hub created it."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def register(self, serial: str, coordinator) -> None:
+        """Subscribe the coordinator of `serial` to this hub."""
+        self.coordinators[serial] = coordinator
+
+    def _breaker_changed(self, state: str) -> None:
+        # Pushed to every stove: coordinators don't notify their listeners
+        # after a failed refresh that follows another one
+        for coordinator in list(self.coordinators.values()):
+            coordinator.async_breaker_changed()
+
+    def unregister(self, serial: str) -> bool:
+        """Remove `serial`; return True when the hub has no stoves left."""
+        self.coordinators.pop(serial, None)
+        return not self.coordinators
+
+    @contextlib.asynccontextmanager
+    async def refresh_slot(self):
+        """Wait for a refresh slot.
+
+        Slots start at least `spacing` seconds apart and at most
+        `max_concurrent` refreshes run at once. Coordinators that become due
+        together are therefore staggered, and their next timers stay apart.
+        """
+        loop = asyncio.get_running_loop()
+        now = loop.time()
+        start = max(now, self._next_start)
+        self._next_start = start + self.spacing
+        if start > now:
+            await asyncio.sleep(start - now)
+        async with self._semaphore:
+            yield
@@ -0,0 +1,121 @@
+"""Per-operation request metrics for the Netflame API clients."""
+from __future__ import annotations
+
+import asyncio
+import sys
+from bisect import bisect_left
+
+from .const import LATENCY_BUCKETS, OPERATION_NAMES
+
+
+class OperationMetrics:
+    """Counters and latency histogram of one protocol operation."""
+
+    __slots__ = (
+        "requests",
+        "errors",
+        "timeouts",
+        "bytes_received",
+        "latency_sum",
+        "latency_max",
+        "buckets",
+    )
+
+    def __init__(self, bucket_count: int):
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.timeouts = 0
+        self.bytes_received = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        # One slot per bucket bound plus the overflow bucket
+        self.buckets = [0] * (bucket_count + 1)
+
+
+class RequestMetrics:
+    """Latency histograms, response sizes and failures per operation.
+
+    Every attempt sent by an API client is observed once, retries included.
+    Sizes are response lengths in characters, which equal bytes for the
+    plain ASCII protocol. Observing costs a bisect over a handful of bucket bounds and a few
+    counter increments; summaries are only computed by `snapshot()`.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        self.bounds = tuple(buckets)
+        self._operations: dict[str, OperationMetrics] = {}
+
+    def _get(self, operation: str) -> OperationMetrics:
+        metrics = self._operations.get(operation)
+        if metrics is None:
+            metrics = self._operations[operation] = OperationMetrics(len(self.bounds))
+        return metrics
+
+    def _observe(self, metrics: OperationMetrics, elapsed: float) -> None:
+        metrics.requests += 1
+        metrics.latency_sum += elapsed
+        if elapsed > metrics.latency_max:
+            metrics.latency_max = elapsed
+        metrics.buckets[bisect_left(self.bounds, elapsed)] += 1
+
+    def observe(self, operation: str, elapsed: float, size: int) -> None:
+        """Record a successful request that returned `size` bytes."""
+        metrics = self._get(operation)
+        self._observe(metrics, elapsed)
+        metrics.bytes_received += size
+
+    def observe_error(self, operation: str, elapsed: float, err: BaseException) -> None:
+        """Record a failed request, counting timeouts separately."""
+        metrics = self._get(operation)
+        self._observe(metrics, elapsed)
+        kind = type(err).__name__
+        metrics.errors[kind] = metrics.errors.get(kind, 0) + 1
+        if isinstance(err, asyncio.TimeoutError):
+            metrics.timeouts += 1
+        else:
+            # Only the sync client loads requests
+            requests = sys.modules.get("requests")
+            if requests is not None and isinstance(err, requests.exceptions.Timeout):
+                metrics.timeouts += 1
+
+    def percentile(self, operation: str, q: float) -> float | None:
+        """Estimate the `q` quantile (0..1) latency of `operation`.
+
+        Returns the upper bound of the bucket holding the quantile, or the
+        slowest observed latency when it falls in the overflow bucket.
+        """
+        metrics = self._operations.get(operation)
+        if metrics is None or not metrics.requests:
+            return None
+        rank = q * metrics.requests
+        seen = 0
+        for bound, count in zip(self.bounds, metrics.buckets):
+            seen += count
+            if seen >= rank:
+                return min(bound, metrics.latency_max)
+        return metrics.latency_max
+
+    @property
+    def errors(self) -> int:
+        """Return the failed requests over all operations."""
+        return sum(sum(m.errors.values()) for m in self._operations.values())
+
+    def snapshot(self) -> dict:
+        """Return the metrics of every operation keyed by operation name."""
+        result = {}
+        for operation, metrics in self._operations.items():
+            bounds = [str(b) for b in self.bounds] + ["+Inf"]
+            result[OPERATION_NAMES.get(operation, operation)] = {
+                "requests": metrics.requests,
+                "errors": dict(metrics.errors),
+                "timeouts": metrics.timeouts,
+                "bytes_received": metrics.bytes_received,
+                "latency": {
+                    "mean": metrics.latency_sum / metrics.requests,
+                    "max": metrics.latency_max,
+                    "p50": self.percentile(operation, 0.5),
+                    "p95": self.percentile(operation, 0.95),
+                    "buckets": dict(zip(bounds, metrics.buckets)),
+                },
+            }
+        return result
@@ -0,0 +1,237 @@
+"""Parsers for the Netflame key=value response protocol.
+
+Status fields are recognised through a precomputed key table. Real
+responses are a few short lines: those bodies are split into lines, which
+beats the previous startswith/replace code while allocating about as
+little. Longer bodies are scanned by precompiled patterns instead, so
+only the lines that matter produce Python objects and the alarms scan
+stops after the two lines it needs. That is where the gains are large;
+the exception is a long run of error lines, which the patterns filter
+about half as fast as plain string checks, still under a millisecond for
+a 30 KB body.
+"""
+from __future__ import annotations
+
+import re
+from typing import Optional
+
+
+class StatusRecord:
+    """Parsed stove status.
+
+    `alarms` is not part of the OP_STATUS body; it is filled in when status
+    and alarms are merged into one snapshot.
+    """
+
+    __slots__ = ("status", "temperature", "power", "alarms")
+
+    def __init__(
+        self,
+        status: Optional[int] = None,
+        temperature: Optional[float] = None,
+        power: Optional[int] = None,
+        alarms: Optional[str] = None,
+    ):
+        self.status = status
+        self.temperature = temperature
+        self.power = power
+        self.alarms = alarms
+
+    def diff(self, other: Optional["StatusRecord"]) -> frozenset:
+        """Return the names of the fields that differ from `other`.
+
+        Every field is reported as changed when `other` is None.
+        """
+        if other is None:
+            return ALL_FIELDS
+        return frozenset(
+            name for name in self.__slots__ if getattr(self, name) != getattr(other, name)
+        )
+
+    def replace(self, **changes) -> "StatusRecord":
+        """Return a copy with `changes` applied."""
+        values = self.as_dict()
+        values.update(changes)
+        return StatusRecord(**values)
+
+    def as_dict(self) -> dict:
+        """Return the fields as a JSON-serializable dict."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "StatusRecord":
+        """Build a record from `as_dict()` output, ignoring unknown keys."""
+        return cls(**{name: data.get(name) for name in cls.__slots__})
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, StatusRecord):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"StatusRecord({fields})"
+
+
+ALL_FIELDS = frozenset(StatusRecord.__slots__)
+
+
+class AlarmRecord:
+    """Parsed alarms response.
+
+    `value` is the alarm code (e.g. "N" for no alarm) or None when the body
+    is not a valid alarms answer; `ack` is the second clean line, which the
+    endpoint sets to "0" on success.
+    """
+
+    __slots__ = ("value", "ack")
+
+    def __init__(self, value: Optional[str] = None, ack: Optional[str] = None):
+        self.value = value
+        self.ack = ack
+
+    def __repr__(self) -> str:
+        return f"AlarmRecord(value={self.value!r}, ack={self.ack!r})"
+
+
+def _to_int(value: str) -> int:
+    return int(value)
+
+
+def _to_int_first(value: str) -> int:
+    # Power has always been read up to the next "=" ("consigna_pot=4=x" -> 4)
+    return int(value.split("=", 1)[0])
+
+
+# Response key -> (StatusRecord attribute, converter)
+_STATUS_FIELDS = {
+    "estado": ("status", _to_int),
+    "temperatura": ("temperature", float),
+    "consigna_potencia": ("power", _to_int_first),
+    "consigna_pot": ("power", _to_int_first),
+}
+
+# One scan over the body that only stops on lines starting with a known key
+_STATUS_LINE = re.compile(
+    "^(" + "|".join(sorted(map(re.escape, _STATUS_FIELDS), key=len, reverse=True)) + ")=(.*)$",
+    re.MULTILINE,
+)
+
+# Non-blank lines that don't mention an error, without leading blanks;
+# trailing blanks are stripped by the caller. Discarding error lines
+# reproduces eliminarErrores() from the original JavaScript client. The
+# pattern must stay linear: a lazy group followed by optional trailing
+# blanks backtracks quadratically over long runs of blanks.
+_CLEAN_LINE = re.compile(
+    r"^(?![^\n]*error)[ \t\r\f\v]*(\S[^\n]*)$",
+    re.MULTILINE | re.IGNORECASE,
+)
+_BLANKS = " \t\r\f\v"
+
+# Bodies up to this many characters are split into lines instead: for the
+# few lines of a real response that is faster and allocates less than
+# starting a regex scan. Both paths parse every body the same way.
+_SHORT_BODY = 512
+
+
+def parse_status(raw: str) -> StatusRecord:
+    """Parse an OP_STATUS body.
+
+    Unknown keys are ignored, values that don't convert are stored as None
+    and the last occurrence of a key wins.
+    """
+    record = StatusRecord()
+    fields = _STATUS_FIELDS
+    if len(raw) <= _SHORT_BODY:
+        for line in raw.split("\n"):
+            key, sep, value = line.partition("=")
+            field = fields.get(key) if sep else None
+            if field is not None:
+                try:
+                    setattr(record, field[0], field[1](value))
+                except ValueError:
+                    setattr(record, field[0], None)
+        return record
+    for match in _STATUS_LINE.finditer(raw):
+        name, convert = fields[match.group(1)]
+        try:
+            # int()/float() ignore surrounding whitespace, including "\r"
+            value = convert(match.group(2))
+        except ValueError:
+            value = None
+        setattr(record, name, value)
+    return record
+
+
+def status_problem(raw: str) -> Optional[str]:
+    """Describe why an OP_STATUS body did not parse cleanly, or return None.
+
+    `parse_status` never raises; this rescans the body to explain the None
+    fields it produced. Only used when capturing diagnostics.
+    """
+    problems = []
+    seen = set()
+    for match in _STATUS_LINE.finditer(raw):
+        key = match.group(1)
+        seen.add(_STATUS_FIELDS[key][0])
+        try:
+            _STATUS_FIELDS[key][1](match.group(2))
+        except ValueError:
+            problems.append(f"invalid {key} {match.group(2)!r}")
+    missing = [name for name in ("status", "temperature", "power") if name not in seen]
+    if missing:
+        problems.append(f"missing {', '.join(missing)}")
+    return "; ".join(problems) or None
+
+
+def parse_alarms_record(raw: str) -> AlarmRecord:
+    """Parse an OP_ALARMS body.
+
+    Only the first two clean lines matter: the first holds the alarm
+    (optionally as key=value) and the second must be "0". Scanning stops
+    as soon as both are found.
+    """
+    if len(raw) <= _SHORT_BODY:
+        value = ack = None
+        for line in raw.split("\n"):
+            line = line.strip(_BLANKS)
+            # _CLEAN_LINE needs a non-space character after the leading blanks
+            if line and not line[0].isspace() and "error" not in line.lower():
+                if value is None:
+                    value = line
+                else:
+                    ack = line
+                    break
+        if ack is None:
+            return AlarmRecord()
+    else:
+        matches = _CLEAN_LINE.finditer(raw)
+        first = next(matches, None)
+        second = next(matches, None)
+        if second is None:
+            return AlarmRecord()
+        value, ack = first.group(1), second.group(1).rstrip(_BLANKS)
+
+    if ack != "0":
+        return AlarmRecord(ack=ack)
+
+    value = value.rstrip(_BLANKS)
+    sep = value.find("=")
+    if sep >= 0:
+        value = value[sep + 1:].strip()
+    return AlarmRecord(value, ack)
+
+
+def parse_alarms(raw: str) -> Optional[str]:
+    """Return the alarm code from an OP_ALARMS body, or None if invalid."""
+    return parse_alarms_record(raw).value
+
+
+def alarms_problem(raw: str) -> Optional[str]:
+    """Describe why an OP_ALARMS body is invalid, or return None."""
+    record = parse_alarms_record(raw)
+    if record.value is not None:
+        return None
+    if record.ack is None:
+        return "expected an alarm line and an acknowledgement line"
+    return f"unexpected acknowledgement {record.ack!r}"
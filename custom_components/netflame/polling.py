@@ -0,0 +1,205 @@
+"""Polling policies for the Netflame coordinator.
+
+Kept free of Home Assistant imports so the scheduling rules can be unit
+tested on their own.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Optional
+
+from .const import (
+    ALERT_STATUSES,
+    COMMAND_BOOST_DURATION,
+    CONFIRM_ATTEMPTS,
+    CONFIRM_INTERVAL,
+    DEFAULT_ALARM_INTERVAL,
+    DEFAULT_FAST_INTERVAL,
+    DEFAULT_NORMAL_INTERVAL,
+    DEFAULT_SLOW_INTERVAL,
+    IDLE_STATUSES,
+    STABLE_ON_STATUSES,
+    TRANSITIONAL_STATUSES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class AdaptivePollPolicy:
+    """Choose the next poll interval from the stove state.
+
+    - transitional states, and the `boost_duration` seconds after a
+      command, poll every `fast` seconds
+    - stable on (7) polls every `normal` seconds
+    - off/standby (0, 8, 11) polls every `slow` seconds
+    - anything else (errors, unknown) falls back to `baseline`
+
+    Counters compare the chosen intervals against fixed polling every
+    `baseline` seconds: `polls_avoided` accumulates the polls saved by
+    slower intervals and `extra_polls` the polls added by faster ones.
+    """
+
+    def __init__(
+        self,
+        fast: float = DEFAULT_FAST_INTERVAL,
+        normal: float = DEFAULT_NORMAL_INTERVAL,
+        slow: float = DEFAULT_SLOW_INTERVAL,
+        baseline: float = DEFAULT_NORMAL_INTERVAL,
+        boost_duration: float = COMMAND_BOOST_DURATION,
+    ):
+        self.fast = fast
+        self.normal = normal
+        self.slow = slow
+        self.baseline = baseline
+        self.boost_duration = boost_duration
+        self.polls = 0
+        self._boost_until = 0.0
+        self._avoided = 0.0
+        self._extra = 0.0
+
+    def boost(self, now: float) -> None:
+        """Poll fast for a while after a command was sent at `now`."""
+        self._boost_until = now + self.boost_duration
+
+    def next_interval(self, status: Optional[int], now: float) -> float:
+        """Return the number of seconds until the next poll."""
+        if now < self._boost_until or status in TRANSITIONAL_STATUSES:
+            interval = self.fast
+        elif status in STABLE_ON_STATUSES:
+            interval = self.normal
+        elif status in IDLE_STATUSES:
+            interval = self.slow
+        else:
+            interval = self.baseline
+
+        self.polls += 1
+        # Fixed polling would have made interval / baseline polls meanwhile
+        delta = interval / self.baseline - 1
+        if delta > 0:
+            self._avoided += delta
+        else:
+            self._extra -= delta
+        return interval
+
+    @property
+    def stats(self) -> dict:
+        """Return the scheduler counters."""
+        return {
+            "polls": self.polls,
+            "polls_avoided": round(self._avoided),
+            "extra_polls": round(self._extra),
+        }
+
+
+class AlarmSchedule:
+    """Decide when the "interval" update mode reads alarms.
+
+    Alarms are read at most every `every` seconds and the last value is
+    carried forward in between. A status read that moves the stove into,
+    out of or between `alert_statuses` escalates: alarms are read right
+    away instead of waiting for the schedule.
+    """
+
+    def __init__(self, every: float = DEFAULT_ALARM_INTERVAL, alert_statuses: tuple = ALERT_STATUSES):
+        self.every = every
+        self.alert_statuses = alert_statuses
+        self.reads = 0
+        self.skipped = 0
+        self.escalations = 0
+        self._read_at: float | None = None
+        self._status: Optional[int] = None
+
+    def due(self, now: float) -> bool:
+        """Return whether alarms are due at `now` regardless of the status."""
+        return self._read_at is None or now - self._read_at >= self.every
+
+    def escalate(self, status: Optional[int]) -> bool:
+        """Return whether `status` calls for reading alarms off schedule."""
+        if status == self._status:
+            return False
+        if status in self.alert_statuses or self._status in self.alert_statuses:
+            self.escalations += 1
+            return True
+        return False
+
+    def observe(self, status: Optional[int], read: bool, now: float) -> None:
+        """Record a poll at `now` that saw `status` and maybe read alarms."""
+        self._status = status
+        if read:
+            self.reads += 1
+            self._read_at = now
+        else:
+            self.skipped += 1
+
+    @property
+    def stats(self) -> dict:
+        """Return the alarm read counters."""
+        return {
+            "alarm_reads": self.reads,
+            "alarm_reads_skipped": self.skipped,
+            "alarm_escalations": self.escalations,
+        }
+
+
+class StatusWatch:
+    """Change detection for the "changes" update mode.
+
+    Tracks the fingerprint of the last status read and decides when alarms
+    need reading: when the status changed, and otherwise at least every
+    `alarms_every` seconds. Every poll is counted, along with how many saw
+    a change.
+    """
+
+    def __init__(self, interval: float = DEFAULT_FAST_INTERVAL, alarms_every: float = DEFAULT_ALARM_INTERVAL):
+        self.interval = interval
+        self.alarms_every = alarms_every
+        self.fingerprint: str | None = None
+        self.polls = 0
+        self.changes = 0
+        self._alarms_at: float | None = None
+
+    def observe(self, fingerprint: str, changed: bool, now: float) -> bool:
+        """Record a status poll at `now`; return whether to read alarms."""
+        self.polls += 1
+        self.fingerprint = fingerprint
+        if changed:
+            self.changes += 1
+        if changed or self._alarms_at is None or now - self._alarms_at >= self.alarms_every:
+            self._alarms_at = now
+            return True
+        return False
+
+    @property
+    def stats(self) -> dict:
+        """Return the change detection counters."""
+        return {
+            "watch_polls": self.polls,
+            "watch_changes": self.changes,
+        }
+
+
+async def confirm_state(
+    fetch: Callable[[], Awaitable[Any]],
+    confirmed: Callable[[Any], bool],
+    attempts: int = CONFIRM_ATTEMPTS,
+    interval: float = CONFIRM_INTERVAL,
+) -> tuple[bool, Any]:
+    """Poll `fetch` until `confirmed` accepts its result.
+
+    Makes at most `attempts` reads, `interval` seconds apart, and returns
+    `(True, result)` on the first accepted read. Otherwise returns
+    `(False, last_result)` where `last_result` is the last successful read
+    (None if every read failed).
+    """
+    last = None
+    for attempt in range(attempts):
+        await asyncio.sleep(interval)
+        try:
+            last = await fetch()
+        except Exception as err:
+            _LOGGER.debug("Confirmation read %s failed: %s", attempt + 1, err)
+            continue
+        if confirmed(last):
+            return True, last
+    return False, last
@@ -1,14 +1,14 @@
-from homeassistant.components.sensor import SensorEntity
-from homeassistant.const import UnitOfTemperature
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity, SensorStateClass
+from homeassistant.const import EntityCategory, UnitOfTemperature, UnitOfTime
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-from homeassistant.helpers.entity import DeviceInfo
 import logging
 
-from .const import DOMAIN
-from .utils import status_svg_data_uri
+from .breaker import STATE_CLOSED, STATES as BREAKER_STATES
+from .const import DOMAIN, OP_STATUS
+from .entity import NetflameEntity
+from .utils import status_icon_url
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,26 +28,15 @@ async def async_setup_entry(
         NetflameAlarmSensor(coordinator, entry),
         NetflamePowerSensor(coordinator, entry),
         NetflameStatusSensor(coordinator, entry),
-    ], True)
+        NetflameTemperatureTrendSensor(coordinator, entry),
+        NetflameConnectionSensor(coordinator, entry),
+        NetflameLatencySensor(coordinator, entry),
+        NetflameRequestErrorsSensor(coordinator, entry),
+    ])
 
 
-class NetflameSensorBase(CoordinatorEntity, SensorEntity):
+class NetflameSensorBase(NetflameEntity, SensorEntity):
     """Base class for Netflame sensors providing shared device info."""
-    def __init__(self, coordinator, entry):
-        super().__init__(coordinator)
-        self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        serial = self._entry.data.get("serial")
-        return DeviceInfo(
-            identifiers={(DOMAIN, serial)},
-            name=f"Netflame {serial}",
-            manufacturer="Netflame",
-            model="Pellet Stove",
-            sw_version="1.0",
-        )
 
 
 class NetflameTempSensor(NetflameSensorBase):
@@ -55,6 +44,7 @@ class NetflameTempSensor(NetflameSensorBase):
     
     _attr_native_unit_of_measurement = UnitOfTemperature.CELSIUS
     _attr_icon = "mdi:thermometer"
+    _netflame_fields = frozenset({"temperature"})
 
     def __init__(self, coordinator, entry):
         """Initialize the temperature sensor."""
@@ -66,13 +56,14 @@ class NetflameTempSensor(NetflameSensorBase):
     @property
     def native_value(self):
         """Return the temperature value."""
-        return self.coordinator.data.get("temperature")
+        return self.coordinator.data.temperature
 
 
 class NetflameAlarmSensor(NetflameSensorBase):
     """Netflame Alarm Sensor."""
     
     _attr_icon = "mdi:alert"
+    _netflame_fields = frozenset({"alarms"})
 
     def __init__(self, coordinator, entry):
         """Initialize the alarm sensor."""
@@ -84,7 +75,7 @@ class NetflameAlarmSensor(NetflameSensorBase):
     @property
     def native_value(self):
         """Return the alarm value."""
-        alarms = self.coordinator.data.get("alarms")
+        alarms = self.coordinator.data.alarms
         
         if alarms:
             return alarms.strip()
@@ -93,7 +84,7 @@ class NetflameAlarmSensor(NetflameSensorBase):
     @property
     def icon(self) -> str:
         """Return an icon based on current alarm."""
-        alarms = self.coordinator.data.get("alarms")
+        alarms = self.coordinator.data.alarms
         if alarms == "N":
             return "mdi:check-circle"
 
@@ -104,6 +95,7 @@ class NetflamePowerSensor(NetflameSensorBase):
     """Netflame Power Sensor."""
 
     _attr_icon = "mdi:gauge"
+    _netflame_fields = frozenset({"power"})
 
     def __init__(self, coordinator, entry):
         """Initialize the power sensor."""
@@ -115,13 +107,14 @@ class NetflamePowerSensor(NetflameSensorBase):
     @property
     def native_value(self):
         """Return the current power setting (int)."""
-        return self.coordinator.data.get("power")
+        return self.coordinator.data.power
 
 
 class NetflameStatusSensor(NetflameSensorBase):
     """Netflame Status Sensor."""
 
     _attr_icon = "mdi:fire"
+    _netflame_fields = frozenset({"status"})
 
     def __init__(self, coordinator, entry):
         """Initialize the status sensor."""
@@ -133,10 +126,176 @@ class NetflameStatusSensor(NetflameSensorBase):
     @property
     def native_value(self):
         """Return the numeric status value (0..3)."""
-        return self.coordinator.data.get("status")
+        return self.coordinator.data.status
 
     @property
     def entity_picture(self) -> str | None:
-        """Return a small colored SVG data URI representing the status."""
-        status = self.coordinator.data.get("status")
-        return status_svg_data_uri(status, size=32)
\ No newline at end of file
+        """Return the URL of a small colored icon representing the status."""
+        status = self.coordinator.data.status
+        return status_icon_url(status, size=32)
+
+
+class NetflameTemperatureTrendSensor(NetflameSensorBase):
+    """Temperature rate of change and statistics over the recent readings.
+
+    Computed from the coordinator's in-memory history, so trends don't need
+    a recorder query.
+    """
+
+    _attr_icon = "mdi:chart-line"
+    _attr_native_unit_of_measurement = f"{UnitOfTemperature.CELSIUS}/h"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _netflame_fields = frozenset({"history"})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the temperature trend sensor."""
+        super().__init__(coordinator, entry)
+        serial = entry.data.get("serial")
+        self._attr_name = f"Netflame {serial} Temperature trend"
+        self._attr_unique_id = f"netflame_{serial}_temperature_trend"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the temperature change per hour."""
+        rate = self.coordinator.history.temperature_rate
+        return round(rate, 2) if rate is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return temperature and power statistics and time in each status."""
+        stats = self.coordinator.history.stats()
+        attributes = {
+            key: round(stats[key], 1) if stats[key] is not None else None
+            for key in (
+                "temperature_min",
+                "temperature_max",
+                "temperature_mean",
+                "power_min",
+                "power_max",
+                "power_mean",
+            )
+        }
+        attributes["time_in_state"] = {
+            status: round(seconds) for status, seconds in stats["time_in_state"].items()
+        }
+        attributes["window"] = round(stats["span"])
+        attributes["samples"] = stats["samples"]
+        return attributes
+
+
+class NetflameConnectionSensor(NetflameSensorBase):
+    """State of the circuit breaker guarding the stove's cloud endpoint."""
+
+    _attr_icon = "mdi:cloud-check"
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = list(BREAKER_STATES)
+    _netflame_fields = frozenset({"breaker"})
+
+    def __init__(self, coordinator, entry):
+        """Initialize the connection sensor."""
+        super().__init__(coordinator, entry)
+        serial = entry.data.get("serial")
+        self._attr_name = f"Netflame {serial} Connection"
+        self._attr_unique_id = f"netflame_{serial}_connection"
+
+    @property
+    def available(self) -> bool:
+        """Stay available during outages, which is when it matters."""
+        return True
+
+    @property
+    def native_value(self) -> str:
+        """Return closed, open or half_open."""
+        return self.coordinator.hub.breaker.state
+
+    @property
+    def icon(self) -> str:
+        """Return an icon reflecting whether requests go through."""
+        if self.native_value == STATE_CLOSED:
+            return "mdi:cloud-check"
+        return "mdi:cloud-alert"
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the current probe cooldown and how often the breaker opened."""
+        breaker = self.coordinator.hub.breaker
+        return {"cooldown": breaker.cooldown, "trips": breaker.trips}
+
+
+class NetflameRequestMetricsSensor(NetflameSensorBase):
+    """Base for diagnostic sensors reading the API client's request metrics.
+
+    They change on every poll, so they are disabled by default.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _netflame_fields = frozenset({"metrics"})
+
+    @property
+    def available(self) -> bool:
+        """Stay available during outages, which is when it matters."""
+        return True
+
+
+class NetflameLatencySensor(NetflameRequestMetricsSensor):
+    """95th percentile latency of status reads."""
+
+    _attr_icon = "mdi:timer-outline"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, coordinator, entry):
+        """Initialize the latency sensor."""
+        super().__init__(coordinator, entry)
+        serial = entry.data.get("serial")
+        self._attr_name = f"Netflame {serial} Request latency"
+        self._attr_unique_id = f"netflame_{serial}_request_latency"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the p95 status read latency in milliseconds."""
+        p95 = self.coordinator.api.metrics.percentile(OP_STATUS, 0.95)
+        return round(p95 * 1000) if p95 is not None else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return mean and p95 latency (ms) and request count per operation."""
+        return {
+            name: {
+                "requests": op["requests"],
+                "mean_ms": round(op["latency"]["mean"] * 1000),
+                "p95_ms": round(op["latency"]["p95"] * 1000),
+            }
+            for name, op in self.coordinator.api.metrics.snapshot().items()
+        }
+
+
+class NetflameRequestErrorsSensor(NetflameRequestMetricsSensor):
+    """Failed requests to the stove's cloud endpoint, retries included."""
+
+    _attr_icon = "mdi:cloud-alert"
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    def __init__(self, coordinator, entry):
+        """Initialize the request errors sensor."""
+        super().__init__(coordinator, entry)
+        serial = entry.data.get("serial")
+        self._attr_name = f"Netflame {serial} Request errors"
+        self._attr_unique_id = f"netflame_{serial}_request_errors"
+
+    @property
+    def native_value(self) -> int:
+        """Return the failed requests since the integration started."""
+        return self.coordinator.api.metrics.errors
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return errors by type and timeouts per operation."""
+        return {
+            name: {"errors": op["errors"], "timeouts": op["timeouts"]}
+            for name, op in self.coordinator.api.metrics.snapshot().items()
+            if op["errors"]
+        }
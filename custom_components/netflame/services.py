@@ -0,0 +1,146 @@
+"""Services of the Netflame integration."""
+from __future__ import annotations
+
+import logging
+
+import voluptuous as vol
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+
+from .bulk import not_found, run_bulk
+from .const import (
+    BULK_OPERATIONS,
+    DEFAULT_BULK_CONCURRENCY,
+    DEFAULT_BULK_DEADLINE,
+    DOMAIN,
+    SERVICE_BULK_COMMAND,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+ATTR_SERIALS = "serials"
+ATTR_AREA_ID = "area_id"
+ATTR_OPERATION = "operation"
+ATTR_POWER = "power"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_DEADLINE = "deadline"
+
+
+def _require_power(data: dict) -> dict:
+    if data[ATTR_OPERATION] == "power" and ATTR_POWER not in data:
+        raise vol.Invalid("The power operation needs a power level")
+    return data
+
+
+BULK_COMMAND_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Exclusive(ATTR_SERIALS, "target"): vol.All(cv.ensure_list, [cv.string]),
+            vol.Exclusive(ATTR_AREA_ID, "target"): cv.string,
+            vol.Required(ATTR_OPERATION): vol.In(BULK_OPERATIONS),
+            vol.Optional(ATTR_POWER): vol.All(vol.Coerce(int), vol.Range(min=1, max=9)),
+            vol.Optional(ATTR_CONCURRENCY, default=DEFAULT_BULK_CONCURRENCY): vol.All(
+                vol.Coerce(int), vol.Range(min=1, max=50)
+            ),
+            vol.Optional(ATTR_DEADLINE, default=DEFAULT_BULK_DEADLINE): vol.All(
+                vol.Coerce(float), vol.Range(min=1, max=600)
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_SERIALS, ATTR_AREA_ID),
+    _require_power,
+)
+
+
+def async_register_services(hass: HomeAssistant) -> None:
+    """Register the integration's services."""
+
+    async def async_bulk_command(call: ServiceCall) -> ServiceResponse:
+        return await _async_bulk_command(hass, call)
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_BULK_COMMAND,
+        async_bulk_command,
+        schema=BULK_COMMAND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+def _coordinators(hass: HomeAssistant) -> dict:
+    """Return the coordinators of every set up stove by serial."""
+    return {
+        serial: coordinator
+        for hub in hass.data.get(DOMAIN, {}).get("hubs", {}).values()
+        for serial, coordinator in hub.coordinators.items()
+    }
+
+
+def _serials_in_area(hass: HomeAssistant, area_id: str) -> list[str]:
+    """Return the serials of the stoves whose device or an entity is in `area_id`."""
+    if ar.async_get(hass).async_get_area(area_id) is None:
+        raise ServiceValidationError(f"Unknown area {area_id}")
+    serials = {}
+    for device in dr.async_entries_for_area(dr.async_get(hass), area_id):
+        for domain, identifier in device.identifiers:
+            if domain == DOMAIN:
+                serials[identifier] = None
+    for entity in er.async_entries_for_area(er.async_get(hass), area_id):
+        if entity.platform != DOMAIN or entity.config_entry_id is None:
+            continue
+        entry = hass.config_entries.async_get_entry(entity.config_entry_id)
+        if entry is not None:
+            serials[entry.data["serial"]] = None
+    return list(serials)
+
+
+def _command(api, operation: str, power: int | None):
+    if operation == "on":
+        return api.turn_on
+    if operation == "off":
+        return api.turn_off
+    return lambda: api.set_power(power)
+
+
+async def _async_bulk_command(hass: HomeAssistant, call: ServiceCall) -> ServiceResponse:
+    """Send one operation to many stoves and refresh them once afterwards.
+
+    Commands go straight to the stoves' API clients, bypassing the
+    per-stove coalescing window, so each stove gets a definite result.
+    """
+    data = call.data
+    if ATTR_AREA_ID in data:
+        serials = _serials_in_area(hass, data[ATTR_AREA_ID])
+    else:
+        serials = list(dict.fromkeys(data[ATTR_SERIALS]))
+    if not serials:
+        raise ServiceValidationError("No Netflame stoves to send the command to")
+
+    coordinators = _coordinators(hass)
+    affected = {serial: coordinators[serial] for serial in serials if serial in coordinators}
+    commands = {
+        serial: _command(coordinator.api, data[ATTR_OPERATION], data.get(ATTR_POWER))
+        for serial, coordinator in affected.items()
+    }
+    results = await run_bulk(commands, data[ATTR_CONCURRENCY], data[ATTR_DEADLINE])
+
+    # Every stove that may have received the command is refreshed once, at
+    # fast polling; the hub staggers the refreshes
+    for coordinator in affected.values():
+        coordinator.note_command()
+        hass.async_create_task(coordinator.async_request_refresh())
+
+    _LOGGER.debug(
+        "Netflame bulk %s: %s",
+        data[ATTR_OPERATION],
+        {serial: result["result"] for serial, result in results.items()},
+    )
+    return {
+        "results": {
+            serial: results[serial] if serial in results else not_found() for serial in serials
+        }
+    }
@@ -0,0 +1,107 @@
+"""Bounded capture of protocol exchanges for diagnostics."""
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Optional
+
+from .const import OPERATION_NAMES, TRACE_SIZE
+
+
+class ResponseTrace:
+    """Ring buffers holding the recent protocol activity of one stove.
+
+    Keeps, `size` entries each:
+
+    - the last request/response pairs of every operation, failed attempts
+      and retries included, with their duration
+    - the responses the parsers could not make sense of
+    - the coordinator refreshes, with their duration and outcome
+
+    Only created when debug capture is enabled; API clients and the
+    coordinator skip recording entirely when they have no trace.
+    """
+
+    def __init__(self, size: int = TRACE_SIZE):
+        self.size = size
+        self._exchanges: dict[str, deque] = {}
+        self._parse_failures = deque(maxlen=size)
+        self._refreshes = deque(maxlen=size)
+
+    def record(
+        self,
+        operation: str,
+        body: Optional[str],
+        request: Optional[dict] = None,
+        elapsed: Optional[float] = None,
+        status: Optional[int] = None,
+        error: Optional[BaseException] = None,
+        attempt: int = 0,
+    ) -> None:
+        """Store one attempt at `operation` and its `body` or `error`."""
+        entries = self._exchanges.get(operation)
+        if entries is None:
+            entries = self._exchanges[operation] = deque(maxlen=self.size)
+        # Keep the message, not the exception and the frames it references
+        entries.append((time.time(), operation, body, request, elapsed, status, _error(error), attempt))
+
+    def record_parse_failure(self, operation: str, body: str, reason: str) -> None:
+        """Store a response of `operation` that did not parse cleanly."""
+        self._parse_failures.append((time.time(), operation, body, reason))
+
+    def record_refresh(self, elapsed: float, error: Optional[BaseException] = None) -> None:
+        """Store a coordinator refresh that took `elapsed` seconds."""
+        self._refreshes.append((time.time(), elapsed, _error(error)))
+
+    def as_list(self) -> list[dict]:
+        """Return the captured exchanges of every operation, oldest first."""
+        entries = sorted(
+            (entry for entries in self._exchanges.values() for entry in entries),
+            key=lambda entry: entry[0],
+        )
+        return [_exchange(entry) for entry in entries]
+
+    def as_dict(self) -> dict:
+        """Return everything captured, exchanges grouped by operation name."""
+        return {
+            "exchanges": {
+                OPERATION_NAMES.get(operation, operation): [_exchange(entry) for entry in entries]
+                for operation, entries in self._exchanges.items()
+            },
+            "parse_failures": [
+                {
+                    "time": ts,
+                    "operation": OPERATION_NAMES.get(operation, operation),
+                    "reason": reason,
+                    "body": body,
+                }
+                for ts, operation, body, reason in self._parse_failures
+            ],
+            "refreshes": [
+                {"time": ts, "duration": elapsed, "error": error}
+                for ts, elapsed, error in self._refreshes
+            ],
+        }
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._exchanges.values())
+
+
+def _error(error: Optional[BaseException]) -> Optional[str]:
+    if error is None:
+        return None
+    return f"{type(error).__name__}: {error}"
+
+
+def _exchange(entry: tuple) -> dict:
+    ts, operation, body, request, elapsed, status, error, attempt = entry
+    return {
+        "time": ts,
+        "operation": operation,
+        "attempt": attempt,
+        "request": request,
+        "status": status,
+        "duration": elapsed,
+        "body": body,
+        "error": error,
+    }
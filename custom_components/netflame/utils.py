@@ -1,10 +1,12 @@
 """Utility helpers for Netflame integration.
 
-Shared helpers for generating SVG data URIs and related utilities.
+Shared helpers for generating the status icons, either as SVG data URIs
+or as URLs served by the integration's icon view.
 """
 from __future__ import annotations
 
 import base64
+from functools import lru_cache
 from typing import Optional
 
 
@@ -53,18 +55,79 @@ def get_status_color(status: Optional[int]) -> str:
     return "#9e9e9e"
 
 
-def status_svg_data_uri(status: Optional[int], size: int = 64) -> str:
-    """Return a base64-encoded SVG data URI for a given status.
+# Every status code the stove is known to report
+KNOWN_STATUSES = (0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 20, -2, -3, -4, -20)
+FALLBACK_COLOR = "#9e9e9e"
 
-    The SVG uses the shared `SVG_PATH` and sets `fill` to the color mapped
-    from the status. `size` controls the width/height of the resulting SVG.
-    """
-    color = get_status_color(status)
-    svg = (
+# Precomputed status -> color table; unknown codes use FALLBACK_COLOR
+_STATUS_COLORS = {status: get_status_color(status) for status in KNOWN_STATUSES}
+
+
+# Path of the icon view. The version segment changes whenever the artwork
+# does, so clients may cache every icon URL forever
+ICON_URL = "/api/netflame/icon/v1"
+# Sizes the icon view renders
+ICON_MIN_SIZE = 8
+ICON_MAX_SIZE = 512
+
+
+@lru_cache(maxsize=64)
+def _color_svg(color: str, size: int) -> bytes:
+    return (
         f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
         f'viewBox="0 0 24 24">'
         f'<path d="{SVG_PATH}" fill="{color}"/>'
         f'</svg>'
-    )
-    b64 = base64.b64encode(svg.encode("utf-8")).decode("ascii")
+    ).encode("utf-8")
+
+
+@lru_cache(maxsize=64)
+def _color_svg_data_uri(color: str, size: int) -> str:
+    b64 = base64.b64encode(_color_svg(color, size)).decode("ascii")
     return f"data:image/svg+xml;base64,{b64}"
+
+
+def status_svg_data_uri(status: Optional[int], size: int = 64) -> str:
+    """Return a base64-encoded SVG data URI for a given status.
+
+    The SVG uses the shared `SVG_PATH` and sets `fill` to the color mapped
+    from the status. `size` controls the width/height of the resulting SVG.
+    URIs are cached per (color, size), so the handful of color buckets is
+    rendered once and every later call is a lookup.
+    """
+    return _color_svg_data_uri(_STATUS_COLORS.get(status, FALLBACK_COLOR), size)
+
+
+def status_key(status: Optional[int]) -> str:
+    """Return the icon key of a status: its code, or "unknown"."""
+    return str(status) if status in _STATUS_COLORS else "unknown"
+
+
+def status_icon_url(status: Optional[int], size: int = 64) -> str:
+    """Return the icon view URL of the icon for a given status.
+
+    Unknown codes share the "unknown" URL, drawn with FALLBACK_COLOR.
+    """
+    return f"{ICON_URL}/{status_key(status)}_{size}.svg"
+
+
+def icon_svg(name: str) -> Optional[bytes]:
+    """Return the SVG named `name` by `status_icon_url`, or None.
+
+    `name` is the last path segment, "<status key>_<size>.svg".
+    """
+    key, sep, rest = name.partition("_")
+    size, ext = rest[:-4], rest[-4:]
+    if not sep or ext != ".svg" or not (size.isascii() and size.isdigit()):
+        return None
+    size = int(size)
+    if not ICON_MIN_SIZE <= size <= ICON_MAX_SIZE:
+        return None
+    color = _ICON_COLORS.get(key)
+    if color is None:
+        return None
+    return _color_svg(color, size)
+
+
+_ICON_COLORS = {status_key(status): color for status, color in _STATUS_COLORS.items()}
+_ICON_COLORS["unknown"] = FALLBACK_COLOR
@@ -0,0 +1,35 @@
+"""HTTP view serving the Netflame status icons."""
+from __future__ import annotations
+
+from aiohttp import web
+from homeassistant.components.http import HomeAssistantView
+
+from .utils import ICON_URL, icon_svg
+
+# Icon URLs are versioned, so what one serves never changes
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class NetflameIconView(HomeAssistantView):
+    """Serve the status icons that entity pictures point to.
+
+    Entity pictures used to be SVG data URIs, which put hundreds of bytes
+    into every recorded state; a URL keeps the attribute short. The icons
+    carry nothing private and are loaded by plain image requests, so no
+    authentication is required.
+    """
+
+    url = ICON_URL + "/{name}"
+    name = "api:netflame:icon"
+    requires_auth = False
+
+    async def get(self, request: web.Request, name: str) -> web.Response:
+        """Return the SVG icon `name`."""
+        svg = icon_svg(name)
+        if svg is None:
+            return web.Response(status=404)
+        return web.Response(
+            body=svg,
+            content_type="image/svg+xml",
+            headers={"Cache-Control": CACHE_CONTROL},
+        )
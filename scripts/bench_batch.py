@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Compare batched and separate Netflame requests against the mock server.
+
+Usage:
+  python scripts/bench_batch.py [--rounds N] [--latency S]
+
+Reads status + alarms of one stove `--rounds` times on one aiohttp session:
+
+- `sequential`: one request after the other, as separate POSTs
+- `concurrent`: both requests at once on two pooled connections, which is
+  how `get_snapshot` reads a server without known batch support
+- `batch`: `AsyncNetflameApi.batch` against a server accepting batches,
+  one POST per round
+- `back to back`: `AsyncNetflameApi.batch` against a server started with
+  `--no-batch`, falling back to sequential requests on the kept-alive
+  connection
+
+For each it reports the requests made and the mean time per round.
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import sys
+import threading
+import time
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import mock_netflame_server as mock  # noqa: E402
+from custom_components.netflame import api as api_mod  # noqa: E402
+
+
+async def run_mode(api_mod, base_url, mode, rounds):
+    """Return (requests, seconds per round) of `rounds` reads in `mode`."""
+    import aiohttp
+
+    operations = [{"idOperacion": api_mod.OP_STATUS}, {"idOperacion": api_mod.OP_ALARMS}]
+    async with aiohttp.ClientSession() as session:
+        api = api_mod.AsyncNetflameApi("stove", "p", session, base_url=base_url)
+        # Open the connection and, for batches, find out whether the server
+        # accepts them before timing
+        await api.batch(operations) if mode in ("batch", "back to back") else await api.get_status()
+        requests = api.requests
+        start = time.perf_counter()
+        for _ in range(rounds):
+            if mode == "sequential":
+                await api.get_status()
+                await api.get_alarms()
+            elif mode == "concurrent":
+                await asyncio.gather(api.get_status(), api.get_alarms())
+            else:
+                await api.batch(operations)
+        elapsed = time.perf_counter() - start
+    return api.requests - requests, elapsed / rounds
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mock server response delay (s)")
+    args = parser.parse_args()
+
+    print(f"{args.rounds} rounds of status + alarms, {args.latency * 1000:.0f} ms latency")
+    print(f"{'mode':<14}{'requests':>10}{'ms/round':>10}")
+    for mode in ("sequential", "concurrent", "batch", "back to back"):
+        # A fresh mock server module per mode: its settings are module globals
+        importlib.reload(mock)
+        mock.LOG.setLevel("WARNING")
+        mock.LATENCY = args.latency
+        mock.BATCHING = mode != "back to back"
+        server = mock.MockServer(("127.0.0.1", 0), mock.MockHandler)
+        host, port = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            requests, per_round = asyncio.run(run_mode(api_mod, f"http://{host}:{port}/", mode, args.rounds))
+        finally:
+            server.shutdown()
+            server.server_close()
+        print(f"{mode:<14}{requests:>10}{per_round * 1000:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
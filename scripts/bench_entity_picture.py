@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Benchmark the entity_picture cost of one Netflame state write.
+
+Usage:
+  python scripts/bench_entity_picture.py [--number N]
+
+A coordinator update renders the status picture three times: the climate
+entity's `entity_picture` and `extra_state_attributes` (64 px) and the
+status sensor's `entity_picture` (32 px). This compares rendering them
+from scratch, as before, with the cached `status_svg_data_uri`.
+"""
+import argparse
+import base64
+import os
+import sys
+import timeit
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from custom_components.netflame import utils  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=100000, help="State writes per measurement")
+    args = parser.parse_args()
+
+    def uncached(status, size):
+        color = utils.get_status_color(status)
+        svg = (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{size}" height="{size}" '
+            f'viewBox="0 0 24 24">'
+            f'<path d="{utils.SVG_PATH}" fill="{color}"/>'
+            f'</svg>'
+        )
+        b64 = base64.b64encode(svg.encode("utf-8")).decode("ascii")
+        return f"data:image/svg+xml;base64,{b64}"
+
+    statuses = list(utils.KNOWN_STATUSES) + [None, 99]
+
+    def state_write(render):
+        def run():
+            for status in statuses:
+                render(status, 64)
+                render(status, 64)
+                render(status, 32)
+        return run
+
+    writes = args.number
+    loops = max(1, writes // len(statuses))
+    before = timeit.timeit(state_write(uncached), number=loops) / (loops * len(statuses))
+    after = timeit.timeit(state_write(utils.status_svg_data_uri), number=loops) / (loops * len(statuses))
+
+    print(f"before: {before * 1e6:8.2f} us per state write")
+    print(f"after:  {after * 1e6:8.2f} us per state write")
+    print(f"speedup x{before / after:.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
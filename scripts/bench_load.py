@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Load test for the Netflame polling path against the mock server.
+
+Usage:
+  python scripts/bench_load.py [--stoves N] [--rounds R] [--mode sync|async]
+                               [--latency S] [--jitter S] [--error-rate F]
+                               [--workers W] [--output FILE]
+
+Starts `mock_netflame_server.py` in-process with the requested
+latency, jitter and error rate, then refreshes N simulated stoves R times:
+
+- `sync` runs `NetflameApi.get_status` + `get_alarms` as executor jobs on a
+  pool of W threads, like the integration used to.
+- `async` runs `AsyncNetflameApi.get_snapshot` on one aiohttp session, like
+  the integration does now.
+
+Results (refresh latency p50/p95/p99, requests per second, executor thread
+occupancy, peak traced memory, and the clients' own per-operation request
+metrics) are printed and written as JSON so runs can be compared across
+releases.
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+PACKAGE_DIR = os.path.join(PROJECT_ROOT, "custom_components", "netflame")
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import mock_netflame_server as mock  # noqa: E402
+from custom_components.netflame import api as api_mod  # noqa: E402
+from custom_components.netflame.metrics import RequestMetrics  # noqa: E402
+
+
+def _percentiles(samples):
+    if len(samples) < 2:
+        value = samples[0] if samples else None
+        return {"p50": value, "p95": value, "p99": value}
+    q = statistics.quantiles(samples, n=100, method="inclusive")
+    return {"p50": q[49], "p95": q[94], "p99": q[98]}
+
+
+def run_sync(api_mod, base_url, args, metrics):
+    """Refresh every stove through executor jobs; return (latencies, requests, errors, busy)."""
+    stoves = [
+        api_mod.NetflameApi(f"stove{i}", "p", base_url=base_url, metrics=metrics)
+        for i in range(args.stoves)
+    ]
+    lock = threading.Lock()
+    busy = 0.0
+    requests = 0
+    errors = 0
+
+    def job(func):
+        nonlocal busy, requests, errors
+        start = time.perf_counter()
+        try:
+            return func()
+        except Exception:
+            with lock:
+                errors += 1
+            raise
+        finally:
+            with lock:
+                busy += time.perf_counter() - start
+                requests += 1
+
+    latencies = []
+    with ThreadPoolExecutor(max_workers=args.workers) as executor:
+
+        async def refresh(loop, stove):
+            start = time.perf_counter()
+            try:
+                await loop.run_in_executor(executor, job, stove.get_status)
+                await loop.run_in_executor(executor, job, stove.get_alarms)
+            except Exception:
+                return
+            latencies.append(time.perf_counter() - start)
+
+        async def main():
+            loop = asyncio.get_running_loop()
+            for _ in range(args.rounds):
+                await asyncio.gather(*(refresh(loop, s) for s in stoves))
+
+        asyncio.run(main())
+
+    return latencies, requests, errors, busy
+
+
+def run_async(api_mod, base_url, args, metrics):
+    """Refresh every stove with AsyncNetflameApi; return (latencies, requests, errors, busy)."""
+    import aiohttp
+
+    latencies = []
+    errors = 0
+
+    async def main():
+        nonlocal errors
+        async with aiohttp.ClientSession() as session:
+            stoves = [
+                api_mod.AsyncNetflameApi(f"stove{i}", "p", session, base_url=base_url, metrics=metrics)
+                for i in range(args.stoves)
+            ]
+
+            async def refresh(stove):
+                nonlocal errors
+                start = time.perf_counter()
+                try:
+                    await stove.get_snapshot()
+                except Exception:
+                    errors += 1
+                    return
+                latencies.append(time.perf_counter() - start)
+
+            for _ in range(args.rounds):
+                await asyncio.gather(*(refresh(s) for s in stoves))
+
+    asyncio.run(main())
+    # get_snapshot issues status + alarms by default and keeps the last alarms on
+    # an alarms error, so only failed refreshes are counted as errors here.
+    # No executor threads are used.
+    return latencies, 2 * args.stoves * args.rounds, errors, 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stoves", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--mode", choices=("sync", "async"), default="sync")
+    parser.add_argument("--workers", type=int, default=8, help="Executor threads in sync mode")
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--output", help="Write JSON results to this file (default: stdout only)")
+    args = parser.parse_args()
+
+    # Quiet the API's per-request error logging when injecting errors
+    import logging
+    logging.getLogger("custom_components.netflame").setLevel(logging.CRITICAL)
+
+    mock.LOG.setLevel(logging.WARNING)
+    mock.LATENCY = args.latency
+    mock.JITTER = args.jitter
+    mock.ERROR_RATE = args.error_rate
+
+    server = mock.MockServer(("127.0.0.1", 0), mock.MockHandler)
+    host, port = server.server_address
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://{host}:{port}/"
+
+    runner = run_sync if args.mode == "sync" else run_async
+    # Shared by all simulated stoves
+    metrics = RequestMetrics()
+    tracemalloc.start()
+    start = time.perf_counter()
+    try:
+        latencies, requests, errors, busy = runner(api_mod, base_url, args, metrics)
+    finally:
+        wall = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        server.shutdown()
+        server.server_close()
+
+    with open(os.path.join(PACKAGE_DIR, "manifest.json")) as f:
+        version = json.load(f)["version"]
+
+    results = {
+        "benchmark": "netflame_load",
+        "version": version,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "params": vars(args),
+        "refreshes": len(latencies),
+        "failed_refreshes": args.stoves * args.rounds - len(latencies),
+        "request_errors": errors,
+        "latency_seconds": _percentiles(latencies),
+        "requests_per_second": requests / wall if wall else None,
+        "executor_occupancy": busy / (wall * args.workers) if args.mode == "sync" else 0.0,
+        "peak_memory_bytes": peak,
+        "wall_seconds": wall,
+        "operations": metrics.snapshot(),
+    }
+
+    text = json.dumps(results, indent=2)
+    print(text)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(text + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for the Netflame response parsers.
+
+Usage:
+  python scripts/bench_parser.py [--number N]
+
+Compares `custom_components/netflame/parser.py` against the previous
+split/startswith implementation on typical, large and malformed bodies and
+prints throughput (parses per second) and peak memory per parse.
+"""
+import argparse
+import os
+import sys
+import timeit
+import tracemalloc
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from custom_components.netflame import parser as mod  # noqa: E402
+
+
+def legacy_get_status(raw):
+    status = None
+    temperature = None
+    power = None
+
+    for line in raw.split("\n"):
+        if line.startswith("estado="):
+            try:
+                status = int(line.replace("estado=", "").strip())
+            except Exception:
+                status = None
+        if line.startswith("temperatura="):
+            try:
+                temperature = float(line.replace("temperatura=", "").strip())
+            except Exception:
+                temperature = None
+        if line.startswith("consigna_potencia=") or line.startswith("consigna_pot="):
+            try:
+                power = int(line.split("=")[1].strip())
+            except Exception:
+                power = None
+
+    return {"raw": raw, "status": status, "temperature": temperature, "power": power}
+
+
+def legacy_get_alarms(raw):
+    lines = [l.strip() for l in raw.split("\n") if l.strip()]
+    fixed_data = [l for l in lines if "error" not in l.lower()]
+    if len(fixed_data) < 2:
+        return None
+    if fixed_data[1] != "0":
+        return None
+    if "=" in fixed_data[0]:
+        return fixed_data[0].split("=", 1)[1].strip()
+    return fixed_data[0].strip()
+
+
+STATUS_BODIES = {
+    "typical": "estado=7\ntemperatura=21.5\nconsigna_potencia=3\n",
+    "large": "".join(f"campo{i}=valor{i}\n" for i in range(2000))
+    + "estado=7\ntemperatura=21.5\nconsigna_potencia=3\n",
+    "malformed": "estado=\x00\r\n===\ntemperatura=abc\n" * 500 + "consigna_pot=9=9\n" * 500,
+}
+
+ALARM_BODIES = {
+    "typical": "alarma=N\n0\n",
+    "large": "alarma=N\n0\n" + "relleno\n" * 5000,
+    "malformed": "ERROR timeout\n" * 2000 + "\n\n  \nalarma=E\n0\n",
+}
+
+
+def _peak_bytes(func, body):
+    tracemalloc.start()
+    func(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def _row(kind, name, func, body, number):
+    seconds = timeit.timeit(lambda: func(body), number=number)
+    rate = number / seconds
+    peak = _peak_bytes(func, body)
+    print(f"{kind:<8} {name:<10} {func.__name__:<22} {rate:>12,.0f}/s {peak:>10,} B")
+    return rate
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--number", type=int, default=2000, help="Parses per measurement")
+    args = parser.parse_args()
+
+    print(f"{'op':<8} {'body':<10} {'parser':<22} {'throughput':>14} {'peak mem':>12}")
+    for name, body in STATUS_BODIES.items():
+        old = _row("status", name, legacy_get_status, body, args.number)
+        new = _row("status", name, mod.parse_status, body, args.number)
+        print(f"{'':<19} speedup x{new / old:.2f}")
+    for name, body in ALARM_BODIES.items():
+        old = _row("alarms", name, legacy_get_alarms, body, args.number)
+        new = _row("alarms", name, mod.parse_alarms, body, args.number)
+        print(f"{'':<19} speedup x{new / old:.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Estimate the recorder database growth caused by Netflame entity pictures.
+
+Usage:
+  python scripts/bench_recorder.py [--days N] [--stoves N] [--seed N]
+
+Simulates a stove's day (off overnight, ignition in the morning, on all
+day, shutdown at night) polled at the adaptive intervals, and records the
+climate entity and the status sensor the way Home Assistant's recorder
+does: a `states` row for every state or attribute change, and a
+`state_attributes` row for every attribute set not seen before, stored as
+compact JSON. Attributes climate entities exclude from recording (modes,
+temperature limits) are left out.
+
+Both variants are written to an SQLite file:
+
+- `data URI`: `entity_picture` holds the base64 SVG data URI
+- `URL`: `entity_picture` holds the icon view URL
+
+It reports the rows written, the bytes of attribute JSON and the size of
+the resulting database file.
+"""
+import argparse
+import json
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import zlib
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+from custom_components.netflame import utils  # noqa: E402
+
+SCHEMA = """
+CREATE TABLE states (
+    state_id INTEGER PRIMARY KEY,
+    metadata_id INTEGER,
+    state TEXT,
+    attributes_id INTEGER,
+    last_updated_ts REAL
+);
+CREATE TABLE state_attributes (
+    attributes_id INTEGER PRIMARY KEY,
+    hash INTEGER,
+    shared_attrs TEXT
+);
+CREATE INDEX ix_states_metadata_id_last_updated_ts ON states (metadata_id, last_updated_ts);
+CREATE INDEX ix_state_attributes_hash ON state_attributes (hash);
+"""
+
+
+def simulate_day(rng, start):
+    """Yield (timestamp, status, temperature, power) polls of one day."""
+    # (hour, status) at which each phase starts
+    phases = [(0, 0), (7, 2), (7.25, 7), (23, 8), (23.25, 0)]
+    intervals = {0: 300, 2: 10, 7: 60, 8: 10}
+    temperature, power = 17.0, 4
+    t = 0.0
+    while t < 86400:
+        hour = t / 3600
+        status = [s for h, s in phases if h <= hour][-1]
+        target = 23.0 if status in (2, 7) else 16.0
+        temperature += (target - temperature) * 0.02 + rng.uniform(-0.1, 0.1)
+        if status == 7 and rng.random() < 0.01:
+            power = rng.randint(3, 6)
+        yield start + t, status, round(temperature, 1), power
+        t += intervals[status]
+
+
+def record(db, variant, utils, args):
+    """Write the simulated days of every stove.
+
+    Returns the states rows, the state_attributes rows and their JSON bytes.
+    """
+    rng = random.Random(args.seed)
+    picture = utils.status_svg_data_uri if variant == "data URI" else utils.status_icon_url
+    seen = {}
+    last = {}
+    states = 0
+    for day in range(args.days):
+        for stove in range(args.stoves):
+            serial = f"stove{stove}"
+            for ts, status, temperature, power in simulate_day(rng, day * 86400):
+                entities = {
+                    2 * stove: (
+                        "off" if status in (0, 8) else "heat",
+                        {
+                            "current_temperature": temperature,
+                            "preset_mode": f"Power {power}",
+                            "icon": "mdi:fire" if status in (2, 7) else "mdi:fire-off",
+                            "friendly_name": f"Netflame {serial}",
+                            "supported_features": 16,
+                            "entity_picture": picture(status, size=64),
+                        },
+                    ),
+                    2 * stove + 1: (
+                        str(status),
+                        {
+                            "icon": "mdi:fire",
+                            "friendly_name": f"Netflame {serial} Status",
+                            "entity_picture": picture(status, size=32),
+                        },
+                    ),
+                }
+                for metadata_id, (state, attributes) in entities.items():
+                    shared = json.dumps(attributes, separators=(",", ":"))
+                    if last.get(metadata_id) == (state, shared):
+                        continue
+                    last[metadata_id] = (state, shared)
+                    attributes_id = seen.get(shared)
+                    if attributes_id is None:
+                        attributes_id = db.execute(
+                            "INSERT INTO state_attributes (hash, shared_attrs) VALUES (?, ?)",
+                            (zlib.crc32(shared.encode()), shared),
+                        ).lastrowid
+                        seen[shared] = attributes_id
+                    db.execute(
+                        "INSERT INTO states (metadata_id, state, attributes_id, last_updated_ts) VALUES (?, ?, ?, ?)",
+                        (metadata_id, state, attributes_id, ts),
+                    )
+                    states += 1
+    db.commit()
+    return states, len(seen), sum(len(shared) for shared in seen)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--days", type=int, default=1)
+    parser.add_argument("--stoves", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{args.days} day(s), {args.stoves} stove(s)")
+    print(f"{'entity_picture':<16}{'states':>8}{'attr rows':>11}{'attr bytes':>12}{'db bytes':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        for variant in ("data URI", "URL"):
+            path = os.path.join(directory, f"{variant.replace(' ', '_')}.db")
+            db = sqlite3.connect(path)
+            db.executescript(SCHEMA)
+            states, rows, size = record(db, variant, utils, args)
+            db.execute("VACUUM")
+            db.close()
+            print(f"{variant:<16}{states:>8}{rows:>11}{size:>12}{os.path.getsize(path):>11}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
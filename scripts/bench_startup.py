@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Compare Netflame setup time with and without the snapshot cache.
+
+Usage:
+  python scripts/bench_startup.py [--stoves N] [--latency S]
+
+Without a cached snapshot, every config entry waits for a live refresh
+(status + alarms through its hub's refresh slots) before its entities can
+be created. With one, setup only reads the stored JSON snapshot and the
+live refresh runs afterwards in the background. The platforms add their
+entities without `update_before_add`, which would otherwise make setup
+wait for a coordinator refresh in both cases.
+
+This replays both paths outside Home Assistant: N stoves set up
+concurrently against the mock server with the given latency, versus N
+snapshot files written and read back the way the storage helper does.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import mock_netflame_server as mock  # noqa: E402
+from custom_components.netflame import hub as hub_mod  # noqa: E402
+from custom_components.netflame import parser as parser_mod  # noqa: E402
+
+
+async def live_setup(hub_mod, base_url, stoves):
+    """Return the seconds until every stove finished its first refresh."""
+    hub = hub_mod.NetflameHub(base_url)
+    apis = [hub.create_api(f"stove{i}", "p") for i in range(stoves)]
+
+    async def first_refresh(api):
+        async with hub.refresh_slot():
+            return await api.get_snapshot()
+
+    start = time.perf_counter()
+    try:
+        await asyncio.gather(*(first_refresh(api) for api in apis))
+    finally:
+        await hub.async_close()
+    return time.perf_counter() - start
+
+
+def cached_setup(parser_mod, directory, stoves):
+    """Return the seconds to load every stove's stored snapshot."""
+    record = parser_mod.StatusRecord(status=7, temperature=21.5, power=3, alarms="N")
+    paths = []
+    for i in range(stoves):
+        path = os.path.join(directory, f"netflame.stove{i}")
+        with open(path, "w") as f:
+            json.dump({"version": 1, "data": {"record": record.as_dict()}}, f)
+        paths.append(path)
+
+    start = time.perf_counter()
+    for path in paths:
+        with open(path) as f:
+            parser_mod.StatusRecord.from_dict(json.load(f)["data"]["record"])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--stoves", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.3, help="Mock server response delay (s)")
+    args = parser.parse_args()
+
+    mock.LOG.setLevel("WARNING")
+    mock.LATENCY = args.latency
+    server = mock.MockServer(("127.0.0.1", 0), mock.MockHandler)
+    host, port = server.server_address
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        live = asyncio.run(live_setup(hub_mod, f"http://{host}:{port}/", args.stoves))
+    finally:
+        server.shutdown()
+        server.server_close()
+    with tempfile.TemporaryDirectory() as directory:
+        cached = cached_setup(parser_mod, directory, args.stoves)
+
+    print(f"{args.stoves} stoves, {args.latency * 1000:.0f} ms latency")
+    print(f"  live first refresh: {live * 1000:10.1f} ms")
+    print(f"  cached snapshot:    {cached * 1000:10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""Compare bandwidth and latency of the Netflame update modes.
+
+Usage:
+  python scripts/bench_update_mode.py [--duration S] [--change-period S] [--seed N]
+
+Simulates one stove for `--duration` seconds during which its state
+changes at random, on average every `--change-period` seconds, and follows
+it with each update mode against the mock server:
+
+- `interval`: status + alarms every normal interval (60 s), and every
+  fast interval (10 s) for the same detection delay as `changes`
+- `changes` (ETag): status fingerprint every fast interval (10 s), the
+  server answering 304 Not Modified while nothing changed; alarms on change
+  or every 60 s
+- `changes` (hash): the same against a server without ETag support, where
+  the client hashes every status body itself
+
+For each mode it reports the requests made, the response bytes sent by the
+server (status line, headers and body), and how long each state change
+took to be seen. Time is simulated: polls run back to back and the state
+changes due before each poll are applied to the mock stove first, so the
+results are deterministic for a given seed.
+"""
+import argparse
+import asyncio
+import importlib
+import os
+import random
+import statistics
+import sys
+import threading
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+import mock_netflame_server as mock  # noqa: E402
+from custom_components.netflame import api as api_mod  # noqa: E402
+from custom_components.netflame import polling  # noqa: E402
+
+FAST = 10
+NORMAL = 60
+
+
+def _counting_handler(mock, counter):
+    """Return a MockHandler subclass adding every byte it writes to `counter`."""
+
+    class CountingWriter:
+        def __init__(self, raw):
+            self._raw = raw
+
+        def write(self, data):
+            with counter["lock"]:
+                counter["bytes"] += len(data)
+            return self._raw.write(data)
+
+        def __getattr__(self, name):
+            return getattr(self._raw, name)
+
+    class CountingHandler(mock.MockHandler):
+        def setup(self):
+            super().setup()
+            self.wfile = CountingWriter(self.wfile)
+
+    return CountingHandler
+
+
+async def follow(api_mod, polling, mock, base_url, mode, interval, args, events):
+    """Follow the stove in `mode`; return (requests, detection delays)."""
+    import aiohttp
+
+    device = mock.get_device("stove")
+    pending = list(events)
+    seen = {}
+    async with aiohttp.ClientSession() as session:
+        api = api_mod.AsyncNetflameApi("stove", "p", session, base_url=base_url)
+        watch = polling.StatusWatch(interval=FAST, alarms_every=NORMAL)
+        now = 0.0
+        while now < args.duration:
+            while pending and pending[0][0] <= now:
+                device.temperature = pending.pop(0)[1]
+            if mode == "changes":
+                fingerprint, status = await api.get_status_if_changed(watch.fingerprint)
+                if watch.observe(fingerprint, status is not None, now):
+                    await api.get_alarms()
+            else:
+                status = await api.get_snapshot()
+            if status is not None and status.temperature not in seen:
+                seen[status.temperature] = now
+            now += interval
+
+    delays = [seen[temp] - at for at, temp in events if temp in seen]
+    return api.requests, delays
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--duration", type=float, default=3600, help="Simulated seconds per mode")
+    parser.add_argument("--change-period", type=float, default=300, help="Mean seconds between state changes")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    # State changes at random times; each one sets a unique temperature so
+    # the client side can tell when it first saw it
+    rng = random.Random(args.seed)
+    events, at = [], 0.0
+    while (at := at + rng.expovariate(1 / args.change_period)) < args.duration:
+        events.append((at, round(30.0 + len(events) / 10, 1)))
+
+    print(f"{args.duration:.0f} s simulated, {len(events)} state changes")
+    print(f"{'mode':<18}{'poll s':>7}{'requests':>10}{'bytes':>10}{'mean delay s':>14}{'max delay s':>13}")
+    runs = (
+        ("interval", NORMAL, True),
+        ("interval", FAST, True),
+        ("changes (ETag)", FAST, True),
+        ("changes (hash)", FAST, False),
+    )
+    for mode, interval, etags in runs:
+        # A fresh mock server module per mode: its settings and stove state
+        # are module globals
+        importlib.reload(mock)
+        mock.LOG.setLevel("WARNING")
+        mock.TEMPERATURE_DRIFT = 0
+        mock.ETAGS = etags
+        counter = {"bytes": 0, "lock": threading.Lock()}
+        server = mock.MockServer(("127.0.0.1", 0), _counting_handler(mock, counter))
+        host, port = server.server_address
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+        try:
+            requests, delays = asyncio.run(
+                follow(api_mod, polling, mock, f"http://{host}:{port}/", mode.split()[0], interval, args, events)
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+        mean = statistics.mean(delays) if delays else float("nan")
+        worst = max(delays) if delays else float("nan")
+        print(f"{mode:<18}{interval:>7}{requests:>10}{counter['bytes']:>10}{mean:>14.1f}{worst:>13.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
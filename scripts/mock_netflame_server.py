@@ -9,12 +9,34 @@ Default: HOST=0.0.0.0 PORT=11417
 The server accepts POST requests and expects form-encoded
 parameters like idOperacion and others. It returns plain text responses similar to
 what the real Netflame endpoint returns so you can run the integration locally.
+
+Each HTTP basic-auth username (the stove serial) gets its own simulated
+stove, so one server can stand in for many devices. Requests without
+credentials share a default stove whose state lives in the module-level
+`_STATUS`, `_TEMPERATURE` and `_POWER` globals.
+
+Status responses carry an ETag; a status request whose If-None-Match
+matches it is answered with 304 Not Modified and no body. `--no-etag`
+turns this off to behave like an endpoint without conditional requests.
+
+A POST may carry several operation codes, comma separated, in
+`operaciones` instead of `idOperacion`. They are run in order and answered
+in one response marked with an `X-Netflame-Batch` header, holding a
+`[code]` line followed by the usual body for each operation. `--no-batch`
+turns this off to behave like an endpoint that only takes one operation
+per request.
 """
 import argparse
-from http.server import HTTPServer, BaseHTTPRequestHandler
+import base64
+import hashlib
+import heapq
+import itertools
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
 from urllib.parse import parse_qs
 import logging
 import threading
+import time
 
 LOG = logging.getLogger("mock_netflame")
 LOG.setLevel(logging.INFO)
@@ -24,59 +46,200 @@ OP_ONOFF = "1013"
 OP_STATUS = "1002"
 OP_POWER = "1004"
 OP_ALARMS = "1079"
+BATCH_FIELD = "operaciones"
+BATCH_HEADER = "X-Netflame-Batch"
 
 import random
 
-# Mutable mock state
-_STATUS = 0  # 0 = off, 1 = turning off, 2 = turning on, 3 = on, 
+# Mutable state of the default stove (requests without credentials)
+_STATUS = 0  # 0 = off, 2 = turning on, 7 = on, 8 = turning off
 _TEMPERATURE = 23.5
 _POWER = 5
 
-# Lock and timer to manage delayed transitions (e.g., 2 -> 3, 1 -> 0)
+# Guards every stove's state and the transition queue
 _STATE_LOCK = threading.Lock()
-_transition_timer = None
 # Default transition delay in seconds; configurable via CLI --transition-delay
 TRANSITION_DELAY = 20.0
+# Artificial per-request latency in seconds; configurable via CLI --latency
+LATENCY = 0.0
+# Extra random latency, uniformly drawn from [0, JITTER] seconds; CLI --jitter
+JITTER = 0.0
+# Fraction of requests answered with HTTP 500; CLI --error-rate
+ERROR_RATE = 0.0
+# Seconds spent trickling each response body after the headers; CLI --slow-body
+SLOW_BODY = 0.0
+# Largest random temperature change applied on each status read; CLI --temperature-drift
+TEMPERATURE_DRIFT = 0.5
+# Send ETags and honour If-None-Match on status reads; CLI --no-etag
+ETAGS = True
+# Answer batched operations; CLI --no-batch
+BATCHING = True
+
+
+class DeviceState:
+    """State of one simulated stove."""
+
+    def __init__(self):
+        self.status = 0
+        self.temperature = 23.5
+        self.power = 5
+        # Incremented on every scheduled transition so superseded ones are ignored
+        self.transition = 0
+
+
+class _DefaultDeviceState(DeviceState):
+    """Default stove, backed by the module globals for backwards compatibility."""
+
+    def __init__(self):
+        self.transition = 0
+
+    @property
+    def status(self):
+        return _STATUS
+
+    @status.setter
+    def status(self, value):
+        global _STATUS
+        _STATUS = value
+
+    @property
+    def temperature(self):
+        return _TEMPERATURE
+
+    @temperature.setter
+    def temperature(self, value):
+        global _TEMPERATURE
+        _TEMPERATURE = value
+
+    @property
+    def power(self):
+        return _POWER
+
+    @power.setter
+    def power(self, value):
+        global _POWER
+        _POWER = value
+
+
+_DEFAULT_DEVICE = _DefaultDeviceState()
+_DEVICES = {}
+
+
+def get_device(serial=None):
+    """Return the state of stove `serial`, creating it on first use."""
+    if serial is None:
+        return _DEFAULT_DEVICE
+    with _STATE_LOCK:
+        device = _DEVICES.get(serial)
+        if device is None:
+            device = _DEVICES[serial] = DeviceState()
+        return device
+
+
+class _TransitionScheduler:
+    """Apply delayed state transitions for every stove from one thread.
+
+    Pending transitions sit in a heap ordered by due time; a single daemon
+    thread sleeps until the earliest one is due. This replaces one
+    `threading.Timer` thread per transition.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._seq = itertools.count()
+        self._wakeup = threading.Condition(_STATE_LOCK)
+        self._thread = None
 
-def _schedule_transition(intermediate_status, final_status, delay=None):
+    def schedule(self, device, intermediate_status, final_status, delay):
+        """Set `intermediate_status` now and `final_status` after `delay` seconds.
+
+        A later call for the same device supersedes a pending transition.
+        """
+        with self._wakeup:
+            device.transition += 1
+            device.status = intermediate_status
+            due = time.monotonic() + delay
+            heapq.heappush(self._heap, (due, next(self._seq), device, device.transition, final_status))
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="mock-netflame-transitions", daemon=True)
+                self._thread.start()
+            self._wakeup.notify()
+
+    def _run(self):
+        with self._wakeup:
+            while True:
+                if not self._heap:
+                    self._wakeup.wait()
+                    continue
+                due, _, device, transition, final_status = self._heap[0]
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+                heapq.heappop(self._heap)
+                if device.transition == transition:
+                    device.status = final_status
+                    LOG.info("State transitioned to %s", final_status)
+
+
+_SCHEDULER = _TransitionScheduler()
+
+
+def _schedule_transition(intermediate_status, final_status, delay=None, device=None):
     """Set intermediate status immediately and schedule final_status after delay seconds.
 
     If `delay` is None, uses the module-level `TRANSITION_DELAY` value so this
-    behavior can be configured at startup.
+    behavior can be configured at startup. `device` defaults to the default
+    stove.
     """
-    global _STATUS, _transition_timer
     if delay is None:
         delay = TRANSITION_DELAY
-    with _STATE_LOCK:
-        # cancel any pending transition
-        if _transition_timer is not None:
-            try:
-                _transition_timer.cancel()
-            except Exception:
-                pass
-            _transition_timer = None
-        _STATUS = intermediate_status
-        LOG.info("Scheduled state change: %s -> %s in %s seconds", intermediate_status, final_status, delay)
-
-        def _do_final():
-            global _STATUS, _transition_timer
-            with _STATE_LOCK:
-                _STATUS = final_status
-                _transition_timer = None
-            LOG.info("State transitioned to %s", final_status)
+    if device is None:
+        device = _DEFAULT_DEVICE
+    _SCHEDULER.schedule(device, intermediate_status, final_status, delay)
+    LOG.info("Scheduled state change: %s -> %s in %s seconds", intermediate_status, final_status, delay)
 
-        _transition_timer = threading.Timer(delay, _do_final)
-        _transition_timer.daemon = True
-        _transition_timer.start()
 
 class MockHandler(BaseHTTPRequestHandler):
-    def _send_text(self, text: str, code: int = 200):
+    # Keep connections alive so clients can reuse them between requests
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; with Nagle's algorithm the
+    # body waits for the client's delayed ACK on kept-alive connections
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        # A single-threaded server would stall other clients behind a kept-alive connection
+        if not isinstance(self.server, ThreadingMixIn):
+            self.protocol_version = "HTTP/1.0"
+
+    def _send_text(self, text: str, code: int = 200, headers=None):
         b = text.encode("utf-8")
         self.send_response(code)
         self.send_header("Content-Type", "text/plain; charset=utf-8")
         self.send_header("Content-Length", str(len(b)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
         self.end_headers()
-        self.wfile.write(b)
+        if SLOW_BODY > 0 and len(b) > 1:
+            # Trickle the body in small chunks
+            chunks = [b[i:i + 8] for i in range(0, len(b), 8)]
+            pause = SLOW_BODY / len(chunks)
+            for chunk in chunks:
+                self.wfile.write(chunk)
+                self.wfile.flush()
+                time.sleep(pause)
+        else:
+            self.wfile.write(b)
+
+    def _serial(self):
+        auth = self.headers.get("Authorization", "")
+        if not auth.startswith("Basic "):
+            return None
+        try:
+            return base64.b64decode(auth[6:]).decode("latin-1").split(":", 1)[0]
+        except Exception:
+            return None
 
     def do_POST(self):
         LOG.info("POST %s", self.path)
@@ -88,80 +251,135 @@ class MockHandler(BaseHTTPRequestHandler):
 
         LOG.info("idOperacion=%s", id_op)
 
-        # Use globals to persist changes across requests
-        global _STATUS, _TEMPERATURE, _POWER
+        delay = LATENCY + (random.uniform(0, JITTER) if JITTER > 0 else 0)
+        if delay > 0:
+            time.sleep(delay)
+
+        if ERROR_RATE > 0 and random.random() < ERROR_RATE:
+            self._send_text("Internal error\n", code=500)
+            return
 
+        device = get_device(self._serial())
+
+        ops = data.get(BATCH_FIELD, [None])[0]
+        if ops is not None and BATCHING:
+            sections = []
+            for op in ops.split(","):
+                resp, _, _ = self._operation(op, data, device)
+                sections.append(f"[{op}]\n{resp}")
+            self._send_text("".join(sections), headers={BATCH_HEADER: "1"})
+            return
+
+        resp, code, headers = self._operation(id_op, data, device, self.headers.get("If-None-Match"))
+        self._send_text(resp, code=code, headers=headers)
+
+    def _operation(self, id_op, data, device, if_none_match=None):
+        """Run operation `id_op`; return the response body, code and headers."""
         if id_op == OP_STATUS:
             # Change temperature slightly on each status call
-            delta = random.uniform(-0.5, 0.5)
-            _TEMPERATURE = round(_TEMPERATURE + delta, 1)
-            resp = f"estado={_STATUS}\ntemperatura={_TEMPERATURE}\nconsigna_potencia={_POWER}\n"
-            self._send_text(resp)
-            return
+            delta = random.uniform(-TEMPERATURE_DRIFT, TEMPERATURE_DRIFT) if TEMPERATURE_DRIFT else 0
+            with _STATE_LOCK:
+                device.temperature = round(device.temperature + delta, 1)
+                resp = (
+                    f"estado={device.status}\ntemperatura={device.temperature}\n"
+                    f"consigna_potencia={device.power}\n"
+                )
+            if not ETAGS:
+                return resp, 200, None
+            etag = '"%s"' % hashlib.sha1(resp.encode("utf-8")).hexdigest()[:16]
+            if if_none_match == etag:
+                return "", 304, {"ETag": etag}
+            return resp, 200, {"ETag": etag}
 
         if id_op == OP_ONOFF:
             # Expect 'on_off' parameter set to '1' or '0'
             on_off = data.get("on_off", [None])[0]
             if on_off == "0":
-                # Transition: set to '1' (turning off) for TRANSITION_DELAY then to '0' (off)
-                _schedule_transition(8, 0)
-                resp = f"estado={_STATUS}\n"
+                # Transition: set to '8' (turning off) for TRANSITION_DELAY then to '0' (off)
+                _schedule_transition(8, 0, device=device)
             elif on_off == "1":
-                # Transition: set to '2' (turning on) for TRANSITION_DELAY then to '3' (on)
-                _schedule_transition(2, 7)
-                resp = f"estado={_STATUS}\n"
+                # Transition: set to '2' (turning on) for TRANSITION_DELAY then to '7' (on)
+                _schedule_transition(2, 7, device=device)
             else:
                 # Toggle if parameter missing or invalid: schedule opposite transition
-                if _STATUS == 7:
-                    _schedule_transition(8, 0)
+                if device.status == 7:
+                    _schedule_transition(8, 0, device=device)
                 else:
-                    _schedule_transition(2, 7)
-                resp = f"estado={_STATUS}\n"
-            self._send_text(resp)
-            return
+                    _schedule_transition(2, 7, device=device)
+            return f"estado={device.status}\n", 200, None
 
         if id_op == OP_POWER:
             potencia = data.get("potencia", [None])[0]
             if potencia is not None:
                 try:
-                    _POWER = int(potencia)
+                    device.power = int(potencia)
                 except Exception:
                     pass
-            resp = "OK\n"
-            self._send_text(resp)
-            return
+            return "OK\n", 200, None
 
         if id_op == OP_ALARMS:
             # First line contains value, second must be '0' per integration's expectations
-            resp = "alarma=N\n0\n"
-            self._send_text(resp)
-            return
+            return "alarma=N\n0\n", 200, None
 
         # Unknown operation: echo back keys for debugging
         resp_lines = [f"{k}={v[0]}" for k, v in data.items()]
-        self._send_text("\n".join(resp_lines) + "\n")
+        return "\n".join(resp_lines) + "\n", 200, None
 
     def log_message(self, format, *args):
         # Avoid default logging to stderr
         LOG.info(format % args)
 
 
+class MockServer(ThreadingHTTPServer):
+    """Threaded server sized for many concurrent stoves."""
+
+    daemon_threads = True
+    request_queue_size = 1024
+
+
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--host", default="0.0.0.0")
     parser.add_argument("--port", default=11417, type=int)
     parser.add_argument("--transition-delay", type=float, default=None,
                         help="Delay in seconds for intermediate->final state transitions (default: 20)")
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Artificial delay in seconds added to every response (default: 0)")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Random extra delay in seconds, drawn from [0, JITTER] (default: 0)")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="Fraction of requests answered with HTTP 500 (default: 0)")
+    parser.add_argument("--slow-body", type=float, default=0.0,
+                        help="Seconds spent trickling each response body after the headers (default: 0)")
+    parser.add_argument("--temperature-drift", type=float, default=0.5,
+                        help="Largest random temperature change per status read (default: 0.5)")
+    parser.add_argument("--no-etag", action="store_true",
+                        help="Don't send ETags or answer 304 Not Modified to status reads")
+    parser.add_argument("--no-batch", action="store_true",
+                        help="Don't accept several operations in one request")
+    parser.add_argument("--quiet", action="store_true", help="Only log warnings")
     args = parser.parse_args()
 
     # Allow CLI to override default transition delay
-    global TRANSITION_DELAY
+    global TRANSITION_DELAY, LATENCY, JITTER, ERROR_RATE, SLOW_BODY, TEMPERATURE_DRIFT, ETAGS, BATCHING
     if args.transition_delay is not None:
         TRANSITION_DELAY = float(args.transition_delay)
+    LATENCY = args.latency
+    JITTER = args.jitter
+    ERROR_RATE = args.error_rate
+    SLOW_BODY = args.slow_body
+    TEMPERATURE_DRIFT = args.temperature_drift
+    ETAGS = not args.no_etag
+    BATCHING = not args.no_batch
+    if args.quiet:
+        LOG.setLevel(logging.WARNING)
 
-    server = HTTPServer((args.host, args.port), MockHandler)
-    LOG.info("Mock Netflame server running at http://%s:%d/", args.host, args.port)
+    # Threaded so concurrent requests (e.g. status + alarms) overlap like on the real endpoint
+    server = MockServer((args.host, args.port), MockHandler)
+    LOG.warning("Mock Netflame server running at http://%s:%d/", args.host, args.port)
     LOG.info("Using transition delay: %s seconds", TRANSITION_DELAY)
+    if LATENCY:
+        LOG.info("Using response latency: %s seconds", LATENCY)
     try:
         server.serve_forever()
     except KeyboardInterrupt:
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""Replay the response corpus through the Netflame parsers.
+
+Usage:
+  python scripts/replay_parser.py [--corpus DIR] [--rounds N]
+  python scripts/replay_parser.py --fuzz N [--seed N] [--max-run N]
+
+The corpus (tests/corpus by default) has one directory per parser,
+`status` and `alarms`, holding recorded or synthesized response bodies as
+`.txt` files, read byte for byte, and an `expected.json` mapping each file
+name to the fields the parser must return. New captures, e.g. bodies from
+a diagnostics download, only need a file and an entry.
+
+By default every body is checked against its expected fields and then
+replayed `--rounds` times to measure parse throughput.
+
+`--fuzz N` instead derives N malformed bodies from the corpus (inserted
+protocol characters, keys and error markers, dropped and repeated slices,
+long runs of a single character up to `--max-run`) and checks that the
+parsers never raise, return well-formed results and take time linear in
+the body length.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+CORPUS_DIR = os.path.join(PROJECT_ROOT, "tests", "corpus")
+
+# Characters and fragments that mean something to the parsers
+FRAGMENTS = (
+    "=", "\n", "\r\n", "\r", " ", "\t", "\f", "\v", "-", ".", ",", "0", "7", "9",
+    "estado", "temperatura", "consigna_potencia", "consigna_pot", "alarma",
+    "error", "ERROR", "\x00", "é", " ", "\x85", "nan", "inf", "1e999",
+)
+# Allowed parse time: a fixed allowance plus a per-character one, far above
+# linear parsing but far below what quadratic backtracking takes
+TIME_BASE = 0.02
+TIME_PER_CHAR = 2e-6
+
+
+def load_parser():
+    """Return the integration's parser module."""
+    if PROJECT_ROOT not in sys.path:
+        sys.path.insert(0, PROJECT_ROOT)
+    from custom_components.netflame import parser
+
+    return parser
+
+
+def load_corpus(directory=CORPUS_DIR):
+    """Return {parser name: [(file name, body, expected fields)]}."""
+    corpus = {}
+    for name in ("status", "alarms"):
+        folder = os.path.join(directory, name)
+        with open(os.path.join(folder, "expected.json")) as f:
+            expected = json.load(f)
+        cases = []
+        for file_name in sorted(os.listdir(folder)):
+            if not file_name.endswith(".txt"):
+                continue
+            with open(os.path.join(folder, file_name), encoding="utf-8", newline="") as f:
+                cases.append((file_name, f.read(), expected.get(file_name)))
+        corpus[name] = cases
+    return corpus
+
+
+def parse(parser, name, body):
+    """Parse `body` with parser `name`; return the fields it produced."""
+    if name == "status":
+        record = parser.parse_status(body)
+        return {"status": record.status, "temperature": record.temperature, "power": record.power}
+    record = parser.parse_alarms_record(body)
+    return {"value": record.value, "ack": record.ack}
+
+
+def check(parser, corpus):
+    """Return (parser name, file name, problem) for every failing case."""
+    failures = []
+    for name, cases in corpus.items():
+        for file_name, body, expected in cases:
+            if expected is None:
+                failures.append((name, file_name, "no entry in expected.json"))
+                continue
+            got = parse(parser, name, body)
+            if got != expected:
+                failures.append((name, file_name, f"got {got}, expected {expected}"))
+    return failures
+
+
+def throughput(parser, corpus, rounds):
+    """Return {parser name: (bodies per second, MB per second)}."""
+    results = {}
+    for name, cases in corpus.items():
+        func = parser.parse_status if name == "status" else parser.parse_alarms_record
+        bodies = [body for _, body, _ in cases]
+        size = sum(len(body.encode("utf-8")) for body in bodies)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for body in bodies:
+                func(body)
+        elapsed = time.perf_counter() - start
+        results[name] = (rounds * len(bodies) / elapsed, rounds * size / elapsed / 1e6)
+    return results
+
+
+def mutate(rng, body, max_run):
+    """Return a malformed variant of `body`."""
+    for _ in range(rng.randint(1, 8)):
+        pos = rng.randint(0, len(body))
+        kind = rng.random()
+        if kind < 0.4:
+            body = body[:pos] + rng.choice(FRAGMENTS) + body[pos:]
+        elif kind < 0.6:
+            body = body[:pos] + body[pos + rng.randint(1, 16):]
+        elif kind < 0.8:
+            end = min(len(body), pos + rng.randint(1, 32))
+            body = body[:pos] + body[pos:end] * rng.randint(2, 200) + body[pos:]
+        else:
+            run = rng.choice((" ", "\t", "\r", "\n", "=", "a", "0", "estado=", " \t"))
+            body = body[:pos] + run * rng.randint(1, max_run // len(run)) + body[pos:]
+    return body
+
+
+def fuzz(parser, corpus, count, seed, max_run):
+    """Return (bodies parsed, failures) for `count` mutated bodies."""
+    rng = random.Random(seed)
+    seeds = [(name, body) for name, cases in corpus.items() for _, body, _ in cases]
+    failures = []
+    for i in range(count):
+        name, body = rng.choice(seeds)
+        body = mutate(rng, body, max_run)
+        # Every body goes through both parsers
+        for parser_name in ("status", "alarms"):
+            start = time.perf_counter()
+            try:
+                fields = parse(parser, parser_name, body)
+            except Exception as err:
+                failures.append((i, parser_name, f"raised {err!r}", body))
+                continue
+            elapsed = time.perf_counter() - start
+            if elapsed > TIME_BASE + TIME_PER_CHAR * len(body):
+                failures.append((i, parser_name, f"took {elapsed * 1000:.1f} ms for {len(body)} chars", body))
+            problem = _malformed(parser_name, fields)
+            if problem:
+                failures.append((i, parser_name, problem, body))
+    return count, failures
+
+
+def _malformed(name, fields):
+    if name == "status":
+        for key, kind in (("status", int), ("temperature", float), ("power", int)):
+            if fields[key] is not None and type(fields[key]) is not kind:
+                return f"{key} is {type(fields[key]).__name__}"
+        return None
+    # An alarm line ending in "=" legitimately yields an empty value
+    for key in ("value", "ack"):
+        value = fields[key]
+        if value is not None and (value != value.strip(" \t\r\f\v") or "\n" in value):
+            return f"{key} {value!r} is not a clean line"
+    if fields["ack"] == "":
+        return "empty acknowledgement"
+    if fields["value"] is not None and fields["ack"] != "0":
+        return "value without a 0 acknowledgement"
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", default=CORPUS_DIR)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--fuzz", type=int, default=0, help="Parse this many malformed bodies instead")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--max-run", type=int, default=20000, help="Longest run of one character inserted")
+    args = parser.parse_args()
+
+    netflame_parser = load_parser()
+    corpus = load_corpus(args.corpus)
+
+    if args.fuzz:
+        count, failures = fuzz(netflame_parser, corpus, args.fuzz, args.seed, args.max_run)
+        for i, name, problem, body in failures[:20]:
+            print(f"body {i} ({name}): {problem}: {body[:80]!r}")
+        print(f"{count} fuzzed bodies, {len(failures)} failures")
+        return 1 if failures else 0
+
+    failures = check(netflame_parser, corpus)
+    for name, file_name, problem in failures:
+        print(f"{name}/{file_name}: {problem}")
+    print(f"{sum(len(cases) for cases in corpus.values())} corpus bodies, {len(failures)} failures")
+    print(f"{'parser':<8}{'bodies/s':>12}{'MB/s':>8}")
+    for name, (bodies, megabytes) in throughput(netflame_parser, corpus, args.rounds).items():
+        print(f"{name:<8}{bodies:>12.0f}{megabytes:>8.1f}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
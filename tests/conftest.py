@@ -0,0 +1,55 @@
+import importlib.util
+import os
+import sys
+import threading
+
+import pytest
+
+# Make the integration importable as `custom_components.netflame`. The
+# package only imports its constants, so Home Assistant is not needed for
+# the modules under test.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+MOCK_SERVER_PATH = os.path.join(PROJECT_ROOT, "scripts", "mock_netflame_server.py")
+
+# mock_server options and the mock server module settings they set
+MOCK_SERVER_OPTIONS = {
+    "latency": "LATENCY",
+    "batching": "BATCHING",
+    "etags": "ETAGS",
+    "temperature_drift": "TEMPERATURE_DRIFT",
+    "transition_delay": "TRANSITION_DELAY",
+}
+
+
+def load_mock_server():
+    """Return a fresh copy of scripts/mock_netflame_server.py, with its own state."""
+    spec = importlib.util.spec_from_file_location("mock_netflame_server", MOCK_SERVER_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def mock_server(request):
+    """Run the mock Netflame server in a thread; yield (module, base_url).
+
+    Parametrize indirectly with a dict of MOCK_SERVER_OPTIONS to configure
+    it, e.g. `{"latency": 0.2, "batching": False}`. Scheduled transitions
+    take 0.1 s instead of 20 s unless `transition_delay` is given.
+    """
+    module = load_mock_server()
+    options = {"transition_delay": 0.1, **getattr(request, "param", {})}
+    for name, value in options.items():
+        setattr(module, MOCK_SERVER_OPTIONS[name], value)
+
+    server = module.MockServer(("127.0.0.1", 0), module.MockHandler)
+    host, port = server.server_address
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    yield module, f"http://{host}:{port}/"
+
+    server.shutdown()
+    server.server_close()
@@ -1,11 +1,9 @@
-import importlib.util
-import importlib
+import asyncio
 import os
 import sys
 import time
+import aiohttp
 import pytest
-import threading
-from http.server import HTTPServer
 
 # Make project package importable during tests
 HERE = os.path.dirname(__file__)
@@ -13,19 +11,9 @@ PROJECT_ROOT = os.path.dirname(HERE)
 if PROJECT_ROOT not in sys.path:
     sys.path.insert(0, PROJECT_ROOT)
 
-# Import the const and api modules by path to avoid executing package-level Home Assistant imports
-CONST_PATH = os.path.join(PROJECT_ROOT, "custom_components", "netflame", "const.py")
-spec_const = importlib.util.spec_from_file_location("custom_components.netflame.const", CONST_PATH)
-const_mod = importlib.util.module_from_spec(spec_const)
-spec_const.loader.exec_module(const_mod)
-# Ensure the const module is importable by its package-style name for relative imports
-import sys
-sys.modules["custom_components.netflame.const"] = const_mod
-
-API_PATH = os.path.join(PROJECT_ROOT, "custom_components", "netflame", "api.py")
-spec = importlib.util.spec_from_file_location("custom_components.netflame.api", API_PATH)
-api_mod = importlib.util.module_from_spec(spec)
-spec.loader.exec_module(api_mod)
+from custom_components.netflame import api as api_mod
+from custom_components.netflame import breaker as breaker_mod
+from custom_components.netflame import trace as trace_mod
 
 NetflameApi = api_mod.NetflameApi
 OP_ONOFF = api_mod.OP_ONOFF
@@ -34,18 +22,10 @@ OP_ALARMS = api_mod.OP_ALARMS
 OP_STATUS = api_mod.OP_STATUS
 
 
-# Helpers to start the mock server in-process (duplicate of tests/test_mock_netflame_server fixture helpers)
-SCRIPT_PATH = os.path.join(PROJECT_ROOT, "scripts", "mock_netflame_server.py")
-
-
-def _load_mock_module():
-    spec = importlib.util.spec_from_file_location("mock_netflame_server", SCRIPT_PATH)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
 class DummyResponse:
+    headers = {}
+    status_code = 200
+
     def __init__(self, text):
         self.text = text
 
@@ -83,26 +63,26 @@ def test_get_status_parsing_various_fields():
     api = NetflameApi("u", "p", session=sess)
 
     res = api.get_status()
-    assert res["status"] == 3
-    assert res["temperature"] == 24.5
-    assert res["power"] == 7
+    assert res.status == 3
+    assert res.temperature == 24.5
+    assert res.power == 7
 
     # Accept alternative key name 'consigna_pot'
     raw2 = "estado=0\ntemperatura=20.0\nconsigna_pot=4\n"
     sess2 = DummySession(response_text=raw2)
     api2 = NetflameApi("u", "p", session=sess2)
     res2 = api2.get_status()
-    assert res2["power"] == 4
+    assert res2.power == 4
 
     # Invalid numbers fallback to None or NaN for temperature
     raw3 = "estado=notanint\ntemperatura=NaN\nconsigna_pot=bad\n"
     sess3 = DummySession(response_text=raw3)
     api3 = NetflameApi("u", "p", session=sess3)
     res3 = api3.get_status()
-    assert res3["status"] is None
+    assert res3.status is None
     # float('NaN') is not None, assert that it's NaN
-    assert math.isnan(res3["temperature"])
-    assert res3["power"] is None
+    assert math.isnan(res3.temperature)
+    assert res3.power is None
 
 
 def test_set_power_validation_and_payload():
@@ -135,6 +115,22 @@ def test_get_alarms_parsing():
     assert api3.get_alarms() == "FOO"
 
 
+def test_raw_responses_only_kept_with_trace():
+    raw = "estado=7\ntemperatura=20.0\nconsigna_potencia=2\n"
+    api = NetflameApi("u", "p", session=DummySession(response_text=raw))
+    res = api.get_status()
+    assert not hasattr(res, "raw")
+    assert api.trace is None
+
+    trace = trace_mod.ResponseTrace(size=2)
+    api = NetflameApi("u", "p", session=DummySession(response_text=raw), trace=trace)
+    api.get_status()
+    api.get_status()
+    api.get_status()
+    assert [e["body"] for e in trace.as_list()] == [raw, raw]
+    assert trace.as_list()[0]["operation"] == OP_STATUS
+
+
 def test_uses_custom_base_url():
     sess = DummySession()
     custom = "http://example.test/"
@@ -143,33 +139,8 @@ def test_uses_custom_base_url():
     assert sess.last["url"] == custom
 
 
-@pytest.fixture(scope="function")
-def mock_server_module_local():
-    # Duplicate of the mock_server_module fixture used elsewhere so this test file can use it
-    module = _load_mock_module()
-    server = HTTPServer(("127.0.0.1", 0), module.MockHandler)
-    host, port = server.server_address
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-
-    # Speed up scheduled transitions for tests (20s -> 0.1s)
-    orig_delay = getattr(module, "TRANSITION_DELAY", None)
-    module.TRANSITION_DELAY = 0.1
-
-    base_url = f"http://{host}:{port}/"
-
-    yield module, base_url
-
-    # Restore original TRANSITION_DELAY if present
-    if orig_delay is not None:
-        module.TRANSITION_DELAY = orig_delay
-
-    server.shutdown()
-    server.server_close()
-
-
-def test_integration_with_mock_server_status_and_power(mock_server_module_local):
-    module, base_url = mock_server_module_local
+def test_integration_with_mock_server_status_and_power(mock_server):
+    module, base_url = mock_server
     # Monkeypatch BASE_URL in the api module loaded above
     orig_base = api_mod.BASE_URL
     api_mod.BASE_URL = base_url
@@ -178,21 +149,492 @@ def test_integration_with_mock_server_status_and_power(mock_server_module_local)
 
     # get_status should reflect mock server initial data
     st = api.get_status()
-    assert "status" in st
+    assert st.status is not None
 
     # set_power should affect subsequent status calls
     api.set_power(7)
     st2 = api.get_status()
-    assert st2["power"] == 7
+    assert st2.power == 7
 
     # turn_on should schedule intermediate 2 then final 7; fixture fastens delay
     module._STATUS = 1
     api.turn_on()
     st3 = api.get_status()
-    assert st3["status"] == 2
+    assert st3.status == 2
     time.sleep(0.2)
     st4 = api.get_status()
-    assert st4["status"] == 7
+    assert st4.status == 7
 
     # Restore BASE_URL
-    api_mod.BASE_URL = orig_base
\ No newline at end of file
+    api_mod.BASE_URL = orig_base
+
+AsyncNetflameApi = api_mod.AsyncNetflameApi
+
+
+class DummyAsyncResponse:
+    status = 200
+    headers = {}
+
+    def __init__(self, text):
+        self._text = text
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        return None
+
+    async def text(self):
+        return self._text
+
+
+class DummyAsyncSession:
+    def __init__(self, response_text="OK"):
+        self.response_text = response_text
+        self.last = None
+
+    def post(self, url, headers=None, data=None, timeout=None, ssl=None):
+        self.last = dict(url=url, headers=headers, data=data, timeout=timeout, ssl=ssl)
+        return DummyAsyncResponse(self.response_text)
+
+
+def test_async_api_payloads_and_parsing():
+    async def run():
+        sess = DummyAsyncSession()
+        api = AsyncNetflameApi("u", "p", sess, base_url="http://example.test/")
+
+        await api.turn_on()
+        assert sess.last["data"] == {"idOperacion": OP_ONOFF, "on_off": "1"}
+        assert sess.last["url"] == "http://example.test/"
+        assert sess.last["headers"]["Authorization"] == "Basic dTpw"
+
+        await api.turn_off()
+        assert sess.last["data"] == {"idOperacion": OP_ONOFF, "on_off": "0"}
+
+        with pytest.raises(ValueError):
+            await api.set_power(10)
+        await api.set_power(3)
+        assert sess.last["data"] == {"idOperacion": OP_POWER, "potencia": "3"}
+
+        sess.response_text = "estado=7\ntemperatura=21.5\nconsigna_potencia=3\n"
+        res = await api.get_status()
+        assert (res.status, res.temperature, res.power) == (7, 21.5, 3)
+
+        sess.response_text = "alarma=N\n0\n"
+        assert await api.get_alarms() == "N"
+
+    asyncio.run(run())
+
+
+def test_async_integration_with_mock_server(mock_server):
+    module, base_url = mock_server
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            api = AsyncNetflameApi("u", "p", session, base_url=base_url)
+
+            await api.set_power(6)
+            st = await api.get_status()
+            assert st.power == 6
+
+            await api.turn_on()
+            st2 = await api.get_status()
+            assert st2.status == 2
+            await asyncio.sleep(0.2)
+            st3 = await api.get_status()
+            assert st3.status == 7
+
+            assert await api.get_alarms() == "N"
+
+    asyncio.run(run())
+
+
+class FailingAlarmsSession(DummyAsyncSession):
+    def post(self, url, headers=None, data=None, timeout=None, ssl=None):
+        if data.get("idOperacion") == OP_ALARMS:
+            raise aiohttp.ClientConnectionError("boom")
+        return super().post(url, headers=headers, data=data, timeout=timeout, ssl=ssl)
+
+
+def test_snapshot_keeps_status_when_alarms_fail():
+    async def run():
+        sess = FailingAlarmsSession("estado=7\ntemperatura=21.0\nconsigna_potencia=4\n")
+        api = AsyncNetflameApi("u", "p", sess, retry=api_mod.RetryPolicy(retries=0))
+        snap = await api.get_snapshot(previous_alarms="N")
+        assert snap.status == 7
+        assert snap.alarms == "N"
+
+    asyncio.run(run())
+
+
+def test_snapshot_without_alarms_reads_status_only():
+    class CountingSession(DummyAsyncSession):
+        operations = []
+
+        def post(self, url, headers=None, data=None, timeout=None, ssl=None):
+            self.operations.append(data["idOperacion"])
+            return super().post(url, headers=headers, data=data, timeout=timeout, ssl=ssl)
+
+    async def run():
+        sess = CountingSession("estado=7\ntemperatura=21.0\nconsigna_potencia=4\n")
+        api = AsyncNetflameApi("u", "p", sess)
+        snap = await api.get_snapshot(previous_alarms="A3", include_alarms=False)
+        assert snap.status == 7
+        assert snap.alarms == "A3"
+        assert sess.operations == [OP_STATUS]
+
+    asyncio.run(run())
+
+
+def test_snapshot_fails_when_status_fails():
+    class FailingStatusSession(DummyAsyncSession):
+        def post(self, url, headers=None, data=None, timeout=None, ssl=None):
+            if data.get("idOperacion") == OP_STATUS:
+                raise aiohttp.ClientConnectionError("boom")
+            return super().post(url, headers=headers, data=data, timeout=timeout, ssl=ssl)
+
+    async def run():
+        api = AsyncNetflameApi(
+            "u", "p", FailingStatusSession("alarma=N\n0\n"), retry=api_mod.RetryPolicy(retries=0)
+        )
+        with pytest.raises(aiohttp.ClientConnectionError):
+            await api.get_snapshot()
+
+    asyncio.run(run())
+
+
+# Reads status and alarms concurrently, as against any server whose batch
+# support is unknown
+@pytest.mark.parametrize("mock_server", [{"latency": 0.3, "batching": False}], indirect=True)
+def test_snapshot_costs_about_one_round_trip(mock_server):
+    module, base_url = mock_server
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            api = AsyncNetflameApi("u", "p", session, base_url=base_url)
+            start = time.monotonic()
+            snap = await api.get_snapshot()
+            elapsed = time.monotonic() - start
+        assert snap.alarms == "N"
+        assert snap.status is not None
+        # Two sequential requests would take >= 2 * LATENCY
+        assert elapsed < 1.5 * module.LATENCY
+
+    asyncio.run(run())
+
+
+def test_retry_delay_is_bounded_exponential_with_jitter():
+    policy = api_mod.RetryPolicy(retries=5, backoff=0.5, max_backoff=2.0)
+    for attempt, cap in enumerate([0.5, 1.0, 2.0, 2.0]):
+        delays = [policy.delay(attempt) for _ in range(50)]
+        assert all(cap / 2 <= d <= cap for d in delays)
+
+
+class FlakySession(DummySession):
+    """Fails the first `failures` posts with `error`, then answers."""
+
+    def __init__(self, error, failures, response_text="estado=7\ntemperatura=20.0\nconsigna_potencia=2\n"):
+        super().__init__(response_text)
+        self.error = error
+        self.failures = failures
+        self.calls = 0
+
+    def post(self, url, auth=None, data=None, timeout=None):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error
+        return super().post(url, auth=auth, data=data, timeout=timeout)
+
+
+def _server_error(status=503):
+    import requests
+
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(f"{status} Server Error", response=response)
+
+
+def test_reads_are_retried_on_server_errors():
+    fast = api_mod.RetryPolicy(retries=2, backoff=0.001)
+    sess = FlakySession(_server_error(), failures=2)
+    api = NetflameApi("u", "p", session=sess, retry=fast)
+    assert api.get_status().status == 7
+    assert sess.calls == 3
+    assert api.stats["retries"] == 2
+
+    # Retries are bounded
+    sess = FlakySession(_server_error(), failures=3)
+    api = NetflameApi("u", "p", session=sess, retry=fast)
+    with pytest.raises(Exception):
+        api.get_status()
+    assert sess.calls == 3
+
+    # Client errors are not retried
+    sess = FlakySession(_server_error(401), failures=1)
+    api = NetflameApi("u", "p", session=sess, retry=fast)
+    with pytest.raises(Exception):
+        api.get_status()
+    assert sess.calls == 1
+
+
+def test_commands_only_retried_when_not_sent():
+    import requests
+
+    fast = api_mod.RetryPolicy(retries=2, backoff=0.001)
+
+    # The server may have applied the command: never send it twice
+    for error in (_server_error(), requests.exceptions.ReadTimeout("slow")):
+        sess = FlakySession(error, failures=1)
+        api = NetflameApi("u", "p", session=sess, retry=fast)
+        with pytest.raises(Exception):
+            api.turn_on()
+        assert sess.calls == 1
+
+    # The connection was never established: safe to retry
+    sess = FlakySession(requests.exceptions.ConnectTimeout("down"), failures=1)
+    api = NetflameApi("u", "p", session=sess, retry=fast)
+    api.turn_on()
+    assert sess.calls == 2
+    assert sess.last["data"] == {"idOperacion": OP_ONOFF, "on_off": "1"}
+
+
+def test_async_reads_retried_commands_not():
+    class FlakyAsyncSession(DummyAsyncSession):
+        def __init__(self):
+            super().__init__("estado=7\ntemperatura=20.0\nconsigna_potencia=2\n")
+            self.calls = 0
+
+        def post(self, url, headers=None, data=None, timeout=None, ssl=None):
+            self.calls += 1
+            if self.calls == 1:
+                raise aiohttp.ServerDisconnectedError()
+            return super().post(url, headers=headers, data=data, timeout=timeout, ssl=ssl)
+
+    async def run():
+        fast = api_mod.RetryPolicy(retries=2, backoff=0.001)
+        sess = FlakyAsyncSession()
+        api = AsyncNetflameApi("u", "p", sess, retry=fast)
+        assert (await api.get_status()).status == 7
+        assert sess.calls == 2
+        assert api.stats == {"requests": 2, "retries": 1}
+
+        sess = FlakyAsyncSession()
+        api = AsyncNetflameApi("u", "p", sess, retry=fast)
+        with pytest.raises(aiohttp.ServerDisconnectedError):
+            await api.set_power(3)
+        assert sess.calls == 1
+
+    asyncio.run(run())
+
+
+def test_sync_client_reuses_pooled_connections(mock_server):
+    _, base_url = mock_server
+    api = NetflameApi("u", "p", base_url=base_url, pool_size=2)
+    for _ in range(5):
+        api.get_status()
+    assert api.stats["requests"] == 5
+    assert api.stats["connections_reused"] == 4
+
+
+def test_breaker_fails_fast_after_repeated_connection_errors():
+    import requests
+
+    breaker = breaker_mod.CircuitBreaker("test", failure_threshold=2, cooldown=60)
+    sess = FlakySession(requests.exceptions.ConnectionError("down"), failures=10)
+    api = NetflameApi("u", "p", session=sess, retry=api_mod.RetryPolicy(retries=0), breaker=breaker)
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.ConnectionError):
+            api.get_status()
+    assert breaker.state == "open"
+
+    with pytest.raises(breaker_mod.NetflameCircuitOpenError):
+        api.get_status()
+    assert sess.calls == 2
+
+    # A server that answers, even with an error, is reachable
+    breaker = breaker_mod.CircuitBreaker("test", failure_threshold=1)
+    api = NetflameApi("u", "p", session=FlakySession(_server_error(401), failures=1), breaker=breaker)
+    with pytest.raises(requests.exceptions.HTTPError):
+        api.get_status()
+    assert breaker.state == "closed"
+
+
+def test_requests_are_timed_per_operation():
+    import requests
+
+    raw = "estado=7\ntemperatura=20.0\nconsigna_potencia=2\n"
+    sess = FlakySession(requests.exceptions.ReadTimeout("slow"), failures=1, response_text=raw)
+    api = NetflameApi("u", "p", session=sess, retry=api_mod.RetryPolicy(retries=1, backoff=0.001))
+    api.get_status()
+    api.turn_on()
+
+    snapshot = api.metrics.snapshot()
+    status = snapshot["status"]
+    assert status["requests"] == 2
+    assert status["errors"] == {"ReadTimeout": 1}
+    assert status["timeouts"] == 1
+    assert status["bytes_received"] == len(raw)
+    assert sum(status["latency"]["buckets"].values()) == 2
+    assert snapshot["onoff"]["requests"] == 1
+    assert api.metrics.errors == 1
+
+
+@pytest.mark.parametrize(
+    "mock_server",
+    [{"temperature_drift": 0, "etags": True}, {"temperature_drift": 0, "etags": False}],
+    ids=["etags", "no-etags"],
+    indirect=True,
+)
+def test_status_if_changed_skips_unchanged_bodies(mock_server):
+    module, base_url = mock_server
+    etags = module.ETAGS
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            api = AsyncNetflameApi("u", "p", session, base_url=base_url)
+            device = module.get_device("u")
+            fingerprint, status = await api.get_status_if_changed()
+            assert status.power == device.power
+            first = api.metrics.snapshot()["status"]["bytes_received"]
+
+            again, status = await api.get_status_if_changed(fingerprint)
+            assert (again, status) == (fingerprint, None)
+            # With ETags the unchanged status came back as an empty 304
+            second = api.metrics.snapshot()["status"]["bytes_received"]
+            assert second == (first if etags else 2 * first)
+
+            device.power = 9
+            changed, status = await api.get_status_if_changed(fingerprint)
+            assert changed != fingerprint
+            assert status.power == 9
+
+    asyncio.run(run())
+
+
+def test_batch_payload_and_response_split():
+    payload = api_mod._batch_payload([{"idOperacion": OP_STATUS}, {"idOperacion": OP_POWER, "potencia": "3"}])
+    assert payload == {"operaciones": f"{OP_STATUS},{OP_POWER}", "potencia": "3"}
+    with pytest.raises(ValueError):
+        api_mod._batch_payload([{"idOperacion": OP_STATUS}, {"idOperacion": OP_STATUS}])
+
+    text = f"[{OP_STATUS}]\nestado=7\n[{OP_ALARMS}]\nalarma=N\n0\n"
+    assert api_mod.split_batch(text, [OP_STATUS, OP_ALARMS]) == {
+        OP_STATUS: "estado=7\n",
+        OP_ALARMS: "alarma=N\n0\n",
+    }
+    with pytest.raises(ValueError):
+        api_mod.split_batch(text, [OP_POWER])
+
+
+@pytest.mark.parametrize(
+    "mock_server",
+    [{"latency": 0.2, "batching": True}, {"latency": 0.2, "batching": False}],
+    ids=["batching", "no-batching"],
+    indirect=True,
+)
+def test_batch_takes_one_round_trip_where_supported(mock_server):
+    module, base_url = mock_server
+    batching = module.BATCHING
+    operations = [{"idOperacion": OP_STATUS}, {"idOperacion": OP_ALARMS}]
+
+    async def run():
+        async with aiohttp.ClientSession() as session:
+            api = AsyncNetflameApi("u", "p", session, base_url=base_url)
+            # The first batch finds out whether the server accepts batches
+            await api.batch(operations)
+            assert api.batching is batching
+            requests = api.requests
+            start = time.monotonic()
+            results = await api.batch(operations)
+            elapsed = time.monotonic() - start
+            assert api.requests - requests == (1 if batching else 2)
+            if batching:
+                assert elapsed < 1.5 * module.LATENCY
+            else:
+                assert elapsed >= 2 * module.LATENCY
+            assert list(results) == [OP_STATUS, OP_ALARMS]
+            assert api_mod.parse_alarms(results[OP_ALARMS]) == "N"
+
+            # Back-to-back operations share the deadline
+            if not batching:
+                with pytest.raises(asyncio.TimeoutError):
+                    await api.batch(operations, deadline=1.5 * module.LATENCY)
+
+    asyncio.run(run())
+
+
+class BatchRejectingSession(DummyAsyncSession):
+    """Answers 500 to any request without idOperacion, like a server without batches."""
+
+    def __init__(self):
+        super().__init__()
+        self.batches = 0
+
+    def post(self, url, headers=None, data=None, timeout=None, ssl=None):
+        if "idOperacion" not in data:
+            self.batches += 1
+            raise aiohttp.ClientResponseError(None, (), status=500)
+        self.response_text = "estado=7\n" if data["idOperacion"] == OP_STATUS else "alarma=N\n0\n"
+        return super().post(url, headers=headers, data=data, timeout=timeout, ssl=ssl)
+
+
+def test_rejected_batch_probe_means_unsupported():
+    async def run():
+        session = BatchRejectingSession()
+        support = api_mod.BatchSupport()
+        breaker = breaker_mod.CircuitBreaker("test")
+        api = AsyncNetflameApi("u", "p", session, breaker=breaker, batch_support=support)
+        other = AsyncNetflameApi("v", "p", session, breaker=breaker, batch_support=support)
+
+        # Polls never probe while batch support is unknown
+        for _ in range(4):
+            snap = await api.get_snapshot()
+            assert (snap.status, snap.alarms) == (7, "N")
+        assert session.batches == 0
+        assert api.batching is None
+
+        results = await api.batch([{"idOperacion": OP_STATUS}, {"idOperacion": OP_ALARMS}])
+        assert api_mod.parse_alarms(results[OP_ALARMS]) == "N"
+        assert session.batches == 1
+        # The failed probe neither retried nor counted against the endpoint
+        assert breaker.state == breaker_mod.STATE_CLOSED
+        # Known for every client sharing the hub's batch support
+        assert other.batching is False
+        await other.batch([{"idOperacion": OP_STATUS}, {"idOperacion": OP_ALARMS}])
+        assert session.batches == 1
+
+    asyncio.run(run())
+
+
+def test_sync_batch_against_mock_server(mock_server):
+    _, base_url = mock_server
+    api = NetflameApi("u", "p", base_url=base_url)
+    results = api.batch([{"idOperacion": OP_POWER, "potencia": "4"}, {"idOperacion": OP_STATUS}])
+    assert api.batching is True
+    assert api.requests == 1
+    assert results[OP_POWER] == "OK\n"
+    assert api_mod.parse_status(results[OP_STATUS]).power == 4
+
+
+def test_trace_captures_exchanges_and_parse_failures():
+    async def run():
+        trace = trace_mod.ResponseTrace()
+        api = AsyncNetflameApi("u", "p", DummyAsyncSession("estado=oops\n"), trace=trace)
+        status = await api.get_status()
+        assert status.status is None
+        assert await api.get_alarms() is None
+
+        captured = trace.as_dict()
+        exchange = captured["exchanges"]["status"][0]
+        assert exchange["request"] == {"idOperacion": OP_STATUS}
+        assert exchange["status"] == 200
+        assert exchange["duration"] >= 0
+        assert [(f["operation"], f["reason"]) for f in captured["parse_failures"]] == [
+            ("status", "invalid estado 'oops'; missing temperature, power"),
+            ("alarms", "expected an alarm line and an acknowledgement line"),
+        ]
+
+    asyncio.run(run())
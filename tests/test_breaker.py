@@ -0,0 +1,106 @@
+import pytest
+
+from custom_components.netflame import breaker as breaker_mod
+
+CircuitBreaker = breaker_mod.CircuitBreaker
+NetflameCircuitOpenError = breaker_mod.NetflameCircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _breaker(**kwargs):
+    clock = FakeClock()
+    return CircuitBreaker("test", clock=clock, **kwargs), clock
+
+
+def test_opens_after_consecutive_failures_only():
+    breaker, _ = _breaker(failure_threshold=3, cooldown=10)
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.before_request()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(NetflameCircuitOpenError) as err:
+        breaker.before_request()
+    assert err.value.retry_in == 10
+    assert breaker.stats["rejected"] == 1
+
+
+def test_single_probe_after_cooldown_then_closes():
+    breaker, clock = _breaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+
+    clock.now = 10
+    breaker.before_request()
+    assert breaker.state == "half_open"
+    # Only one probe at a time
+    with pytest.raises(NetflameCircuitOpenError):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_request()
+
+
+def test_failed_probes_double_the_cooldown_up_to_the_cap():
+    breaker, clock = _breaker(failure_threshold=1, cooldown=10, max_cooldown=25)
+    breaker.record_failure()
+    cooldowns = []
+    for _ in range(3):
+        clock.now += breaker.cooldown
+        breaker.before_request()
+        breaker.record_failure()
+        cooldowns.append(breaker.cooldown)
+        assert breaker.state == "open"
+        assert breaker.retry_in == breaker.cooldown
+    assert cooldowns == [20, 25, 25]
+
+    clock.now += 25
+    breaker.before_request()
+    breaker.record_success()
+    assert breaker.cooldown == 10
+    assert breaker.stats["trips"] == 4
+
+
+def test_lost_probe_is_replaced_after_a_cooldown():
+    breaker, clock = _breaker(failure_threshold=1, cooldown=10)
+    breaker.record_failure()
+    clock.now = 10
+    breaker.before_request()  # probe never reports back
+
+    clock.now = 15
+    with pytest.raises(NetflameCircuitOpenError):
+        breaker.before_request()
+    clock.now = 20
+    breaker.before_request()
+    assert breaker.state == "half_open"
+
+
+def test_reports_each_transition_once():
+    changes = []
+    breaker, clock = _breaker(failure_threshold=2, cooldown=10)
+    breaker.on_change = changes.append
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_failure()
+    with pytest.raises(NetflameCircuitOpenError):
+        breaker.before_request()
+    clock.now = 10
+    breaker.before_request()
+    breaker.record_failure()
+    clock.now = 30
+    breaker.before_request()
+    breaker.record_success()
+    breaker.record_success()
+    assert changes == ["open", "half_open", "open", "half_open", "closed"]
@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from custom_components.netflame.bulk import RESULT_ERROR, RESULT_OK, RESULT_TIMEOUT, run_bulk
+
+
+def test_bulk_reports_each_stove_and_bounds_concurrency():
+    in_flight = 0
+    peak = 0
+
+    def command(fail=False):
+        async def send():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            if fail:
+                raise ConnectionError("refused")
+
+        return send
+
+    commands = {f"s{i}": command(fail=i == 3) for i in range(10)}
+    results = asyncio.run(run_bulk(commands, concurrency=3, deadline=5))
+
+    assert peak == 3
+    assert list(results) == list(commands)
+    assert results["s3"]["result"] == RESULT_ERROR
+    assert results["s3"]["error"] == "ConnectionError: refused"
+    assert all(results[f"s{i}"]["result"] == RESULT_OK for i in range(10) if i != 3)
+    assert all(result["duration"] >= 0.01 for result in results.values())
+
+
+def test_bulk_deadline_cancels_in_flight_and_skips_waiting_commands():
+    sent = []
+
+    def command(serial, delay):
+        async def send():
+            await asyncio.sleep(delay)
+            sent.append(serial)
+
+        return send
+
+    commands = {"fast": command("fast", 0), "slow": command("slow", 1), "queued": command("queued", 0)}
+    results = asyncio.run(run_bulk(commands, concurrency=2, deadline=0.05))
+
+    assert results["fast"]["result"] == RESULT_OK
+    assert results["slow"]["result"] == RESULT_TIMEOUT
+    assert results["slow"]["duration"] == pytest.approx(0.05, abs=0.04)
+    # "queued" got the slot "fast" freed and was sent in time
+    assert results["queued"]["result"] == RESULT_OK
+    assert sent == ["fast", "queued"]
+
+    commands = {"slow": command("slow", 1), "waiting": command("waiting", 0)}
+    results = asyncio.run(run_bulk(commands, concurrency=1, deadline=0.05))
+    assert results["waiting"] == {
+        "result": RESULT_TIMEOUT,
+        "error": "not sent before the deadline",
+        "duration": None,
+    }
+
+
+def test_bulk_client_timeout_is_an_error_before_the_deadline():
+    async def send():
+        raise asyncio.TimeoutError()
+
+    results = asyncio.run(run_bulk({"s": send}, deadline=5))
+    assert results["s"]["result"] == RESULT_ERROR
+
+
+def test_bulk_rejects_zero_concurrency():
+    with pytest.raises(ValueError):
+        asyncio.run(run_bulk({}, concurrency=0))
@@ -0,0 +1,115 @@
+import asyncio
+
+import pytest
+
+from custom_components.netflame import commands
+
+CommandQueue = commands.CommandQueue
+
+
+def test_burst_of_same_kind_sends_only_last():
+    sent = []
+
+    def sender(level):
+        async def send():
+            sent.append(level)
+        return send
+
+    async def run():
+        queue = CommandQueue(window=0.05)
+        results = await asyncio.gather(*(queue.submit("power", sender(i)) for i in range(1, 11)))
+        return queue, results
+
+    queue, results = asyncio.run(run())
+    assert sent == [10]
+    assert results == [False] * 9 + [True]
+    assert queue.stats == {"sent": 1, "collapsed": 9, "dropped": 0}
+
+
+def test_different_kinds_are_all_sent_in_submission_order():
+    sent = []
+
+    def sender(name):
+        async def send():
+            sent.append(name)
+        return send
+
+    async def run():
+        queue = CommandQueue(window=0.05)
+        await asyncio.gather(
+            queue.submit("onoff", sender("on")),
+            queue.submit("power", sender("p3")),
+            queue.submit("power", sender("p5")),
+        )
+        return queue
+
+    queue = asyncio.run(run())
+    assert sent == ["on", "p5"]
+    assert queue.collapsed == 1
+
+
+def test_error_propagates_to_sent_command():
+    async def fail():
+        raise RuntimeError("cloud down")
+
+    async def run():
+        queue = CommandQueue(window=0)
+        with pytest.raises(RuntimeError):
+            await queue.submit("onoff", fail)
+        return queue
+
+    queue = asyncio.run(run())
+    assert queue.sent == 0
+
+
+def test_drop_counts_noop_commands():
+    queue = CommandQueue()
+    queue.drop()
+    queue.drop()
+    assert queue.stats["dropped"] == 2
+
+
+def test_noop_command_supersedes_pending_command_of_its_kind():
+    sent = []
+
+    async def send():
+        sent.append(4)
+
+    async def run():
+        queue = CommandQueue(window=0.05)
+        pending = asyncio.ensure_future(queue.submit("power", send))
+        await asyncio.sleep(0)
+        # Back to the value the stove reports: the queued 4 must not go out
+        queue.drop("power")
+        assert await pending is False
+        await asyncio.sleep(0.1)
+        return queue
+
+    queue = asyncio.run(run())
+    assert sent == []
+    assert queue.stats == {"sent": 0, "collapsed": 1, "dropped": 1}
+
+
+def test_cancel_discards_queued_and_in_flight_commands():
+    sent = []
+
+    async def send_slowly():
+        await asyncio.sleep(1)
+        sent.append("on")
+
+    async def send():
+        sent.append("power")
+
+    async def run():
+        queue = CommandQueue(window=0.01)
+        in_flight = asyncio.ensure_future(queue.submit("onoff", send_slowly))
+        await asyncio.sleep(0.05)
+        queued = asyncio.ensure_future(queue.submit("power", send))
+        await asyncio.sleep(0)
+        queue.cancel()
+        assert await queued is False
+        assert await in_flight is False
+        await asyncio.sleep(0.05)
+
+    asyncio.run(run())
+    assert sent == []
@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import random
+import time
+
+import pytest
+
+from custom_components.netflame import parser
+
+HERE = os.path.dirname(__file__)
+PROJECT_ROOT = os.path.dirname(HERE)
+SCRIPT_PATH = os.path.join(PROJECT_ROOT, "scripts", "replay_parser.py")
+
+
+def _load_replay_module():
+    spec = importlib.util.spec_from_file_location("replay_parser", SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+replay = _load_replay_module()
+CORPUS = replay.load_corpus()
+CASES = [(name, case) for name, cases in CORPUS.items() for case in cases]
+
+
+@pytest.mark.parametrize(
+    "name,case", CASES, ids=[f"{name}/{case[0]}" for name, case in CASES]
+)
+def test_corpus_case(name, case):
+    file_name, body, expected = case
+    assert expected is not None, f"{file_name} has no entry in expected.json"
+    assert replay.parse(parser, name, body) == expected
+
+
+def test_corpus_bodies_keep_their_line_endings():
+    bodies = [body for _, body, _ in CORPUS["status"] + CORPUS["alarms"]]
+    assert any("\r\n" in body for body in bodies)
+
+
+def test_corpus_problem_helpers_agree_with_parsers():
+    for file_name, body, expected in CORPUS["status"]:
+        complete = None not in expected.values()
+        assert (parser.status_problem(body) is None) == complete, file_name
+    for file_name, body, expected in CORPUS["alarms"]:
+        assert (parser.alarms_problem(body) is None) == (expected["value"] is not None), file_name
+
+
+def test_fuzzed_bodies_parse_cleanly():
+    count, failures = replay.fuzz(parser, CORPUS, 300, seed=1, max_run=5000)
+    assert count == 300
+    assert failures == []
+
+
+def test_long_blank_runs_parse_in_linear_time():
+    # Used to backtrack quadratically in the clean line pattern: ~2 s here
+    bodies = ("alarma=A1" + " " * 20000 + "x\n0\n", "alarma=A1\n0" + " \t" * 10000 + "\n")
+    for body in bodies:
+        start = time.perf_counter()
+        record = parser.parse_alarms_record(body)
+        assert time.perf_counter() - start < replay.TIME_BASE + replay.TIME_PER_CHAR * len(body)
+        assert record.ack == "0"
+
+
+def test_short_and_long_body_paths_agree(monkeypatch):
+    rng = random.Random(2)
+    bodies = [body for _, body, _ in CORPUS["status"] + CORPUS["alarms"]]
+    bodies += [replay.mutate(rng, rng.choice(bodies), 40) for _ in range(2000)]
+    for body in bodies:
+        results = []
+        for short in (len(body), len(body) - 1):
+            monkeypatch.setattr(parser, "_SHORT_BODY", short)
+            # repr() so NaN temperatures compare equal
+            results.append(repr((replay.parse(parser, "status", body), replay.parse(parser, "alarms", body))))
+        assert results[0] == results[1], body
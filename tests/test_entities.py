@@ -0,0 +1,40 @@
+import ast
+import os
+
+from custom_components.netflame.const import ENTITY_EXTRA_FIELDS
+from custom_components.netflame.parser import ALL_FIELDS
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "custom_components", "netflame")
+
+
+def _declared_fields():
+    """Yield (class name, keys) of every `_netflame_fields` in the platforms.
+
+    Read from the source: the platforms import Home Assistant.
+    """
+    for name in ("climate.py", "sensor.py"):
+        with open(os.path.join(PACKAGE_DIR, name)) as f:
+            tree = ast.parse(f.read())
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.ClassDef):
+                continue
+            for statement in node.body:
+                if (
+                    isinstance(statement, ast.Assign)
+                    and [getattr(t, "id", None) for t in statement.targets] == ["_netflame_fields"]
+                ):
+                    keys = {
+                        n.value for n in ast.walk(statement.value)
+                        if isinstance(n, ast.Constant) and isinstance(n.value, str)
+                    }
+                    yield node.name, keys
+
+
+def test_availability_changes_reach_every_entity():
+    # What the coordinator flags when availability flips or stale data is replaced
+    all_entity_fields = ALL_FIELDS | ENTITY_EXTRA_FIELDS
+    declared = dict(_declared_fields())
+    assert "NetflameTemperatureTrendSensor" in declared
+    for name, keys in declared.items():
+        assert keys, name
+        assert keys <= all_entity_fields, name
@@ -0,0 +1,80 @@
+import math
+import random
+
+import pytest
+
+from custom_components.netflame.history import StatusHistory
+from custom_components.netflame.parser import StatusRecord
+
+
+def _expected(readings):
+    temperatures = [t for _, t, _, _ in readings if t is not None]
+    powers = [p for _, _, p, _ in readings if p is not None]
+    in_state = {}
+    for (at, _, _, status), (following, _, _, _) in zip(readings, readings[1:]):
+        if status is not None:
+            in_state[status] = in_state.get(status, 0.0) + following - at
+    return temperatures, powers, in_state
+
+
+def test_statistics_match_the_window_after_wrapping():
+    rng = random.Random(3)
+    history = StatusHistory(size=50)
+    readings = []
+    now = 0.0
+    for _ in range(500):
+        now += rng.choice((10, 60, 300))
+        reading = (
+            now,
+            None if rng.random() < 0.05 else round(rng.uniform(15, 30), 1),
+            None if rng.random() < 0.05 else rng.randint(1, 9),
+            None if rng.random() < 0.05 else rng.choice((0, 2, 7, 8, -4)),
+        )
+        readings.append(reading)
+        history.append(now, StatusRecord(status=reading[3], temperature=reading[1], power=reading[2]))
+
+        window = readings[-50:]
+        temperatures, powers, in_state = _expected(window)
+        assert len(history) == len(window)
+        assert history.temperature.min == min(temperatures)
+        assert history.temperature.max == max(temperatures)
+        assert history.temperature.mean == pytest.approx(sum(temperatures) / len(temperatures))
+        assert history.power.min == min(powers)
+        assert history.power.max == max(powers)
+        assert history.time_in_state == pytest.approx(in_state)
+        assert history.span == window[-1][0] - window[0][0]
+
+    # The extremes deques never outgrow the window
+    assert len(history.temperature._min) <= 50
+    assert len(history.temperature._max) <= 50
+
+
+def test_temperature_rate_per_hour():
+    history = StatusHistory(size=10)
+    assert history.temperature_rate is None
+    history.append(0, StatusRecord(status=2, temperature=20.0, power=3))
+    assert history.temperature_rate is None
+    history.append(1800, StatusRecord(status=7, temperature=22.5, power=3))
+    assert history.temperature_rate == pytest.approx(5.0)
+    history.append(3600, StatusRecord(status=7, temperature=None, power=3))
+    assert history.temperature_rate is None
+
+    stats = history.stats()
+    assert stats["samples"] == 3
+    assert stats["time_in_state"] == {2: 1800, 7: 1800}
+    assert math.isclose(stats["temperature_mean"], 21.25)
+
+
+def test_history_needs_two_slots():
+    with pytest.raises(ValueError):
+        StatusHistory(size=1)
+
+
+def test_out_of_range_status_codes_are_not_kept():
+    history = StatusHistory(size=4)
+    history.append(0, StatusRecord(status=40000, temperature=20.0))
+    history.append(10, StatusRecord(status=-32768, temperature=20.0))
+    history.append(30, StatusRecord(status=10**30, temperature=20.0))
+    history.append(60, StatusRecord(status=7, temperature=20.0))
+    assert history.time_in_state == {40000: 10, -32768: 20}
+    assert len(history) == 4
@@ -0,0 +1,85 @@
+import asyncio
+
+from custom_components.netflame import hub as hub_mod
+
+NetflameHub = hub_mod.NetflameHub
+
+
+def test_create_api_shares_session_and_base_url():
+    session = object()
+    hub = NetflameHub("http://example.test/", session)
+    a = hub.create_api("s1", "p1")
+    b = hub.create_api("s2", "p2")
+    assert a.session is b.session is session
+    assert a.base_url == b.base_url == "http://example.test/"
+    assert (a.username, b.username) == ("s1", "s2")
+    assert a.breaker is b.breaker is hub.breaker
+
+
+def test_register_unregister_reports_empty():
+    hub = NetflameHub("http://example.test/", None)
+    hub.register("s1", "c1")
+    hub.register("s2", "c2")
+    assert hub.unregister("s1") is False
+    assert hub.unregister("s2") is True
+
+
+def test_breaker_transitions_reach_every_stove():
+    class Coordinator:
+        def __init__(self):
+            self.states = []
+
+        def async_breaker_changed(self):
+            self.states.append(hub.breaker.state)
+
+    hub = NetflameHub("http://example.test/", None)
+    a, b = Coordinator(), Coordinator()
+    hub.register("s1", a)
+    hub.register("s2", b)
+    for _ in range(hub.breaker.failure_threshold):
+        hub.breaker.record_failure()
+    hub.breaker.record_success()
+    assert a.states == b.states == ["open", "closed"]
+
+
+def test_refresh_slots_are_staggered_and_bounded():
+    hub = NetflameHub("http://example.test/", None, max_concurrent=2, spacing=0.05)
+    starts = []
+    running = 0
+    peak = 0
+
+    async def refresh():
+        nonlocal running, peak
+        async with hub.refresh_slot():
+            starts.append(asyncio.get_running_loop().time())
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.2)
+            running -= 1
+
+    async def run():
+        await asyncio.gather(*(refresh() for _ in range(4)))
+
+    asyncio.run(run())
+
+    assert peak <= 2
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert all(g >= 0.04 for g in gaps)
+
+
+def test_owned_session_keeps_connections_alive(mock_server):
+    _, base_url = mock_server
+
+    async def run():
+        hub = NetflameHub(base_url, pool_size=2)
+        try:
+            api = hub.create_api("s1", "p1")
+            for _ in range(5):
+                await api.get_status()
+        finally:
+            await hub.async_close()
+        return hub.connections
+
+    connections = asyncio.run(run())
+    assert connections.created == 1
+    assert connections.reused == 4
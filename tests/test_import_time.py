@@ -0,0 +1,50 @@
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Cumulative time allowed for `import custom_components.netflame`, in
+# microseconds. It takes a few milliseconds today; the budget leaves room
+# for slow machines while catching a heavy import creeping back in.
+PACKAGE_BUDGET_US = 50_000
+
+
+def _import_times(module):
+    """Return {module name: cumulative µs} reported by `python -X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _top_level(times):
+    return {name.split(".")[0] for name in times}
+
+
+def test_package_import_defers_clients_and_home_assistant():
+    loaded = _top_level(_import_times("custom_components.netflame"))
+    assert not loaded & {"requests", "aiohttp", "homeassistant", "urllib3"}
+
+
+def test_package_import_within_budget():
+    # Best of three runs to ignore a cold disk cache
+    best = min(_import_times("custom_components.netflame")["custom_components.netflame"] for _ in range(3))
+    assert best < PACKAGE_BUDGET_US
+
+
+def test_async_client_does_not_load_requests():
+    loaded = _top_level(_import_times("custom_components.netflame.api"))
+    assert "aiohttp" in loaded
+    assert "requests" not in loaded
@@ -0,0 +1,34 @@
+import asyncio
+
+from custom_components.netflame import const
+from custom_components.netflame import metrics as metrics_mod
+
+RequestMetrics = metrics_mod.RequestMetrics
+
+
+def test_histogram_buckets_and_percentiles():
+    metrics = RequestMetrics(buckets=(0.1, 0.5, 1.0))
+    for elapsed in (0.05, 0.1, 0.3, 0.4, 0.45, 0.8, 3.0):
+        metrics.observe(const.OP_STATUS, elapsed, 10)
+
+    status = metrics.snapshot()["status"]
+    assert status["latency"]["buckets"] == {"0.1": 2, "0.5": 3, "1.0": 1, "+Inf": 1}
+    assert status["bytes_received"] == 70
+    assert status["latency"]["max"] == 3.0
+    assert metrics.percentile(const.OP_STATUS, 0.5) == 0.5
+    # The overflow bucket reports the slowest request seen
+    assert metrics.percentile(const.OP_STATUS, 1.0) == 3.0
+    assert metrics.percentile(const.OP_ALARMS, 0.5) is None
+
+
+def test_errors_by_type_and_timeouts():
+    metrics = RequestMetrics()
+    metrics.observe_error(const.OP_ALARMS, 10.0, asyncio.TimeoutError())
+    metrics.observe_error(const.OP_ALARMS, 0.01, ConnectionResetError())
+    metrics.observe_error(const.OP_ALARMS, 0.01, ConnectionResetError())
+
+    alarms = metrics.snapshot()["alarms"]
+    assert alarms["requests"] == 3
+    assert alarms["timeouts"] == 1
+    assert alarms["errors"] == {"TimeoutError": 1, "ConnectionResetError": 2}
+    assert metrics.errors == 3
@@ -1,56 +1,11 @@
-import importlib.util
-import importlib
-import os
-import sys
 import threading
-from http.server import HTTPServer
-
-import requests
 import time
-import pytest
-
-HERE = os.path.dirname(__file__)
-PROJECT_ROOT = os.path.dirname(HERE)
-if PROJECT_ROOT not in sys.path:
-    sys.path.insert(0, PROJECT_ROOT)
-
-SCRIPT_PATH = os.path.join(PROJECT_ROOT, "scripts", "mock_netflame_server.py")
-
-
-def _load_mock_module():
-    spec = importlib.util.spec_from_file_location("mock_netflame_server", SCRIPT_PATH)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    return module
-
-
-@pytest.fixture(scope="function")
-def mock_server_module():
-    module = _load_mock_module()
-
-    # Speed up scheduled transitions for tests (20s -> 0.1s) by overriding TRANSITION_DELAY
-    orig_delay = getattr(module, "TRANSITION_DELAY", None)
-    module.TRANSITION_DELAY = 0.1
-
-    server = HTTPServer(("127.0.0.1", 0), module.MockHandler)
-    host, port = server.server_address
-    thread = threading.Thread(target=server.serve_forever, daemon=True)
-    thread.start()
-
-    base_url = f"http://{host}:{port}/"
 
-    yield module, base_url
-
-    # Restore original TRANSITION_DELAY if present
-    if orig_delay is not None:
-        module.TRANSITION_DELAY = orig_delay
-
-    server.shutdown()
-    server.server_close()
+import requests
 
 
-def test_status_temperature_and_power_change(mock_server_module):
-    module, base_url = mock_server_module
+def test_status_temperature_and_power_change(mock_server):
+    module, base_url = mock_server
 
     temps = set()
     powers = set()
@@ -72,8 +27,8 @@ def test_status_temperature_and_power_change(mock_server_module):
     assert any(s in (0, 1) for s in states)
 
 
-def test_onoff_sets_and_toggles_state(mock_server_module):
-    module, base_url = mock_server_module
+def test_onoff_sets_and_toggles_state(mock_server):
+    module, base_url = mock_server
 
     # initial status should be 0
     assert module._STATUS == 0
@@ -121,8 +76,8 @@ def test_onoff_sets_and_toggles_state(mock_server_module):
     assert module._STATUS == 7
 
 
-def test_power_sets_value_and_status_reflects_it(mock_server_module):
-    module, base_url = mock_server_module
+def test_power_sets_value_and_status_reflects_it(mock_server):
+    module, base_url = mock_server
 
     r = requests.post(base_url, data={"idOperacion": "1004", "potencia": "7"}, timeout=1)
     r.raise_for_status()
@@ -135,8 +90,8 @@ def test_power_sets_value_and_status_reflects_it(mock_server_module):
     assert int(kv.get("consigna_potencia", -1)) == 7
 
 
-def test_alarms_return_two_lines(mock_server_module):
-    module, base_url = mock_server_module
+def test_alarms_return_two_lines(mock_server):
+    module, base_url = mock_server
 
     r = requests.post(base_url, data={"idOperacion": "1079"}, timeout=1)
     r.raise_for_status()
@@ -150,11 +105,94 @@ def test_alarms_return_two_lines(mock_server_module):
     assert val == "N"
 
 
-def test_unknown_operation_echoes_back(mock_server_module):
-    module, base_url = mock_server_module
+def test_unknown_operation_echoes_back(mock_server):
+    module, base_url = mock_server
 
     r = requests.post(base_url, data={"idOperacion": "9999", "foo": "bar"}, timeout=1)
     r.raise_for_status()
     text = r.text
     assert "foo=bar" in text
-    assert "idOperacion=9999" in text
\ No newline at end of file
+    assert "idOperacion=9999" in text
+
+def test_error_rate_injects_server_errors(mock_server):
+    module, base_url = mock_server
+
+    module.ERROR_RATE = 1.0
+    r = requests.post(base_url, data={"idOperacion": "1002"}, timeout=1)
+    assert r.status_code == 500
+
+    module.ERROR_RATE = 0.0
+    r = requests.post(base_url, data={"idOperacion": "1002"}, timeout=1)
+    assert r.status_code == 200
+
+
+def test_unchanged_status_answers_not_modified(mock_server):
+    module, base_url = mock_server
+    module.TEMPERATURE_DRIFT = 0
+
+    r = requests.post(base_url, data={"idOperacion": "1002"}, timeout=1)
+    etag = r.headers["ETag"]
+    r = requests.post(base_url, data={"idOperacion": "1002"}, headers={"If-None-Match": etag}, timeout=1)
+    assert r.status_code == 304
+    assert r.content == b""
+
+    module._POWER = 8
+    r = requests.post(base_url, data={"idOperacion": "1002"}, headers={"If-None-Match": etag}, timeout=1)
+    assert r.status_code == 200
+    assert r.headers["ETag"] != etag
+
+    module.ETAGS = False
+    r = requests.post(base_url, data={"idOperacion": "1002"}, headers={"If-None-Match": etag}, timeout=1)
+    assert r.status_code == 200
+    assert "ETag" not in r.headers
+
+
+def _status(base_url, auth):
+    r = requests.post(base_url, data={"idOperacion": "1002"}, auth=auth, timeout=1)
+    r.raise_for_status()
+    return {k: v for k, v in (line.split("=", 1) for line in r.text.splitlines() if "=" in line)}
+
+
+def test_state_is_kept_per_serial(mock_server):
+    module, base_url = mock_server
+
+    requests.post(base_url, data={"idOperacion": "1004", "potencia": "2"}, auth=("a", "p"), timeout=1)
+    requests.post(base_url, data={"idOperacion": "1004", "potencia": "9"}, auth=("b", "p"), timeout=1)
+    requests.post(base_url, data={"idOperacion": "1013", "on_off": "1"}, auth=("a", "p"), timeout=1)
+
+    a = _status(base_url, ("a", "p"))
+    b = _status(base_url, ("b", "p"))
+    assert (a["consigna_potencia"], a["estado"]) == ("2", "2")
+    assert (b["consigna_potencia"], b["estado"]) == ("9", "0")
+    # The default (anonymous) stove is untouched
+    assert module._STATUS == 0 and module._POWER == 5
+
+    time.sleep(0.2)
+    assert _status(base_url, ("a", "p"))["estado"] == "7"
+
+
+def test_transitions_share_one_scheduler_thread(mock_server):
+    module, base_url = mock_server
+
+    before = threading.active_count()
+    for i in range(50):
+        module._schedule_transition(2, 7, device=module.get_device(f"s{i}"))
+    # At most the scheduler thread itself is added, whatever the number of transitions
+    assert threading.active_count() - before <= 1
+
+    # A newer transition supersedes a pending one for the same stove
+    device = module.get_device("s0")
+    module._schedule_transition(8, 0, device=device)
+    time.sleep(0.25)
+    assert device.status == 0
+    assert module.get_device("s1").status == 7
+
+
+def test_slow_body_still_returns_full_response(mock_server):
+    module, base_url = mock_server
+    module.SLOW_BODY = 0.1
+
+    start = time.monotonic()
+    kv = _status(base_url, ("a", "p"))
+    assert time.monotonic() - start >= 0.05
+    assert set(kv) == {"estado", "temperatura", "consigna_potencia"}
@@ -0,0 +1,69 @@
+import math
+
+from custom_components.netflame import parser
+
+
+def test_parse_status_fields_and_crlf():
+    rec = parser.parse_status("estado=7\r\ntemperatura=21.5\r\nconsigna_potencia=3\r\n")
+    assert (rec.status, rec.temperature, rec.power) == (7, 21.5, 3)
+    assert rec.alarms is None
+
+
+def test_parse_status_ignores_unknown_and_last_key_wins():
+    rec = parser.parse_status("foo=bar\nestado=2\nnoequals\n=5\nestado=4\nconsigna_pot=6")
+    assert rec.status == 4
+    assert rec.power == 6
+    assert parser.parse_status("consigna_potencia=4=x").power == 4
+    assert rec.temperature is None
+
+
+def test_parse_status_invalid_values_become_none():
+    rec = parser.parse_status("estado=x\ntemperatura=NaN\nconsigna_pot=\n")
+    assert rec.status is None
+    assert math.isnan(rec.temperature)
+    assert rec.power is None
+
+
+def test_status_record_replace_and_equality():
+    rec = parser.StatusRecord(status=7, temperature=20.0, power=3, alarms="N")
+    other = rec.replace(power=5)
+    assert other.power == 5 and rec.power == 3
+    assert other != rec
+    assert rec == parser.StatusRecord(7, 20.0, 3, "N")
+    assert not hasattr(rec, "__dict__")
+
+
+def test_status_record_diff():
+    rec = parser.StatusRecord(status=7, temperature=20.0, power=3, alarms="N")
+    assert rec.diff(rec.replace()) == frozenset()
+    assert rec.replace(power=4, alarms=None).diff(rec) == {"power", "alarms"}
+    assert rec.diff(None) == parser.ALL_FIELDS == {"status", "temperature", "power", "alarms"}
+
+
+def test_parse_alarms_record():
+    rec = parser.parse_alarms_record("\n  alarma=N \nERROR 12\n0\n")
+    assert (rec.value, rec.ack) == ("N", "0")
+    assert parser.parse_alarms("E5\n0") == "E5"
+    assert parser.parse_alarms("alarma=N\n1\n") is None
+    assert parser.parse_alarms("alarma=N\n") is None
+    assert parser.parse_alarms("") is None
+
+
+def test_status_record_round_trips_through_dict():
+    import json
+
+    record = parser.StatusRecord(status=7, temperature=21.5, power=3, alarms="N")
+    restored = parser.StatusRecord.from_dict(json.loads(json.dumps(record.as_dict())))
+    assert restored == record
+    # Snapshots from other versions may miss or add fields
+    assert parser.StatusRecord.from_dict({"status": 0, "extra": 1}) == parser.StatusRecord(status=0)
+
+
+def test_problems_explain_unclean_bodies():
+    assert parser.status_problem("estado=7\ntemperatura=21.5\nconsigna_potencia=3\n") is None
+    assert parser.status_problem("estado=x\ntemperatura=21.5\n") == "invalid estado 'x'; missing power"
+    assert parser.status_problem("<html>error</html>") == "missing status, temperature, power"
+
+    assert parser.alarms_problem("alarma=N\n0\n") is None
+    assert parser.alarms_problem("alarma=N\n") == "expected an alarm line and an acknowledgement line"
+    assert parser.alarms_problem("alarma=N\n1\n") == "unexpected acknowledgement '1'"
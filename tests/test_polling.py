@@ -0,0 +1,107 @@
+import asyncio
+
+from custom_components.netflame import polling
+
+AdaptivePollPolicy = polling.AdaptivePollPolicy
+
+
+def test_interval_follows_stove_state():
+    policy = AdaptivePollPolicy(fast=10, normal=60, slow=300, baseline=60)
+    for status in (2, 3, 4, 10):
+        assert policy.next_interval(status, now=0) == 10
+    assert policy.next_interval(7, now=0) == 60
+    for status in (0, 8, 11):
+        assert policy.next_interval(status, now=0) == 300
+    # Errors and unknown codes fall back to the baseline interval
+    assert policy.next_interval(-4, now=0) == 60
+    assert policy.next_interval(None, now=0) == 60
+
+
+def test_boost_after_command_expires():
+    policy = AdaptivePollPolicy(fast=10, normal=60, slow=300, boost_duration=120)
+    policy.boost(now=1000)
+    assert policy.next_interval(0, now=1050) == 10
+    assert policy.next_interval(7, now=1119) == 10
+    assert policy.next_interval(0, now=1120) == 300
+
+
+def test_counters_compare_against_fixed_polling():
+    policy = AdaptivePollPolicy(fast=10, normal=60, slow=300, baseline=60)
+    # One slow poll replaces five fixed polls
+    policy.next_interval(0, now=0)
+    policy.next_interval(0, now=0)
+    # Six fast polls replace one fixed poll
+    for _ in range(6):
+        policy.next_interval(2, now=0)
+    stats = policy.stats
+    assert stats["polls"] == 8
+    assert stats["polls_avoided"] == 8
+    assert stats["extra_polls"] == 5
+
+
+def test_status_watch_reads_alarms_on_change_or_when_due():
+    watch = polling.StatusWatch(interval=10, alarms_every=60)
+    assert watch.observe("a", True, now=0) is True
+    assert watch.observe("a", False, now=10) is False
+    assert watch.observe("b", True, now=20) is True
+    assert watch.fingerprint == "b"
+    assert watch.observe("b", False, now=70) is False
+    assert watch.observe("b", False, now=80) is True
+    assert watch.stats == {"watch_polls": 5, "watch_changes": 2}
+
+
+def test_alarm_schedule_reads_on_schedule_and_escalates_on_alerts():
+    schedule = polling.AlarmSchedule(every=300)
+    assert schedule.due(now=0) is True
+    schedule.observe(7, True, now=0)
+    # A steady stove only reads alarms every 300 s
+    for now in range(60, 300, 60):
+        assert schedule.due(now) is False
+        assert schedule.escalate(7) is False
+        schedule.observe(7, False, now)
+    assert schedule.due(now=300) is True
+    schedule.observe(7, True, now=300)
+    # Ordinary transitions wait for the schedule, alerts don't
+    assert schedule.escalate(8) is False
+    schedule.observe(8, False, now=310)
+    assert schedule.escalate(-4) is True
+    schedule.observe(-4, True, now=320)
+    assert schedule.escalate(-4) is False
+    schedule.observe(-4, False, now=330)
+    # Leaving the alert reads the cleared alarms right away
+    assert schedule.escalate(0) is True
+    schedule.observe(0, True, now=340)
+    assert schedule.stats == {"alarm_reads": 4, "alarm_reads_skipped": 6, "alarm_escalations": 2}
+
+
+def test_confirm_state_stops_at_first_accepted_read():
+    reads = iter([{"status": 0}, {"status": 2}, {"status": 7}])
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        return next(reads)
+
+    ok, last = asyncio.run(
+        polling.confirm_state(fetch, lambda d: d["status"] == 2, attempts=5, interval=0)
+    )
+    assert ok is True
+    assert last == {"status": 2}
+    assert calls == 2
+
+
+def test_confirm_state_gives_up_and_returns_last_good_read():
+    reads = iter([{"power": 3}, RuntimeError("boom"), {"power": 4}, RuntimeError("boom")])
+
+    async def fetch():
+        item = next(reads)
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    ok, last = asyncio.run(
+        polling.confirm_state(fetch, lambda d: d["power"] == 9, attempts=4, interval=0)
+    )
+    assert ok is False
+    assert last == {"power": 4}
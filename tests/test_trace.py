@@ -0,0 +1,30 @@
+from custom_components.netflame import trace as trace_mod
+
+
+def test_trace_keeps_only_last_responses():
+    trace = trace_mod.ResponseTrace(size=3)
+    for i in range(5):
+        trace.record("1002", f"estado={i}\n")
+    entries = trace.as_list()
+    assert len(trace) == 3
+    assert [e["body"] for e in entries] == ["estado=2\n", "estado=3\n", "estado=4\n"]
+    assert all(e["operation"] == "1002" for e in entries)
+
+
+def test_trace_keeps_last_exchanges_per_operation():
+    trace = trace_mod.ResponseTrace(size=2)
+    for i in range(3):
+        trace.record("1002", f"estado={i}\n", {"idOperacion": "1002"}, 0.1, 200)
+    trace.record("1079", None, {"idOperacion": "1079"}, 5.0, error=TimeoutError("slow"), attempt=1)
+    trace.record_parse_failure("1002", "garbage", "missing status")
+    trace.record_refresh(0.2)
+    trace.record_refresh(5.1, ValueError("bad"))
+
+    captured = trace.as_dict()
+    assert [e["body"] for e in captured["exchanges"]["status"]] == ["estado=1\n", "estado=2\n"]
+    failed = captured["exchanges"]["alarms"][0]
+    assert failed["error"] == "TimeoutError: slow"
+    assert (failed["attempt"], failed["duration"], failed["status"]) == (1, 5.0, None)
+    assert captured["parse_failures"][0]["operation"] == "status"
+    assert [r["error"] for r in captured["refreshes"]] == [None, "ValueError: bad"]
+    assert len(trace) == 3
@@ -0,0 +1,48 @@
+import base64
+
+from custom_components.netflame import utils
+
+
+def _decode(uri):
+    prefix = "data:image/svg+xml;base64,"
+    assert uri.startswith(prefix)
+    return base64.b64decode(uri[len(prefix):]).decode("utf-8")
+
+
+def test_data_uri_uses_status_color_and_size():
+    svg = _decode(utils.status_svg_data_uri(7, size=32))
+    assert 'fill="#00ff00"' in svg
+    assert 'width="32"' in svg
+    for status in utils.KNOWN_STATUSES:
+        assert f'fill="{utils.get_status_color(status)}"' in _decode(utils.status_svg_data_uri(status))
+
+
+def test_unknown_status_falls_back_to_gray():
+    assert 'fill="#9e9e9e"' in _decode(utils.status_svg_data_uri(None))
+    assert utils.status_svg_data_uri(12345) == utils.status_svg_data_uri(None)
+
+
+def test_data_uris_are_cached_per_color_and_size():
+    utils._color_svg_data_uri.cache_clear()
+    first = utils.status_svg_data_uri(2, size=64)
+    # 3 and 10 share the color bucket of 2
+    assert utils.status_svg_data_uri(3, size=64) is first
+    assert utils.status_svg_data_uri(10, size=64) is first
+    info = utils._color_svg_data_uri.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
+
+def test_icon_urls_resolve_to_the_status_svg():
+    for status in utils.KNOWN_STATUSES + (None, 12345):
+        url = utils.status_icon_url(status, size=32)
+        assert url.startswith(utils.ICON_URL + "/")
+        svg = utils.icon_svg(url.rsplit("/", 1)[1]).decode("utf-8")
+        assert f'fill="{utils._STATUS_COLORS.get(status, utils.FALLBACK_COLOR)}"' in svg
+        assert 'width="32"' in svg
+    assert utils.status_icon_url(-4) == "/api/netflame/icon/v1/-4_64.svg"
+    assert utils.status_icon_url(None) == utils.status_icon_url(12345)
+
+
+def test_icon_svg_rejects_unknown_names():
+    for name in ("7_64.png", "7.svg", "12345_64.svg", "+7_64.svg", "7_4.svg", "7_1024.svg", "7_x.svg", "7_²6.svg", "7_٦٤.svg"):
+        assert utils.icon_svg(name) is None